@@ -10,6 +10,7 @@ from structured_products_pricing.Parameters.Pricer.PricerTree import PricerTree
 from structured_products_pricing.Parameters.Pricer.PricerBS import PricerBS
 from structured_products_pricing.Parameters.Pricer.PricerMC import PricerMC
 from structured_products_pricing.Parameters.Market import Market
+from structured_products_pricing.Utils.PathCache import PathCache
 from datetime import datetime
 
 class PricerClient:
@@ -43,7 +44,8 @@ class PricerClient:
             pricing_date=datetime(2025, 1, 1),
             nb_steps=50,
             nb_draws=100000,
-            seed=1
+            seed=1,
+            path_cache=PathCache()
         )
         print("✅ Pricer ready.\n")
 
@@ -1,4 +1,5 @@
 from structured_products_pricing.Parameters.Option.OptionBase import OptionBase
+from structured_products_pricing.Utils.PathStatistics import PathStatistics
 from datetime import datetime
 import numpy as np
 
@@ -30,4 +31,16 @@ class OptionAsian(OptionBase):
         Returns:
         - np.array. Payoff values.
         """
-        return np.maximum(0, (np.mean(und_price, axis=1) - self.strike) * (1 if self.is_call() else -1))
\ No newline at end of file
+        return np.maximum(0, (np.mean(und_price, axis=1) - self.strike) * (1 if self.is_call() else -1))
+
+    def payoff_from_statistics(self, statistics: PathStatistics) -> np.array:
+        """
+        Computes the payoff of the Asian option from the running statistics of the underlying paths.
+
+        Parameters:
+        - statistics: PathStatistics. Running statistics of the simulated paths.
+
+        Returns:
+        - np.array. Payoff values.
+        """
+        return np.maximum(0, (statistics.average - self.strike) * (1 if self.is_call() else -1))
@@ -1,4 +1,5 @@
 from structured_products_pricing.Parameters.Option.OptionBase import OptionBase
+from structured_products_pricing.Utils.PathStatistics import PathStatistics
 from datetime import datetime
 import numpy as np
 
@@ -117,4 +118,81 @@ class OptionBarrier(OptionBase):
         # Update barrier status
         self.is_barrier_breached(und_price)
         und_price = (und_price[:, -1]) if self.is_american_barrier() else und_price
-        return np.maximum(0, (und_price - self.strike) * (1 if self.is_call() else -1) * np.where(self.is_active(), 1, 0))
\ No newline at end of file
+        return np.maximum(0, (und_price - self.strike) * (1 if self.is_call() else -1) * np.where(self.is_active(), 1, 0))
+
+    def crossing_probability(self, und_price: np.array, vol: float, dt: float) -> np.array:
+        """
+        Computes the probability that each path crossed the barrier, including between the simulated dates.
+
+        Between two dates on the safe side of the barrier, the log-price follows a Brownian bridge which crosses the
+        barrier with probability exp(-2 * ln(S_i / B) * ln(S_i+1 / B) / (vol^2 * dt)).
+
+        Parameters:
+        - und_price: np.array. A 2D array of underlying prices on a regular time grid.
+        - vol: float. Volatility of the underlying.
+        - dt: float. Time between two simulated dates.
+
+        Returns:
+        - np.array. Probability that the barrier was breached along each path.
+        """
+        crossing: np.array = self.interval_crossing_probability(und_price[:, :-1], und_price[:, 1:], vol, dt)
+        return 1 - np.prod(1 - crossing, axis=1)
+
+    def interval_crossing_probability(self, start_price: np.array, end_price: np.array, vol: float,
+                                      dt: float) -> np.array:
+        """
+        Computes the probability that the barrier was crossed between two simulated dates.
+
+        Parameters:
+        - start_price: np.array. Underlying prices at the first date.
+        - end_price: np.array. Underlying prices at the second date.
+        - vol: float. Volatility of the underlying.
+        - dt: float. Time between the two dates.
+
+        Returns:
+        - np.array. Crossing probability of the Brownian bridge, 1 if a date is on the breached side of the barrier.
+        """
+        start_distance: np.array = np.log(start_price / self.barrier_level)
+        end_distance: np.array = np.log(end_price / self.barrier_level)
+        # Dates on the safe side of the barrier
+        if self.is_up():
+            both_safe: np.array = (start_distance < 0) & (end_distance < 0)
+        else:
+            both_safe: np.array = (start_distance > 0) & (end_distance > 0)
+        return np.where(both_safe, np.exp(-2 * start_distance * end_distance / (vol ** 2 * dt)), 1)
+
+    def payoff_from_crossing_probability(self, und_price: np.array, crossing_probability: np.array) -> np.array:
+        """
+        Computes the expected payoff of the Barrier option given the barrier crossing probability of each path.
+
+        Parameters:
+        - und_price: np.array. Underlying prices at maturity.
+        - crossing_probability: np.array. Probability that the barrier was breached along each path.
+
+        Returns:
+        - np.array. Payoff values weighted by the probability that the option is active.
+        """
+        active_probability: np.array = crossing_probability if self.is_in() else 1 - crossing_probability
+        return np.maximum(0, (und_price - self.strike) * (1 if self.is_call() else -1)) * active_probability
+
+    def payoff_from_statistics(self, statistics: PathStatistics) -> np.array:
+        """
+        Computes the payoff of the Barrier option from the running statistics of the underlying paths.
+
+        Parameters:
+        - statistics: PathStatistics. Running statistics of the simulated paths.
+
+        Returns:
+        - np.array. Payoff values.
+        """
+        if statistics.survival is not None:
+            return self.payoff_from_crossing_probability(statistics.terminal, 1 - statistics.survival)
+        # The barrier is breached if the running extremum went beyond it
+        if self.is_american_barrier():
+            breached: np.array = (statistics.running_max > self.barrier_level if self.is_up()
+                                  else statistics.running_min < self.barrier_level)
+        else:
+            breached: np.array = (statistics.terminal > self.barrier_level if self.is_up()
+                                  else statistics.terminal < self.barrier_level)
+        active: np.array = breached if self.is_in() else ~breached
+        return np.maximum(0, (statistics.terminal - self.strike) * (1 if self.is_call() else -1) * np.where(active, 1, 0))
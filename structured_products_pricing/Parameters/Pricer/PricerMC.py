@@ -1,11 +1,21 @@
 from structured_products_pricing.Parameters.Pricer.PricerBase import PricerBase
+from structured_products_pricing.Utils.PathCache import PathCache
 from datetime import datetime
+from typing import Optional
+import numpy as np
 
 class PricerMC(PricerBase):
     """
     Class to handle pricer parameters for Monte Carlo simulations, extending from PricerBase.
     """
-    def __init__(self, pricing_date: datetime, nb_steps: int, nb_draws: int, seed: int):
+    def __init__(self, pricing_date: datetime, nb_steps: int, nb_draws: int, seed: int,
+                 path_cache: Optional[PathCache] = None, chunk_size: Optional[int] = None,
+                 nb_workers: Optional[int] = None, qmc: bool = False, nb_replications: int = 8,
+                 antithetic: bool = False, control_variates: Optional[list] = None,
+                 target_error: Optional[float] = None, error_type: str = "absolute", max_draws: Optional[int] = None,
+                 greeks_method: str = "finite_difference", observation_grid: bool = False,
+                 reuse_buffers: bool = False, dtype: np.dtype = np.float64, barrier_correction: bool = False,
+                 streaming: bool = False, autocall_compaction: bool = False, lsm_backward: bool = False):
         """
         Initializes a Monte Carlo pricer.
 
@@ -14,6 +24,47 @@ class PricerMC(PricerBase):
         - nb_steps: int. Number of time steps in the simulation.
         - nb_draws: int. Number of Monte Carlo paths.
         - seed: int. Random seed for reproducibility (optional).
+        - path_cache: Optional[PathCache]. Cache of simulated paths shared by every product priced with this pricer
+        (only used when a seed is provided).
+        - chunk_size: Optional[int]. If provided, paths are simulated and priced in blocks of chunk_size paths to bound
+        the memory used by the simulation.
+        - nb_workers: Optional[int]. If greater than 1, draws are split across nb_workers processes, each one using an
+        independent random stream spawned from the seed. Antithetic paths and control variates are applied by each
+        worker, and cannot be combined with target_error or qmc.
+        - qmc: bool. If True, paths are built from scrambled Sobol sequences with a Brownian bridge. Cannot be combined
+        with antithetic, control_variates or chunk_size.
+        - nb_replications: int. Number of independent scramblings used to estimate the quasi-Monte Carlo standard error
+        (at least 2, and nb_draws / nb_replications must be a power of two to keep the balance properties of the Sobol
+        sequence).
+        - antithetic: bool. If True, each simulated path is paired with its antithetic path.
+        - control_variates: Optional[list]. ControlVariateBase objects used to reduce the variance of the estimate.
+        - target_error: Optional[float]. If provided, batches of paths (of chunk_size paths, nb_draws by default) are
+        simulated until the standard error of the price falls below target_error.
+        - error_type: str. "absolute" or "relative" (to the price) target standard error.
+        - max_draws: Optional[int]. Maximum number of paths simulated in adaptive mode (100 batches by default).
+        - greeks_method: str. "finite_difference" (re-pricing with bumped markets), "pathwise" (Greeks computed in the
+        same pass as the price with pathwise and likelihood ratio estimators) or "crn" (all bumped markets priced at once
+        on common random numbers).
+        - observation_grid: bool. If True, Asian options and autocall probabilities are simulated with exact increments
+        at their observation dates only instead of on the nb_steps grid.
+        - reuse_buffers: bool. If True, simulated prices are written in buffers kept on the pricer and reused by every
+        pricing (and bump) using this pricer, instead of new arrays. Prices returned by a simulation are then
+        overwritten by the next one.
+        - dtype: np.dtype. Floating point type of the simulated paths and payoffs (np.float32 halves their memory).
+        Means and standard errors are always accumulated in float64.
+        - barrier_correction: bool. If True, continuously monitored barriers are weighted by the Brownian bridge
+        probability of crossing the barrier between the simulated dates, instead of being checked on the dates only.
+        - streaming: bool. If True, American barriers and Asian options are simulated step by step, keeping only the
+        running statistics of the paths needed by their payoffs instead of the whole paths.
+        - autocall_compaction: bool. If True, autocall probabilities are simulated from one observation date to the next,
+        removing the called paths so that only the surviving paths are simulated further.
+        - lsm_backward: bool. If True, American options regenerate the asset prices backward in time with a Brownian
+        bridge during the Longstaff-Schwartz regression, keeping one date in memory instead of the whole paths
+        (deterministic rates and continuous dividends only).
+
+        Raises:
+        - ValueError: If qmc is requested with fewer than 2 replications or nb_draws / nb_replications is not a power
+        of two.
         """
         super().__init__(pricing_date)
         self.pricer_name: str = "MC"
@@ -23,3 +74,29 @@ class PricerMC(PricerBase):
             self.seed = seed
         else:
             self.seed = None
+        self.path_cache: Optional[PathCache] = path_cache
+        self.chunk_size: Optional[int] = chunk_size
+        self.nb_workers: Optional[int] = nb_workers
+        self.qmc: bool = qmc
+        self.nb_replications: int = nb_replications
+        if qmc:
+            # The standard error is estimated from the dispersion of at least two scramblings
+            if nb_replications < 2:
+                raise ValueError("With qmc, nb_replications must be at least 2.")
+            # Each scrambling of the Sobol sequence draws a power of two of points
+            nb_points: int = nb_draws // nb_replications
+            if nb_points * nb_replications != nb_draws or nb_points < 1 or nb_points & (nb_points - 1):
+                raise ValueError("With qmc, nb_draws / nb_replications must be a power of two.")
+        self.antithetic: bool = antithetic
+        self.control_variates: Optional[list] = control_variates
+        self.target_error: Optional[float] = target_error
+        self.error_type: str = error_type.lower()
+        self.max_draws: Optional[int] = max_draws
+        self.greeks_method: str = greeks_method.lower()
+        self.observation_grid: bool = observation_grid
+        self.path_buffers: Optional[dict] = {} if reuse_buffers else None
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.barrier_correction: bool = barrier_correction
+        self.streaming: bool = streaming
+        self.autocall_compaction: bool = autocall_compaction
+        self.lsm_backward: bool = lsm_backward
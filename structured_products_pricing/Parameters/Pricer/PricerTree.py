@@ -5,7 +5,9 @@ class PricerTree(PricerBase):
     """
     Class to handle pricer parameters for tree-based methods, extending from PricerBase.
     """
-    def __init__(self, pricing_date: datetime, nb_steps: int, pruning_mode: str, pruning_limit: float):
+    def __init__(self, pricing_date: datetime, nb_steps: int, pruning_mode: str, pruning_limit: float,
+                 backend: str = "node", low_memory: bool = False, greeks_method: str = "finite_difference",
+                 accelerated: bool = False, mesh_refinement: int = 0):
         """
         Initializes a Tree pricer.
 
@@ -14,6 +16,19 @@ class PricerTree(PricerBase):
         - nb_steps: int. Number of steps in the tree.
         - pruning_mode: str. "True" if pruning is active, otherwise "False".
         - pruning_limit: float. Threshold limit for pruning branches (only used if pruning is active).
+        - backend: str. "node" (tree of linked Node objects) or "array" (each column of the tree stored in arrays, with
+        vectorised backward induction). Both backends build the same tree.
+        - low_memory: bool. If True, the tree is priced with the array backend keeping only the trunc spot and bounds of
+        each column, the columns being rebuilt one at a time during the backward induction, so that memory grows
+        linearly with nb_steps.
+        - greeks_method: str. "finite_difference" (re-pricing with bumped markets) or "lattice" (Delta, Gamma and Theta
+        read from the nodes after the root, Vega and Rho re-priced on the same tree, from a single tree build).
+        - accelerated: bool. If True, the tree is priced with the array backend, the values before maturity being
+        computed with the Black Scholes formula over the last step, and prices are Richardson extrapolated from the tree
+        and a tree with half the steps.
+        - mesh_refinement: int. Levels of refinement L of the fine lattices grafted onto the tree around the strikes (on
+        the last step) and the barriers (on every step), with 2 ** L times finer spacing and 4 ** L sub-steps. If
+        positive, the tree is priced with the array backend.
         """
         super().__init__(pricing_date)
         self.pricer_name: str = "Tree"
@@ -22,4 +37,9 @@ class PricerTree(PricerBase):
         if self.pruning_mode:
             self.pruning_limit: float = pruning_limit
         else:
-            self.pruning_limit: float = -1
\ No newline at end of file
+            self.pruning_limit: float = -1
+        self.backend: str = backend.lower()
+        self.low_memory: bool = low_memory
+        self.greeks_method: str = greeks_method.lower()
+        self.accelerated: bool = accelerated
+        self.mesh_refinement: int = mesh_refinement
\ No newline at end of file
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from typing import Any
+import numpy as np
+
+class ControlVariateBase(ABC):
+    """
+    Abstract base class to handle control variates used by the Monte Carlo pricer.
+
+    A control variate is a discounted quantity simulated on the same paths as the option, whose expected value is
+    known. Subclasses implement both the simulated values and the expected value.
+    """
+    def __init__(self):
+        """
+        Initializes the base attributes of a control variate.
+        """
+        self.control_name: str = None
+
+    @staticmethod
+    def terminal_price(und_price: np.array) -> np.array:
+        """
+        Extracts the terminal asset prices from simulated prices.
+
+        Parameters:
+        - und_price: np.array. Terminal prices (1D array) or entire asset price paths (2D array).
+
+        Returns:
+        - np.array. Asset prices at maturity.
+        """
+        return und_price[:, -1] if und_price.ndim == 2 else und_price
+
+    def check_market(self, engine: Any):
+        """
+        Checks that the closed-form expected value of the control is consistent with the simulated dynamics.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Raises:
+        - ValueError: If rates are not constant or dividends are discrete.
+        """
+        if engine.Market.rate_mode.lower() != "constant" or engine.Market.div_mode.lower() == "discrete":
+            raise ValueError(f"{self.control_name} control variate requires constant rates and continuous dividends.")
+
+    @abstractmethod
+    def simulated_values(self, engine: Any, und_price: np.array, rows: slice) -> np.array:
+        """
+        Abstract method to compute the discounted control on each simulated path.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+        - und_price: np.array. Asset prices simulated for the option payoff (terminal prices or entire paths).
+        - rows: slice. Paths of the rates matrix the simulated prices correspond to.
+
+        Returns:
+        - np.array. Discounted control values.
+        """
+        pass
+
+    @abstractmethod
+    def expected_value(self, engine: Any) -> float:
+        """
+        Abstract method to compute the exact expected value of the discounted control.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Returns:
+        - float. Expected value of the control.
+        """
+        pass
@@ -0,0 +1,59 @@
+from structured_products_pricing.Products.Options.ControlVariate.ControlVariateBase import ControlVariateBase
+from structured_products_pricing.Products.Options.OptionPricerBS import OptionPricerBS
+from structured_products_pricing.Parameters.Option.OptionEuropean import OptionEuropean
+from structured_products_pricing.Parameters.Pricer.PricerBS import PricerBS
+from structured_products_pricing.Parameters.ModelParams import ModelParams
+from typing import Any
+import numpy as np
+
+class ControlVariateEuropean(ControlVariateBase):
+    """
+    Class to use the European option with the same strike and type as control variate, extending from
+    ControlVariateBase. Its expected value is the Black-Scholes price.
+    """
+    def __init__(self):
+        """
+        Initializes a European option control variate.
+        """
+        super().__init__()
+        self.control_name: str = "European"
+
+    def european_option(self, engine: Any) -> OptionEuropean:
+        """
+        Builds the European option used as control.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Returns:
+        - OptionEuropean. European option with the strike, type and maturity of the priced option.
+        """
+        return OptionEuropean(engine.Option.option_type, engine.Option.strike, engine.Option.maturity_date)
+
+    def simulated_values(self, engine: Any, und_price: np.array, rows: slice) -> np.array:
+        """
+        Computes the discounted European payoff on each simulated path.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+        - und_price: np.array. Asset prices simulated for the option payoff (terminal prices or entire paths).
+        - rows: slice. Paths of the rates matrix the simulated prices correspond to.
+
+        Returns:
+        - np.array. Discounted European payoff values.
+        """
+        return self.european_option(engine).payoff(self.terminal_price(und_price)) * engine.df[rows, -2]
+
+    def expected_value(self, engine: Any) -> float:
+        """
+        Computes the Black-Scholes price of the European option.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Returns:
+        - float. Expected value of the control.
+        """
+        self.check_market(engine)
+        model_params = ModelParams(engine.Market, self.european_option(engine), PricerBS(engine.Pricer.pricing_date))
+        return OptionPricerBS(model_params).compute_price()
@@ -0,0 +1,61 @@
+from structured_products_pricing.Products.Options.ControlVariate.ControlVariateBase import ControlVariateBase
+from math import exp, log, sqrt
+from scipy.stats import norm
+from typing import Any
+import numpy as np
+
+class ControlVariateGeometricAsian(ControlVariateBase):
+    """
+    Class to use the geometric Asian option as control variate for arithmetic Asian options, extending from
+    ControlVariateBase. The geometric average of a lognormal path is lognormal, so its price is known in closed form.
+    """
+    def __init__(self):
+        """
+        Initializes a geometric Asian control variate.
+        """
+        super().__init__()
+        self.control_name: str = "Geometric Asian"
+
+    def simulated_values(self, engine: Any, und_price: np.array, rows: slice) -> np.array:
+        """
+        Computes the discounted geometric Asian payoff on each simulated path.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+        - und_price: np.array. Entire asset price paths of shape (nb_paths, nb_steps + 1).
+        - rows: slice. Paths of the rates matrix the simulated prices correspond to.
+
+        Returns:
+        - np.array. Discounted geometric Asian payoff values.
+        """
+        geometric_average: np.array = np.exp(np.mean(np.log(und_price), axis=1))
+        payoff = np.maximum(0, (geometric_average - engine.Option.strike) * (1 if engine.Option.is_call() else -1))
+        return payoff * engine.df[rows, -2]
+
+    def expected_value(self, engine: Any) -> float:
+        """
+        Computes the closed-form price of the geometric Asian option averaging over the simulation grid.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Returns:
+        - float. Expected value of the control.
+        """
+        self.check_market(engine)
+        vol: float = engine.Market.vol
+        nb_steps: int = engine.Pricer.nb_steps
+        # Log of the geometric average is gaussian: mean and variance over the grid t_i = i * dt
+        mean_time: float = engine.dt * nb_steps / 2
+        mean: float = (log(engine.Market.und_price)
+                       + (engine.Market.int_rate - engine.Market.div_rate - 0.5 * vol ** 2) * mean_time)
+        variance: float = vol ** 2 * engine.dt * nb_steps * (2 * nb_steps + 1) / (6 * (nb_steps + 1))
+        # Lognormal expectation of the payoff
+        d2: float = (mean - log(engine.Option.strike)) / sqrt(variance)
+        d1: float = d2 + sqrt(variance)
+        forward: float = exp(mean + 0.5 * variance)
+        if engine.Option.is_call():
+            undiscounted: float = forward * norm.cdf(d1) - engine.Option.strike * norm.cdf(d2)
+        else:
+            undiscounted: float = engine.Option.strike * norm.cdf(-d2) - forward * norm.cdf(-d1)
+        return undiscounted * engine.df[0, -2]
@@ -0,0 +1,42 @@
+from structured_products_pricing.Products.Options.ControlVariate.ControlVariateBase import ControlVariateBase
+from typing import Any
+from math import exp
+import numpy as np
+
+class ControlVariateSpot(ControlVariateBase):
+    """
+    Class to use the discounted terminal spot as control variate, extending from ControlVariateBase.
+    """
+    def __init__(self):
+        """
+        Initializes a terminal spot control variate.
+        """
+        super().__init__()
+        self.control_name: str = "Terminal Spot"
+
+    def simulated_values(self, engine: Any, und_price: np.array, rows: slice) -> np.array:
+        """
+        Computes the discounted terminal spot on each simulated path.
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+        - und_price: np.array. Asset prices simulated for the option payoff (terminal prices or entire paths).
+        - rows: slice. Paths of the rates matrix the simulated prices correspond to.
+
+        Returns:
+        - np.array. Discounted terminal spot values.
+        """
+        return self.terminal_price(und_price) * engine.df[rows, -2]
+
+    def expected_value(self, engine: Any) -> float:
+        """
+        Computes the expected discounted terminal spot (spot net of the dividend yield).
+
+        Parameters:
+        - engine: OptionPricerMC. Monte Carlo pricer using the control.
+
+        Returns:
+        - float. Expected value of the control.
+        """
+        self.check_market(engine)
+        return engine.Market.und_price * exp(-engine.Market.div_rate * engine.Option.time_to_maturity)
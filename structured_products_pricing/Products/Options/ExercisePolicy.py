@@ -0,0 +1,49 @@
+from structured_products_pricing.Utils.RegressionModel import RegressionModel
+import numpy as np
+
+class ExercisePolicy:
+    """
+    Class to store the exercise policy fitted by the Longstaff-Schwartz regression, so that it can be applied to new
+    paths or bumped markets without running the regressions again.
+    """
+    def __init__(self, regression_type: str, regression_degree: int, strike: float):
+        """
+        Initializes an empty ExercisePolicy.
+
+        Parameters:
+        - regression_type: str. Type of basis functions of the regression.
+        - regression_degree: int. Degree of the basis functions of the regression.
+        - strike: float. Strike the underlying prices are divided by before the regression.
+        """
+        self.regression = RegressionModel(regression_type, regression_degree)
+        self.strike: float = strike
+        self.times_to_maturity: list = []
+        self.coefficients: list = []
+
+    def add(self, time_to_maturity: float, coefficients: np.array):
+        """
+        Stores the regression coefficients of an exercise date.
+
+        Parameters:
+        - time_to_maturity: float. Time from the exercise date to the maturity (in years).
+        - coefficients: np.array. Coefficients of the continuation value regression at this date.
+        """
+        self.times_to_maturity.append(time_to_maturity)
+        self.coefficients.append(np.array(coefficients))
+
+    def continuation_value(self, time_to_maturity: float, und_price: np.array) -> np.array:
+        """
+        Computes the continuation value at an exercise date with the regression of the closest fitted date.
+
+        Parameters:
+        - time_to_maturity: float. Time from the exercise date to the maturity (in years).
+        - und_price: np.array. Underlying prices at the exercise date.
+
+        Returns:
+        - np.array. Continuation value of each path, valued at the exercise date.
+        """
+        index: int = int(np.argmin(np.abs(np.array(self.times_to_maturity) - time_to_maturity)))
+        return self.regression.basis(und_price / self.strike) @ self.coefficients[index]
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
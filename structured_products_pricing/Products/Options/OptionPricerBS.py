@@ -45,6 +45,31 @@ class OptionPricerBS(OptionPricerBase):
                            - self.und_price * exp(-self.div * self.time_to_maturity) * norm.cdf(-self.d1)
         return price
 
+    @staticmethod
+    def price_formula(is_call: bool, und_price: np.array, strike: float, int_rate: float, div_rate: float, vol: float,
+                      time_to_maturity: float) -> np.array:
+        """
+        Computes the Black Scholes price of a European option for several underlying prices.
+
+        Parameters:
+        - is_call: bool. True for a call option, False for a put option.
+        - und_price: np.array. Underlying prices.
+        - strike: float. Strike price of the option.
+        - int_rate: float. Risk-free interest rate.
+        - div_rate: float. Continuous dividend yield.
+        - vol: float. Volatility of the underlying asset.
+        - time_to_maturity: float. Time to maturity of the option (in years).
+
+        Returns:
+        - np.array. Option price for each underlying price.
+        """
+        d1: np.array = ((np.log(und_price / strike) + (int_rate - div_rate + vol ** 2 / 2) * time_to_maturity)
+                        / (vol * sqrt(time_to_maturity)))
+        d2: np.array = d1 - vol * sqrt(time_to_maturity)
+        sign: int = 1 if is_call else -1
+        return sign * (und_price * exp(-div_rate * time_to_maturity) * norm.cdf(sign * d1)
+                       - exp(-int_rate * time_to_maturity) * strike * norm.cdf(sign * d2))
+
     def delta(self) -> float:
         """
         Computes the delta of the option using Black Scholes.
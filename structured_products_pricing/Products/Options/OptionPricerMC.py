@@ -2,15 +2,40 @@ from structured_products_pricing.Utils.Brownian import Brownian
 from structured_products_pricing.Parameters.ModelParams import ModelParams
 from structured_products_pricing.Utils.Calendar import Calendar
 from structured_products_pricing.Utils.RegressionModel import RegressionModel
+from structured_products_pricing.Utils.RunningStatistics import RunningStatistics
+from structured_products_pricing.Utils.PathStatistics import PathStatistics
+from structured_products_pricing.Products.Options.ExercisePolicy import ExercisePolicy
 from structured_products_pricing.Products.Options.OptionPricerBase import OptionPricerBase
+from structured_products_pricing.Rate.RateFormat import get_stochastic_rates
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+from copy import copy
 import numpy as np
 
 
+def simulate_worker_statistics(market, option, pricer) -> RunningStatistics:
+    """
+    Simulates the discounted payoff statistics of one worker of a parallel Monte Carlo pricing.
+
+    Parameters:
+    - market: Market. Market data of the option.
+    - option: OptionBase. Option to be priced.
+    - pricer: PricerMC. Pricer holding the share of draws and the random stream of the worker.
+
+    Returns:
+    - RunningStatistics. Statistics of the discounted payoffs simulated by the worker.
+    """
+    return OptionPricerMC(ModelParams(market, option, pricer)).simulate_payoff_statistics()
+
+
 class OptionPricerMC(OptionPricerBase):
     """
     Class to compute option prices using Monte Carlo.
     """
 
+    # Maximum number of prices built at once by the bumped pricing when the pricer has no chunk size
+    BUMPED_BLOCK_SIZE = 2 ** 22
+
     def __init__(self, model_params: ModelParams):
         """
         Initializes MonteCarlo.
@@ -19,9 +44,18 @@ class OptionPricerMC(OptionPricerBase):
         - model_params: ModelParams. Market, Option and Pricer parameters.
         """
         super().__init__(model_params)
+        self.std_error: float = None
+        self.nb_paths_used: int = None
+        # Exercise policy fitted by (or given to) the Longstaff-Schwartz pricing of American options
+        self.exercise_policy: ExercisePolicy = None
+        # Simulated rates are stored in the simulation type, broadcast deterministic rates are left untouched
+        self.dtype: np.dtype = np.dtype(getattr(self.Pricer, "dtype", np.float64))
+        if self.rates_path is not None and self.rates_path.strides[0] != 0:
+            self.rates_path = self.rates_path.astype(self.dtype, copy=False)
+            self.df = self.df.astype(self.dtype, copy=False)
 
     def compute_asset_price(self, brownian_paths: np.array, full_paths: bool = False,
-                            use_incremental_method: bool = False) -> np.array:
+                            use_incremental_method: bool = False, rows: slice = slice(None)) -> np.array:
         """
         Computes asset price using Brownian motions in a vectorial way.
 
@@ -31,46 +65,346 @@ class OptionPricerMC(OptionPricerBase):
         - full_paths: bool. Determines whether the function returns only the final asset prices or the entire
         asset price paths.
         - use_incremental_method: bool. Determines which discretization schemes to use. Useful for dividends.
+        - rows: slice. Paths of the rates matrix the Brownian motions correspond to (all paths by default).
 
         Returns:
         - S_t: np.array. Asset prices as an array.
         """
         vol = self.Market.vol
-        if self.Market.div_mode == "discrete":
+        rates_path: np.array = self.rates_path[rows]
+        # Deterministic rates are broadcast across paths, so their drift is only computed once per step
+        if rates_path.strides[0] == 0:
+            rates_path = rates_path[:1]
+        if self.Market.div_mode.lower() == "discrete":
+            nb_steps: int = brownian_paths.shape[1] - 1
             # Calculate the step on which the dividend occurs
             step_div = int(self.Market.time_to_div / self.dt) + 1
+            # Compute the log-returns of each step, starting from zero
+            S_t: np.array = self.path_buffer("prices", brownian_paths.shape)
+            S_t[:, 0] = 0
+            np.subtract(brownian_paths[:, 1:], brownian_paths[:, :-1], out=S_t[:, 1:])
+            S_t[:, 1:] *= vol
+            drift: np.array = self.path_buffer("drift", (len(rates_path), nb_steps))
+            np.subtract(rates_path[:, :-1], 0.5 * vol ** 2, out=drift)
+            drift *= self.dt
+            S_t[:, 1:] += drift
             # Compute the simulated asset price before the dividend step
-            S_pre_div: np.array = (self.Market.und_price
-                                   * np.exp(np.cumsum((self.rates_path[:, :step_div] - 0.5 * vol ** 2)
-                                                      * self.dt + vol
-                                                      * (brownian_paths[:, 1: step_div]
-                                                         - brownian_paths[:, :step_div - 1]), axis=1)))
-            # Compute the simulated asset price after the dividend step
-            S_post_div: np.array = ((S_pre_div[:, -1][:, np.newaxis] - self.Market.div_discrete)
-                                    * np.exp(np.cumsum((self.rates_path[:, step_div:] - 0.5 * vol ** 2)
-                                                       * self.dt + vol
-                                                       * (brownian_paths[:, step_div:]
-                                                          - brownian_paths[:, step_div - 1: -1]), axis=1)))
-            # Merge the simulated asset price before and after the dividend step
-            S_t = np.hstack((S_pre_div, S_post_div))
+            if not 1 <= step_div <= nb_steps:
+                step_div = nb_steps + 1
+            np.cumsum(S_t[:, :step_div], axis=1, out=S_t[:, :step_div])
+            np.exp(S_t[:, :step_div], out=S_t[:, :step_div])
+            S_t[:, :step_div] *= self.Market.und_price
+            # Compute the simulated asset price after the dividend step, starting from the price net of the dividend
+            if step_div <= nb_steps:
+                np.cumsum(S_t[:, step_div:], axis=1, out=S_t[:, step_div:])
+                np.exp(S_t[:, step_div:], out=S_t[:, step_div:])
+                S_t[:, step_div:] *= (S_t[:, step_div - 1] - self.Market.div_discrete)[:, np.newaxis]
 
         elif use_incremental_method:
-            # Compute the simulated asset price at maturity
-            S_t: np.array = (self.Market.und_price
-                             * np.exp((self.rates_path - self.Market.div_rate - 0.5 * vol ** 2)
-                                      * (self.dt * np.arange(self.Pricer.nb_steps + 1))[np.newaxis, :]
-                                      + vol * brownian_paths))
+            # Compute the simulated asset price along the paths
+            S_t: np.array = self.path_buffer("prices", brownian_paths.shape)
+            np.multiply(brownian_paths, vol, out=S_t)
+            drift: np.array = self.path_buffer("drift", (len(rates_path), brownian_paths.shape[1]))
+            np.subtract(rates_path, self.Market.div_rate + 0.5 * vol ** 2, out=drift)
+            drift *= (self.dt * np.arange(brownian_paths.shape[1]))[np.newaxis, :]
+            S_t += drift
+            np.exp(S_t, out=S_t)
+            S_t *= self.Market.und_price
         else:
-            # Extract the final Brownian motion values
-            final_brownian_values: np.array = brownian_paths[:, -1]
-            # Compute the simulated asset price at maturity
-            S_T: np.array = (self.Market.und_price
-                             * np.exp((self.rates_path[:, -2] - self.Market.div_rate - 0.5 * vol ** 2)
-                                      * self.Option.time_to_maturity + vol * final_brownian_values))
+            # Compute the simulated asset price at maturity from the final Brownian motion values
+            S_T: np.array = self.path_buffer("terminal_prices", (len(brownian_paths),))
+            np.multiply(brownian_paths[:, -1], vol, out=S_T)
+            S_T += (rates_path[:, -2] - self.Market.div_rate - 0.5 * vol ** 2) * self.Option.time_to_maturity
+            np.exp(S_T, out=S_T)
+            S_T *= self.Market.und_price
             return S_T
 
         return S_t if full_paths else S_t[:, -1]
 
+    def path_buffer(self, name: str, shape: tuple) -> np.array:
+        """
+        Returns a buffer to build simulated prices in, reusing the buffers kept on the pricer when it holds some.
+
+        Arrays written in a reused buffer are overwritten by the next simulation, and must be copied to be kept.
+
+        Parameters:
+        - name: str. Name of the buffer.
+        - shape: tuple. Shape of the buffer.
+
+        Returns:
+        - np.array. An uninitialized array of the requested shape.
+        """
+        path_buffers = getattr(self.Pricer, "path_buffers", None)
+        if path_buffers is None:
+            return np.empty(shape, dtype=self.dtype)
+        buffer = path_buffers.get(name)
+        # Allocate a new buffer when the number of paths, steps or the simulation type changes
+        if buffer is None or buffer.shape != shape or buffer.dtype != self.dtype:
+            buffer = path_buffers[name] = np.empty(shape, dtype=self.dtype)
+        return buffer
+
+    def compute_observation_prices(self, brownian_paths: np.array, observation_times: np.array) -> np.array:
+        """
+        Computes asset prices at observation times only, using the exact solution of the diffusion.
+
+        Parameters:
+        - brownian_paths: np.array. A 2D numpy array of shape (nb_draws, len(observation_times)) holding the Brownian
+        motions at the observation times.
+        - observation_times: np.array. Observation times (in years).
+
+        Returns:
+        - S_t: np.array. Asset prices at the observation times.
+        """
+        vol = self.Market.vol
+        # Interpolate the deterministic rates of the time grid at the observation times
+        rates: np.array = np.interp(observation_times, self.dt * np.arange(self.Pricer.nb_steps + 1), self.rates)
+        S_t: np.array = self.path_buffer("prices", brownian_paths.shape)
+        np.multiply(brownian_paths, vol, out=S_t)
+        S_t += ((rates - self.Market.div_rate - 0.5 * vol ** 2) * observation_times)[np.newaxis, :]
+        np.exp(S_t, out=S_t)
+        S_t *= self.Market.und_price
+        return S_t
+
+    def supports_observation_grid(self) -> bool:
+        """
+        Checks whether the market allows to simulate the asset prices at observation dates only.
+
+        Returns:
+        - bool. True if the observation grid is requested, under deterministic rates and continuous dividends.
+        """
+        return (getattr(self.Pricer, "observation_grid", False) and self.Market.rate_mode.lower() != "stochastic rate"
+                and self.Market.div_mode.lower() != "discrete")
+
+    def observation_times(self, frequency: str) -> np.array:
+        """
+        Computes the times of the observation dates of a given frequency, up to the maturity of the option.
+
+        Parameters:
+        - frequency: str. Observation frequency ("monthly", "quarterly", "yearly").
+
+        Returns:
+        - np.array. Observation times (in years) from the pricing date.
+        """
+        calendar = Calendar(self.Pricer.pricing_date, self.Option.maturity_date, frequency)
+        return np.array([(observation - self.Pricer.pricing_date).days / 365
+                         for observation in calendar.observation_dates])
+
+    def asian_observation_times(self) -> np.array:
+        """
+        Computes the averaging times of an Asian option when it is simulated on its observation dates only.
+
+        Returns:
+        - np.array. Averaging times (in years), or None if the option is simulated on the nb_steps grid.
+        """
+        if (self.Option.option_name != "Asian" or not self.supports_observation_grid()
+                or str(self.Option.asianing_frequency).lower() not in Calendar.FREQUENCY_MAPPING):
+            return None
+        return self.observation_times(str(self.Option.asianing_frequency).lower())
+
+    def path_cache_key(self, full_paths: bool, use_incremental_method: bool,
+                       observation_times: np.array = None) -> tuple:
+        """
+        Builds the key identifying a simulated path set in the path cache.
+
+        Parameters:
+        - full_paths: bool. Whether the entire asset price paths are simulated.
+        - use_incremental_method: bool. Which discretization scheme is used.
+        - observation_times: np.array. Observation times the prices are simulated at, if any.
+
+        Returns:
+        - tuple. Market and simulation parameters the simulated paths depend on.
+        """
+        return (self.Market.und_price, self.Market.vol, self.Market.rate_mode.lower(), self.Market.int_rate,
+                self.Market.div_mode.lower(), self.Market.div_rate, self.Market.div_discrete, self.Market.time_to_div,
+                self.Option.time_to_maturity, self.Pricer.nb_steps, self.Pricer.nb_draws, self.Pricer.seed,
+                getattr(self.Pricer, "qmc", False), self.dtype.name, full_paths, use_incremental_method,
+                self.uses_terminal_sampling(full_paths, use_incremental_method),
+                None if observation_times is None else tuple(observation_times))
+
+    def simulate_asset_paths(self, full_paths: bool = False, use_incremental_method: bool = False,
+                             observation_times: np.array = None) -> np.array:
+        """
+        Simulates asset prices, reusing the paths stored in the path cache of the pricer when available.
+
+        Paths are only shared when a seed is provided, so that unseeded pricings keep drawing new paths.
+
+        Parameters:
+        - full_paths: bool. Determines whether the function returns only the final asset prices or the entire
+        asset price paths.
+        - use_incremental_method: bool. Determines which discretization schemes to use. Useful for dividends.
+        - observation_times: np.array. If provided, prices are only simulated at these times (in years), with exact
+        increments between them (see supports_observation_grid).
+
+        Returns:
+        - S_t: np.array. Asset prices as an array.
+        """
+        path_cache = getattr(self.Pricer, "path_cache", None)
+        use_cache: bool = path_cache is not None and self.Pricer.seed is not None
+        if use_cache:
+            key: tuple = self.path_cache_key(full_paths, use_incremental_method, observation_times)
+            cached = path_cache.get(key)
+            if cached is not None:
+                # Restore the rates the cached paths were simulated with
+                S_t, self.rates_path, self.df = cached
+                return S_t
+        # Initialize the Brownian motion class
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps,
+                                                self.Pricer.nb_draws,
+                                                self.Pricer.seed, dtype=self.dtype)
+        # Generate independent Brownian motion paths
+        if observation_times is not None:
+            brownian_paths: np.array = brownian_simulator.MotionObservations(observation_times)
+        elif self.uses_terminal_sampling(full_paths, use_incremental_method):
+            brownian_paths: np.array = brownian_simulator.MotionTerminal()
+        elif getattr(self.Pricer, "qmc", False):
+            brownian_paths: np.array = brownian_simulator.MotionSobol()
+        else:
+            brownian_paths: np.array = brownian_simulator.MotionVector()
+        # Compute the simulated asset price
+        if observation_times is not None:
+            S_t: np.array = self.compute_observation_prices(brownian_paths, observation_times)
+        else:
+            S_t: np.array = self.compute_asset_price(brownian_paths, full_paths=full_paths,
+                                                     use_incremental_method=use_incremental_method)
+        if use_cache:
+            # Keep only the simulated prices alive in the cache, not the array or the buffer they were written in
+            if S_t.base is not None or getattr(self.Pricer, "path_buffers", None) is not None:
+                S_t = S_t.copy()
+            # Shared paths must not be modified by the products pricing off them
+            S_t.flags.writeable = False
+            path_cache.put(key, (S_t, self.rates_path, self.df))
+        return S_t
+
+    def requires_full_paths(self) -> bool:
+        """
+        Checks whether the payoff of the option depends on the whole asset price path.
+
+        Returns:
+        - bool. True for American barriers and Asian options, False otherwise.
+        """
+        return ((self.Option.option_name == "Barrier" and self.Option.barrier_exercise == "American")
+                or self.Option.option_name == "Asian")
+
+    def supports_terminal_sampling(self) -> bool:
+        """
+        Checks whether the payoff of the option only depends on the asset price at maturity under a market whose
+        terminal price can be sampled in one step.
+
+        Returns:
+        - bool. True for non American options with a terminal payoff, under deterministic rates and continuous
+        dividends.
+        """
+        return (not self.requires_full_paths() and self.Option.option_name != "American"
+                and self.Market.rate_mode.lower() != "stochastic rate" and self.Market.div_mode.lower() != "discrete")
+
+    def uses_terminal_sampling(self, full_paths: bool, use_incremental_method: bool) -> bool:
+        """
+        Checks whether the terminal Brownian values are sampled directly instead of the whole Brownian paths.
+
+        Parameters:
+        - full_paths: bool. Whether the entire asset price paths are simulated.
+        - use_incremental_method: bool. Which discretization scheme is used.
+
+        Returns:
+        - bool. True if only the terminal prices are needed and the option supports terminal sampling.
+        """
+        return (not full_paths and not use_incremental_method and not getattr(self.Pricer, "qmc", False)
+                and self.supports_terminal_sampling())
+
+    def uses_barrier_correction(self) -> bool:
+        """
+        Checks whether the barrier crossings between simulated dates are accounted for with a Brownian bridge.
+
+        Returns:
+        - bool. True for American barriers when the pricer requests the barrier correction.
+        """
+        return (getattr(self.Pricer, "barrier_correction", False) and self.Option.option_name == "Barrier"
+                and self.Option.is_american_barrier())
+
+    def evaluate_payoff(self, S_t: np.array) -> np.array:
+        """
+        Evaluates the payoff of the option on simulated prices, applying the barrier correction if requested.
+
+        Parameters:
+        - S_t: np.array. Asset prices simulated for the option payoff (terminal prices or entire paths).
+
+        Returns:
+        - np.array. Payoff of each path.
+        """
+        if self.uses_barrier_correction():
+            crossing_probability: np.array = self.Option.crossing_probability(S_t, self.Market.vol, self.dt)
+            return self.Option.payoff_from_crossing_probability(S_t[:, -1], crossing_probability)
+        return self.Option.payoff(S_t)
+
+    def uses_streaming(self) -> bool:
+        """
+        Checks whether the paths are simulated step by step keeping only their running statistics.
+
+        Returns:
+        - bool. True for path dependent payoffs that can be computed from running statistics, when the pricer
+        requests streaming.
+        """
+        return (getattr(self.Pricer, "streaming", False) and self.requires_full_paths()
+                and hasattr(self.Option, "payoff_from_statistics") and self.asian_observation_times() is None)
+
+    def simulate_path_statistics(self) -> PathStatistics:
+        """
+        Simulates the asset prices step by step and accumulates the running statistics of each path.
+
+        Prices follow the same schemes as compute_asset_price, but only the prices of the current step are kept in
+        memory, so the memory used by the simulation does not depend on the number of steps.
+
+        Returns:
+        - statistics: PathStatistics. Running statistics of the simulated paths.
+        """
+        vol = self.Market.vol
+        nb_steps: int = self.Pricer.nb_steps
+        nb_draws: int = self.Pricer.nb_draws
+        discrete_dividend: bool = self.Market.div_mode.lower() == "discrete"
+        barrier_correction: bool = self.uses_barrier_correction()
+        # Initialize the Brownian motion class
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, nb_steps, nb_draws, self.Pricer.seed,
+                                                dtype=self.dtype)
+        # Calculate the step on which the dividend occurs
+        step_div: int = int(self.Market.time_to_div / self.dt) + 1 if discrete_dividend else 0
+        S_t: np.array = self.path_buffer("step_prices", (nb_draws,))
+        S_t[:] = self.Market.und_price
+        brownian_values: np.array = np.zeros(nb_draws, dtype=self.dtype)
+        if self.Option.option_name == "Barrier":
+            statistics: PathStatistics = PathStatistics(S_t, self.Option.barrier_level, self.Option.is_up())
+        else:
+            statistics: PathStatistics = PathStatistics(S_t)
+        if barrier_correction:
+            S_previous: np.array = self.path_buffer("previous_step_prices", (nb_draws,))
+            survival: np.array = np.ones(nb_draws)
+        # Loop over the time steps
+        for step, increment in enumerate(brownian_simulator.IncrementsByStep(), start=1):
+            if barrier_correction:
+                S_previous[:] = S_t
+            if discrete_dividend:
+                # Grow the previous prices, net of the dividend on the dividend step
+                if step == step_div:
+                    S_t -= self.Market.div_discrete
+                increment *= vol
+                increment += (self.rates_path[:, step - 1] - 0.5 * vol ** 2) * self.dt
+                np.exp(increment, out=increment)
+                S_t *= increment
+            else:
+                # Compute the prices from the Brownian motion values
+                brownian_values += increment
+                np.multiply(brownian_values, vol, out=S_t)
+                S_t += (self.rates_path[:, step] - self.Market.div_rate - 0.5 * vol ** 2) * self.dt * step
+                np.exp(S_t, out=S_t)
+                S_t *= self.Market.und_price
+            # Probability of not crossing the barrier since the previous step
+            if barrier_correction:
+                survival *= 1 - self.Option.interval_crossing_probability(S_previous, S_t, vol, self.dt)
+            statistics.update(S_t, step)
+        if barrier_correction:
+            statistics.survival = survival
+
+        return statistics
+
     def calculate_standard_deviation(self, payoff: np.array) -> float:
         """
         Calculates the standard deviation of the option payoff.
@@ -81,7 +415,7 @@ class OptionPricerMC(OptionPricerBase):
         Returns:
         - std: float. The standard deviation of the payoff, adjusted for the number of draws.
         """
-        std: float = np.std(payoff) / np.sqrt(self.Pricer.nb_draws)
+        std: float = np.std(payoff, dtype=np.float64) / np.sqrt(self.Pricer.nb_draws)
 
         return std
 
@@ -95,120 +429,797 @@ class OptionPricerMC(OptionPricerBase):
         # Recompute time to maturity and time to dividend
         self.Option.time_to_maturity = (self.Option.maturity_date - self.Pricer.pricing_date).days / 365
         self.Market.time_to_div = (self.Market.div_date - self.Pricer.pricing_date).days / 365
-        # Initialize the Brownian motion class
-        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps,
-                                                self.Pricer.nb_draws,
-                                                self.Pricer.seed)
-        # Generate independent Brownian motion paths
-        brownian_paths: np.array = brownian_simulator.MotionVector()
-
+        # Price American options with the Longstaff-Schwartz regression, or with a given exercise policy
+        if self.Option.option_name == "American":
+            if self.exercise_policy is not None:
+                return self.price_with_policy(self.exercise_policy)
+            if getattr(self.Pricer, "lsm_backward", False):
+                return self.price_LS_backward()
+            return self.price_LS()
+        # Split the draws across processes when several workers are requested
+        if getattr(self.Pricer, "nb_workers", None) is not None and self.Pricer.nb_workers > 1:
+            return self.compute_price_parallel()
+        # Simulate batches of paths until the target standard error is reached
+        if getattr(self.Pricer, "target_error", None) is not None:
+            return self.compute_price_adaptive()
+        # Use randomised quasi-Monte Carlo replications when requested
+        if getattr(self.Pricer, "qmc", False):
+            return self.compute_price_qmc()
+        # Simulate the paths block by block when a chunk size or a variance reduction is requested
+        if (getattr(self.Pricer, "chunk_size", None) is not None or getattr(self.Pricer, "antithetic", False)
+                or getattr(self.Pricer, "control_variates", None)):
+            return self.compute_price_chunked()
         # Compute the simulated asset price at maturity
-        if (
-                self.Option.option_name == "Barrier" and self.Option.barrier_exercise == "American") or self.Option.option_name == "Asian":
-            S_T: np.array = self.compute_asset_price(brownian_paths, full_paths=True,
-                                                     use_incremental_method=True)
+        observation_times: np.array = self.asian_observation_times()
+        if observation_times is not None:
+            S_T: np.array = self.simulate_asset_paths(observation_times=observation_times)
+        elif self.uses_streaming():
+            S_T: PathStatistics = self.simulate_path_statistics()
+        elif self.requires_full_paths():
+            S_T: np.array = self.simulate_asset_paths(full_paths=True, use_incremental_method=True)
         else:
-            S_T: np.array = self.compute_asset_price(brownian_paths)
+            S_T: np.array = self.simulate_asset_paths()
         # Compute the average payoff of the option
-        payoff: float = self.Option.payoff(S_T)
-        # Compute the standard deviation
-        std: float = self.calculate_standard_deviation(payoff)
-        # Discount the expected payoff back to present value
-        price: float = np.mean(payoff * self.df[:, -2])
+        payoff: float = self.Option.payoff_from_statistics(S_T) if self.uses_streaming() else self.evaluate_payoff(S_T)
+        # Discount the payoffs back to present value, with a single discount factor for deterministic rates
+        if self.uses_terminal_sampling(False, False):
+            discounted_payoff: np.array = payoff * self.df[0, -2]
+        else:
+            discounted_payoff: np.array = payoff * self.df[:, -2]
+        # Compute the standard deviation of the discounted payoffs, as in the chunked simulation
+        std: float = self.calculate_standard_deviation(discounted_payoff)
+        self.std_error = std
+        self.nb_paths_used = self.Pricer.nb_draws
+        price: float = np.mean(discounted_payoff, dtype=np.float64)
 
         # return np.array((price, std))
         return np.array(price)
 
-    def compute_autocall_probabilities(self, autocall_barrier: float, frequency: str):
+    def compute_price_chunked(self) -> float:
+        """
+        Computes the option price simulating the paths in fixed-size blocks.
+
+        Each block is discounted and folded into running statistics before the next one is simulated, so the peak
+        memory is set by the chunk size of the pricer rather than by the number of draws.
+
+        Returns:
+        - price: np.array. Option price as a float.
+        """
+        statistics: RunningStatistics = self.simulate_payoff_statistics()
+        self.nb_paths_used = self.paths_count(statistics)
+
+        return self.price_from_statistics(statistics)
+
+    def paths_count(self, statistics: RunningStatistics) -> int:
+        """
+        Counts the paths simulated for the accumulated payoff statistics.
+
+        Parameters:
+        - statistics: RunningStatistics. Statistics of the discounted payoffs.
+
+        Returns:
+        - int. Number of simulated paths, each antithetic pair counting for two paths.
+        """
+        return statistics.count * (2 if getattr(self.Pricer, "antithetic", False) else 1)
+
+    def compute_price_with_error(self) -> np.array:
+        """
+        Computes the option price together with the standard error of the Monte Carlo estimate.
+
+        Returns:
+        - np.array. (price, standard error) of the option.
+        """
+        price: float = self.compute_price()
+        return np.array((price, self.std_error))
+
+    def price_from_statistics(self, statistics: RunningStatistics) -> np.array:
+        """
+        Computes the option price and its standard error from the accumulated payoff statistics.
+
+        Parameters:
+        - statistics: RunningStatistics. Statistics of the discounted payoffs, followed by the centred control
+        variates if any.
+
+        Returns:
+        - price: np.array. Option price as a float.
+        """
+        if statistics.is_scalar:
+            price, self.std_error = statistics.mean, statistics.std_error
+        else:
+            price, self.std_error = statistics.control_variate_estimate()
+
+        return np.array(price)
+
+    def discounted_payoff_samples(self, S_T: np.array, rows: slice, expected_values: list) -> np.array:
+        """
+        Computes the discounted payoffs of simulated paths, with the centred control variates of the pricer if any.
+
+        Parameters:
+        - S_T: np.array. Asset prices simulated for the option payoff (terminal prices or entire paths).
+        - rows: slice. Paths of the rates matrix the simulated prices correspond to.
+        - expected_values: list. Expected value of each control variate of the pricer.
+
+        Returns:
+        - np.array. Discounted payoffs (1D array), or a 2D array whose first column holds the discounted payoffs and the
+        other columns the control values minus their expected values.
+        """
+        discounted_payoff: np.array = self.evaluate_payoff(S_T) * self.df[rows, -2]
+        control_variates: list = getattr(self.Pricer, "control_variates", None) or []
+        if not control_variates:
+            return discounted_payoff
+        columns: list = [discounted_payoff]
+        for control, expected_value in zip(control_variates, expected_values):
+            columns.append(control.simulated_values(self, S_T, rows) - expected_value)
+        return np.column_stack(columns)
+
+    def compute_price_qmc(self) -> float:
+        """
+        Computes the option price using randomised quasi-Monte Carlo.
+
+        The draws are split into independent scramblings of a Sobol sequence, each one turned into paths with a
+        Brownian bridge. The dispersion of the replication prices gives the standard error of the estimate.
+
+        Returns:
+        - price: np.array. Option price as a float.
+
+        Raises:
+        - ValueError: If antithetic paths, control variates or chunks are requested, as they are not applied to the
+        Sobol paths.
+        """
+        if (getattr(self.Pricer, "antithetic", False) or getattr(self.Pricer, "control_variates", None)
+                or getattr(self.Pricer, "chunk_size", None)):
+            raise ValueError("Quasi-Monte Carlo cannot be combined with antithetic paths, control variates or chunks.")
+        full_paths: bool = self.requires_full_paths()
+        nb_replications: int = self.Pricer.nb_replications
+        nb_paths: int = self.Pricer.nb_draws // nb_replications
+        # Initialize the Brownian motion class for one replication
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps, nb_paths,
+                                                self.Pricer.seed, dtype=self.dtype)
+        replication_prices: list = []
+        # Loop over the independent scramblings
+        for replication in range(nb_replications):
+            rows: slice = slice(replication * nb_paths, (replication + 1) * nb_paths)
+            brownian_paths: np.array = brownian_simulator.MotionSobol()
+            S_T: np.array = self.compute_asset_price(brownian_paths, full_paths=full_paths,
+                                                     use_incremental_method=full_paths, rows=rows)
+            replication_prices.append(np.mean(self.evaluate_payoff(S_T) * self.df[rows, -2], dtype=np.float64))
+        # Standard error from the dispersion of the replications
+        self.std_error = np.std(replication_prices, ddof=1) / np.sqrt(nb_replications)
+        self.nb_paths_used = nb_paths * nb_replications
+
+        return np.array(np.mean(replication_prices))
+
+    def simulate_payoff_blocks(self, nb_draws: int, chunk_size: int) -> Iterator[np.array]:
+        """
+        Simulates the discounted payoffs block by block.
+
+        Parameters:
+        - nb_draws: int. Total number of paths to simulate.
+        - chunk_size: int. Maximum number of paths in each block.
+
+        Returns:
+        - Iterator[np.array]. Discounted payoff samples of each block (see discounted_payoff_samples), averaged over
+        antithetic pairs if requested.
+
+        When more paths than rates paths are simulated, stochastic rates paths are simulated again so that every block
+        is independent, while deterministic rates paths (identical across paths) are reused.
+        """
+        full_paths: bool = self.requires_full_paths()
+        antithetic: bool = getattr(self.Pricer, "antithetic", False)
+        nb_rate_paths: int = len(self.df)
+        # Expected values of the control variates, computed once for all the blocks
+        expected_values: list = [control.expected_value(self)
+                                 for control in getattr(self.Pricer, "control_variates", None) or []]
+        # Initialize the Brownian motion class
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps, nb_draws,
+                                                self.Pricer.seed, dtype=self.dtype)
+        offset: int = 0
+        # Loop over the blocks of Brownian motion paths
+        terminal: bool = self.uses_terminal_sampling(full_paths, full_paths)
+        for brownian_paths in brownian_simulator.MotionChunks(chunk_size, antithetic=antithetic, terminal=terminal):
+            # Rates paths start over from the first one when they have all been used
+            if offset + len(brownian_paths) > nb_rate_paths:
+                if self.Market.rate_mode.lower() == "stochastic rate":
+                    nb_rate_paths = self.simulate_rate_paths(max(self.Pricer.nb_draws, len(brownian_paths)))
+                offset = 0
+            rows: slice = slice(offset, offset + len(brownian_paths))
+            # Compute the simulated asset price for the block
+            S_T: np.array = self.compute_asset_price(brownian_paths, full_paths=full_paths,
+                                                     use_incremental_method=full_paths, rows=rows)
+            samples: np.array = self.discounted_payoff_samples(S_T, rows, expected_values)
+            # Average each path with its antithetic path, the pairs being the independent samples
+            if antithetic:
+                half: int = len(samples) // 2
+                samples = 0.5 * (samples[:half] + samples[half:])
+            offset += len(brownian_paths)
+            yield samples
+
+    def simulate_rate_paths(self, nb_paths: int) -> int:
+        """
+        Simulates new independent stochastic rates paths and their discount factors, replacing the current ones.
+
+        Parameters:
+        - nb_paths: int. Number of rates paths to simulate.
+
+        Returns:
+        - int. Number of simulated rates paths.
+        """
+        rates_path, df = get_stochastic_rates(self.Market.int_rate, self.Option.time_to_maturity, self.Pricer.nb_steps,
+                                              nb_paths)
+        self.rates_path, self.df = rates_path.astype(self.dtype, copy=False), df.astype(self.dtype, copy=False)
+        return nb_paths
+
+    def simulate_payoff_statistics(self) -> RunningStatistics:
+        """
+        Simulates the discounted payoffs block by block and accumulates their statistics.
+
+        Returns:
+        - statistics: RunningStatistics. Mean and variance of the discounted payoffs.
+        """
+        chunk_size: int = getattr(self.Pricer, "chunk_size", None) or self.Pricer.nb_draws
+        statistics: RunningStatistics = RunningStatistics()
+        # Accumulate the discounted payoffs of each block
+        for samples in self.simulate_payoff_blocks(self.Pricer.nb_draws, chunk_size):
+            statistics.update(samples)
+
+        return statistics
+
+    def compute_price_adaptive(self) -> float:
+        """
+        Computes the option price simulating batches of paths until the standard error reaches the target of the
+        pricer, or until the path budget is exhausted.
+
+        The batch size is the chunk size of the pricer (nb_draws if not provided) and the running standard error is
+        the standard deviation of the discounted payoffs divided by the square root of the number of samples, as in
+        calculate_standard_deviation. The number of simulated paths is stored in nb_paths_used.
+
+        Returns:
+        - price: np.array. Option price as a float.
+        """
+        batch_size: int = getattr(self.Pricer, "chunk_size", None) or self.Pricer.nb_draws
+        max_draws: int = self.Pricer.max_draws or 100 * batch_size
+        statistics: RunningStatistics = RunningStatistics()
+        self.nb_paths_used = 0
+        # Loop over the batches until the target is reached
+        for samples in self.simulate_payoff_blocks(max_draws, batch_size):
+            statistics.update(samples)
+            self.nb_paths_used = self.paths_count(statistics)
+            price: np.array = self.price_from_statistics(statistics)
+            # Absolute or relative standard error of the running estimate
+            error: float = self.std_error
+            if self.Pricer.error_type == "relative":
+                error = self.std_error / abs(price) if price != 0 else np.inf
+            if statistics.count > 1 and error <= self.Pricer.target_error:
+                break
+
+        return price
+
+    def compute_price_parallel(self) -> float:
+        """
+        Computes the option price splitting the draws across a pool of processes.
+
+        Each worker simulates its share of the draws with an independent stream spawned from the seed of the pricer,
+        and the payoff statistics of the workers are merged in order, so the price is reproducible for a given seed
+        and number of workers. Antithetic paths and control variates are applied by each worker.
+
+        Returns:
+        - price: np.array. Option price as a float.
+
+        Raises:
+        - ValueError: If a target error or quasi-Monte Carlo is requested, as they are not split across workers.
+        """
+        if getattr(self.Pricer, "target_error", None) is not None or getattr(self.Pricer, "qmc", False):
+            raise ValueError("Parallel pricing cannot be combined with a target error or quasi-Monte Carlo.")
+        nb_workers: int = self.Pricer.nb_workers
+        # Spawn one independent random stream per worker
+        child_seeds: list = np.random.SeedSequence(self.Pricer.seed).spawn(nb_workers)
+        # Split the draws as evenly as possible across the workers
+        worker_draws: list = [self.Pricer.nb_draws // nb_workers + (i < self.Pricer.nb_draws % nb_workers)
+                              for i in range(nb_workers)]
+        worker_pricers: list = []
+        for nb_draws, child_seed in zip(worker_draws, child_seeds):
+            worker_pricer = copy(self.Pricer)
+            worker_pricer.nb_draws, worker_pricer.seed = nb_draws, child_seed
+            worker_pricer.nb_workers, worker_pricer.path_cache = None, None
+            if getattr(worker_pricer, "path_buffers", None) is not None:
+                worker_pricer.path_buffers = {}
+            worker_pricers.append(worker_pricer)
+        with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+            results = list(executor.map(simulate_worker_statistics, [self.Market] * nb_workers,
+                                        [self.Option] * nb_workers, worker_pricers))
+        # Merge the statistics of the workers in order
+        statistics: RunningStatistics = RunningStatistics()
+        for worker_statistics in results:
+            statistics.merge(worker_statistics)
+        self.nb_paths_used = self.paths_count(statistics)
+
+        return self.price_from_statistics(statistics)
+
+    def supports_single_pass_greeks(self) -> bool:
+        """
+        Checks whether the Greeks of the option can be computed in the same pass as the price.
+
+        Returns:
+        - bool. True for European, Asian, Digital and Barrier options under constant rates and continuous dividends.
+        """
+        return (self.Market.rate_mode.lower() == "constant" and self.Market.div_mode.lower() != "discrete"
+                and self.Option.option_name in ("European", "Asian", "Digital", "Barrier")
+                and self.asian_observation_times() is None and not self.uses_barrier_correction())
+
+    def compute_greeks(self) -> np.array:
+        """
+        Computes the price, Delta, Gamma, Vega and Rho of the option in a single Monte Carlo pass.
+
+        Pathwise derivatives are used for Lipschitz payoffs (European and Asian options), with a likelihood ratio
+        weight on the first step for Gamma. Likelihood ratio weights are used for discontinuous payoffs (Digital and
+        Barrier options). Vega and Rho are expressed for a 1% shift, as in StrategyBase.
+
+        Returns:
+        - np.array. [Price, Delta, Gamma, Vega, Rho]
+
+        Raises:
+        - ValueError: If the option or the market is not supported (see supports_single_pass_greeks).
+        """
+        if not self.supports_single_pass_greeks():
+            raise ValueError("Single pass Greeks require a European, Asian, Digital or Barrier option "
+                             "with constant rates and continuous dividends.")
+        # Recompute time to maturity and time to dividend
+        self.Option.time_to_maturity = (self.Option.maturity_date - self.Pricer.pricing_date).days / 365
+        self.Market.time_to_div = (self.Market.div_date - self.Pricer.pricing_date).days / 365
+        full_paths: bool = self.requires_full_paths()
+        # Greeks are computed in float64 whatever the simulation type
+        S_t: np.array = self.simulate_asset_paths(full_paths=full_paths,
+                                                  use_incremental_method=full_paths).astype(np.float64, copy=False)
+        spot, vol, rate = self.Market.und_price, self.Market.vol, self.Market.int_rate
+        maturity: float = self.dt * self.Pricer.nb_steps if full_paths else self.Option.time_to_maturity
+        times: np.array = self.dt * np.arange(self.Pricer.nb_steps + 1) if full_paths else np.array([0, maturity])
+        paths: np.array = S_t if full_paths else np.column_stack((np.full(len(S_t), spot), S_t))
+        # Recover the Brownian motion driving each path
+        brownian_paths: np.array = (np.log(paths / spot) - (rate - self.Market.div_rate - 0.5 * vol ** 2) * times) / vol
+        discount: np.array = self.df[:len(S_t), -2]
+        payoff: np.array = self.Option.payoff(S_t) * discount
+
+        if self.Option.option_name in ("European", "Asian"):
+            # Pathwise derivatives of the underlying quantity of the payoff (terminal price or average price)
+            if self.Option.option_name == "Asian":
+                underlying: np.array = np.mean(paths, axis=1)
+                d_vol: np.array = np.mean(paths * (brownian_paths - vol * times), axis=1)
+                d_rate: np.array = np.mean(paths * times, axis=1)
+            else:
+                underlying: np.array = paths[:, -1]
+                d_vol: np.array = paths[:, -1] * (brownian_paths[:, -1] - vol * maturity)
+                d_rate: np.array = paths[:, -1] * maturity
+            sign: int = 1 if self.Option.is_call() else -1
+            d_payoff: np.array = sign * (sign * (underlying - self.Option.strike) > 0) * discount
+            # Likelihood ratio score of the spot, carried by the first step
+            score_spot: np.array = brownian_paths[:, 1] / (spot * vol * times[1])
+            delta: np.array = d_payoff * underlying / spot
+            gamma: np.array = delta * (score_spot - 1 / spot)
+            vega: np.array = d_payoff * d_vol
+            rho: np.array = d_payoff * d_rate - maturity * payoff
+        else:
+            # Likelihood ratio weights of the spot (first step), the volatility and the rate (all steps)
+            steps: np.array = np.diff(times)
+            normal_draws: np.array = np.diff(brownian_paths, axis=1) / np.sqrt(steps)
+            first_draw: np.array = normal_draws[:, 0]
+            delta: np.array = payoff * first_draw / (spot * vol * np.sqrt(steps[0]))
+            gamma: np.array = payoff * ((first_draw ** 2 - 1) / (spot ** 2 * vol ** 2 * steps[0])
+                                        - first_draw / (spot ** 2 * vol * np.sqrt(steps[0])))
+            vega: np.array = payoff * np.sum((normal_draws ** 2 - 1) / vol - normal_draws * np.sqrt(steps), axis=1)
+            rho: np.array = payoff * (brownian_paths[:, -1] / vol - maturity)
+
+        statistics: RunningStatistics = RunningStatistics()
+        statistics.update(np.column_stack((payoff, delta, gamma, vega / 100, rho / 100)))
+        self.std_error = statistics.std_error[0]
+        self.nb_paths_used = len(S_t)
+
+        return statistics.mean
+
+    def supports_bumped_pricing(self) -> bool:
+        """
+        Checks whether the option can be priced on bumped markets with common random numbers.
+
+        Returns:
+        - bool. True for non American options under constant rates and continuous dividends.
+        """
+        return (self.Market.rate_mode.lower() == "constant" and self.Market.div_mode.lower() != "discrete"
+                and self.Option.option_name != "American" and self.asian_observation_times() is None
+                and not self.uses_barrier_correction())
+
+    def compute_bumped_prices(self, scenarios: np.array) -> np.array:
+        """
+        Computes the option price on several bumped markets using the same normal draws for every scenario.
+
+        The paths of all scenarios are built from the same normal draws as one stacked tensor of shape
+        (nb_scenarios, nb_paths, nb_points) written into a single buffer, before the payoff is evaluated on all of them
+        at once. Paths are processed in blocks of chunk_size paths (or of at most BUMPED_BLOCK_SIZE prices if the
+        pricer has no chunk size), the draws of each block being drawn from one generator, so that only one block of
+        draws and paths is in memory at once.
+
+        Parameters:
+        - scenarios: np.array. A 2D array of shape (nb_scenarios, 4) whose rows are (spot, volatility, interest rate,
+        shift of the pricing date in days).
+
+        Returns:
+        - np.array. Option price for each scenario.
+
+        Raises:
+        - ValueError: If the option or the market is not supported (see supports_bumped_pricing).
+        """
+        if not self.supports_bumped_pricing():
+            raise ValueError("Bumped pricing requires a non American option with constant rates and continuous dividends.")
+        scenarios = np.asarray(scenarios, dtype=float)
+        spot, vol, rate, day_shift = scenarios.T
+        nb_steps: int = self.Pricer.nb_steps
+        full_paths: bool = self.requires_full_paths()
+        # Time to maturity and time grid of each scenario
+        maturity: np.array = ((self.Option.maturity_date - self.Pricer.pricing_date).days - day_shift) / 365
+        steps: np.array = np.arange(nb_steps + 1) if full_paths else np.array([nb_steps])
+        times: np.array = (maturity / nb_steps)[:, np.newaxis] * steps[np.newaxis, :]
+        drift: np.array = (rate - self.Market.div_rate - 0.5 * vol ** 2)[:, np.newaxis] * times
+        diffusion: np.array = vol * np.sqrt(maturity / nb_steps)
+        nb_draws: int = self.Pricer.nb_draws
+        chunk_size: int = (getattr(self.Pricer, "chunk_size", None)
+                           or max(1, self.BUMPED_BLOCK_SIZE // (len(scenarios) * len(steps))))
+        # Initialize the Brownian motion class, the draws of the blocks being drawn one after the other
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, nb_steps, nb_draws, self.Pricer.seed)
+        payoff_sums: np.array = np.zeros(len(scenarios))
+        buffer: np.array = np.empty((len(scenarios), min(chunk_size, nb_draws), len(steps)))
+        # Loop over the blocks of paths
+        for start in range(0, nb_draws, chunk_size):
+            block: np.array = brownian_simulator.NormalDraws(min(chunk_size, nb_draws - start))
+            # Standard Brownian motion shared by all the scenarios
+            cumulative: np.array = np.zeros((len(block), nb_steps + 1))
+            np.cumsum(block, axis=1, out=cumulative[:, 1:])
+            cumulative = cumulative[:, steps]
+            paths: np.array = buffer[:, :len(block)]
+            # Build the asset paths of every scenario in place
+            np.multiply(cumulative[np.newaxis, :, :], diffusion[:, np.newaxis, np.newaxis], out=paths)
+            paths += drift[:, np.newaxis, :]
+            np.exp(paths, out=paths)
+            paths *= spot[:, np.newaxis, np.newaxis]
+            # Evaluate the payoff on all the scenarios at once
+            stacked_paths: np.array = paths.reshape(-1, len(steps)) if full_paths else paths.reshape(-1)
+            payoff: np.array = np.asarray(self.Option.payoff(stacked_paths)).reshape(len(scenarios), len(block))
+            payoff_sums += payoff.sum(axis=1)
+
+        return payoff_sums / nb_draws * np.exp(-rate * maturity)
+
+    def compute_autocall_probabilities(self, autocall_barrier: float, frequency: str, coupon_barrier: float = None):
         """
         Computes the probabilities of an autocall event at each observation date based on Monte Carlo simulations.
 
         Parameters:
         - autocall_barrier: float. The barrier level triggering an autocall.
         - frequency: str. Observation frequency ("monthly", "quarterly", etc.).
+        - coupon_barrier: float. If provided, the number of observation dates above this level up to the redemption
+        is counted for each path.
 
         Returns:
         - dict. Dictionary containing:
             - "observation_dates": List of observation dates.
             - "autocall_prob": List of autocall probabilities at each observation.
             - "duration": Expected duration of the product (in years).
+            - "redemption_times": Redemption time of each path (in years).
+            - "coupon_counts": Number of coupons of each path (None if no coupon barrier is provided).
         """
-        # Initialize the Brownian motion class
-        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps,
-                                                self.Pricer.nb_draws,
-                                                self.Pricer.seed)
-        # Generate independent Brownian motion paths
-        brownian_paths: np.array = brownian_simulator.MotionVector()
-        # Compute the simulated asset price at maturity
-        S_t: np.array = self.compute_asset_price(brownian_paths, full_paths=True,
-                                                 use_incremental_method=True)
         # Set up calendar and observations
         calendar = Calendar(self.Pricer.pricing_date, self.Option.maturity_date, frequency)
         time_to_obs = [(observation - self.Pricer.pricing_date).days / 365 for observation in
                        calendar.observation_dates]
-        # Map each observation time to the corresponding time step index
-        obs_steps = [int(observation / self.dt) + 1 for observation in time_to_obs]
-        obs_steps[-1] = self.Pricer.nb_steps
-        # Initialize breach tracking: tracks if a path already triggered an autocall
-        already_breached = np.array([False] * len(S_t))
-        autocall_prob = []
-        # Iterate over each observation step
-        for step in obs_steps:
-            prices = S_t[:, step]
-            new_breach = np.logical_and(prices > autocall_barrier, ~already_breached)
-            already_breached[new_breach] = True
-            autocall_prob.append(float(np.sum(new_breach) / len(S_t)))
+        if self.supports_autocall_compaction():
+            # Simulate only the paths that were not called yet from one observation to the next
+            redemption_index, coupon_counts = self.simulate_autocall_redemptions(autocall_barrier,
+                                                                                 np.array(time_to_obs), coupon_barrier)
+        else:
+            if self.supports_observation_grid():
+                # Simulate the asset prices at the observation dates only
+                S_t: np.array = self.simulate_asset_paths(observation_times=np.array(time_to_obs))
+                obs_steps = list(range(len(time_to_obs)))
+            else:
+                # Compute the simulated asset price paths
+                S_t: np.array = self.simulate_asset_paths(full_paths=True, use_incremental_method=True)
+                # Map each observation time to the corresponding time step index
+                obs_steps = [int(observation / self.dt) + 1 for observation in time_to_obs]
+                obs_steps[-1] = self.Pricer.nb_steps
+            redemption_index, coupon_counts = self.autocall_redemptions(S_t[:, obs_steps], autocall_barrier,
+                                                                        coupon_barrier)
+        # Share of the paths redeemed at each observation date
+        autocall_prob = [float(count) for count in
+                         np.bincount(redemption_index, minlength=len(time_to_obs)) / len(redemption_index)]
         # Adjust the final autocall probability to ensure the total sums to 1
-        autocall_prob[-1] = round(1 - sum(autocall_prob), 3)
+        autocall_prob[-1] = round(1 - sum(autocall_prob[:-1]), 3)
         # Compute the expected duration as the weighted average of observation times
         duration = np.dot(time_to_obs, autocall_prob)
 
-        return {"observation_dates": calendar.observation_dates, "autocall_prob": autocall_prob, "duration": duration}
+        return {"observation_dates": calendar.observation_dates, "autocall_prob": autocall_prob, "duration": duration,
+                "redemption_times": np.array(time_to_obs)[redemption_index], "coupon_counts": coupon_counts}
+
+    @staticmethod
+    def autocall_redemptions(observed_prices: np.array, autocall_barrier: float,
+                             coupon_barrier: float = None) -> tuple:
+        """
+        Computes the redemption date and the number of coupons of each path from its prices at the observation dates.
+
+        Parameters:
+        - observed_prices: np.array. A 2D array of the prices of each path at each observation date.
+        - autocall_barrier: float. The barrier level triggering an autocall.
+        - coupon_barrier: float. If provided, level above which a coupon is paid at an observation date.
+
+        Returns:
+        - tuple. Index of the redemption date of each path (the last date if never called), and number of coupons of
+        each path (None if no coupon barrier is provided).
+        """
+        called: np.array = observed_prices > autocall_barrier
+        # Paths that are never called are redeemed at maturity
+        called[:, -1] = True
+        redemption_index: np.array = np.argmax(called, axis=1)
+        coupon_counts: np.array = None
+        if coupon_barrier is not None:
+            alive: np.array = np.arange(observed_prices.shape[1])[np.newaxis, :] <= redemption_index[:, np.newaxis]
+            coupon_counts = np.sum((observed_prices > coupon_barrier) & alive, axis=1)
+        return redemption_index, coupon_counts
+
+    def supports_autocall_compaction(self) -> bool:
+        """
+        Checks whether the autocall probabilities can be simulated on the surviving paths only.
+
+        Returns:
+        - bool. True if compaction is requested, under deterministic rates and continuous dividends.
+        """
+        return (getattr(self.Pricer, "autocall_compaction", False)
+                and self.Market.rate_mode.lower() != "stochastic rate" and self.Market.div_mode.lower() != "discrete")
+
+    def simulate_autocall_redemptions(self, autocall_barrier: float, observation_times: np.array,
+                                      coupon_barrier: float = None) -> tuple:
+        """
+        Simulates the asset prices from one observation date to the next with exact increments, removing the paths as
+        soon as they are called so that only the surviving paths are simulated further.
+
+        Parameters:
+        - autocall_barrier: float. The barrier level triggering an autocall.
+        - observation_times: np.array. Observation times (in years).
+        - coupon_barrier: float. If provided, level above which a coupon is paid at an observation date.
+
+        Returns:
+        - tuple. Index of the redemption date of each path (the last date if never called), and number of coupons of
+        each path (None if no coupon barrier is provided).
+        """
+        vol = self.Market.vol
+        nb_draws: int = self.Pricer.nb_draws
+        # Initialize the Brownian motion class
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps, nb_draws,
+                                                self.Pricer.seed, dtype=self.dtype)
+        # Interpolate the deterministic rates of the time grid at the observation times
+        rates: np.array = np.interp(observation_times, self.dt * np.arange(self.Pricer.nb_steps + 1), self.rates)
+        active_paths: np.array = np.arange(nb_draws)
+        brownian_values: np.array = np.zeros(nb_draws, dtype=self.dtype)
+        redemption_index: np.array = np.full(nb_draws, len(observation_times) - 1)
+        coupon_counts: np.array = np.zeros(nb_draws, dtype=int) if coupon_barrier is not None else None
+        previous_time: float = 0
+        # Loop over the observation dates
+        for index, (time, rate) in enumerate(zip(observation_times, rates)):
+            brownian_values += brownian_simulator.Increments(len(active_paths), time - previous_time)
+            prices: np.array = (self.Market.und_price
+                                * np.exp((rate - self.Market.div_rate - 0.5 * vol ** 2) * time + vol * brownian_values))
+            if coupon_barrier is not None:
+                coupon_counts[active_paths[prices > coupon_barrier]] += 1
+            called: np.array = prices > autocall_barrier
+            redemption_index[active_paths[called]] = index
+            # Remove the called paths from the active set
+            active_paths, brownian_values = active_paths[~called], brownian_values[~called]
+            previous_time = time
+
+        return redemption_index, coupon_counts
 
     def price_LS(self) -> float:
         """
         Computes American option price using Longstaff-Schwartz algorithm.
 
+        Cashflows are kept discounted to the pricing date, and the continuation values are regressed on the moneyness
+        of the in the money paths, whose design matrix is built once per step. The fitted regressions are stored as the
+        exercise policy of the pricer.
+
         Returns:
         - price: np.array. Option price as a float.
         """
-        # Initialize the Brownian motion class
-        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, self.Pricer.nb_steps,
-                                                self.Pricer.nb_draws,
-                                                self.Pricer.seed)
-        # Generate independent Brownian motion paths
-        brownian_paths: np.array = brownian_simulator.MotionVector()
-        # Generate independent Brownian motion paths & Compute the simulated asset price at maturity
-        S_t: np.array = self.compute_asset_price(brownian_paths, use_incremental_method=True,
-                                                 full_paths=True)
+        # Generate independent Brownian motion paths & Compute the simulated asset price paths
+        S_t: np.array = self.simulate_asset_paths(full_paths=True, use_incremental_method=True)
         # Initialize the Regression class
         regression = RegressionModel(self.Option.regression_type, self.Option.regression_degree)
+        self.exercise_policy = ExercisePolicy(self.Option.regression_type, self.Option.regression_degree,
+                                              self.Option.strike)
         # At maturity, the payoff is the same as a European option
-        cashflow = self.Option.payoff(S_t[:, -1])
-        # Loop over the number of time steps
-        for i in reversed(range(2, self.Pricer.nb_steps + 1)):
-            # Discount cashflow from the next period
-            cashflow *= self.df[:, i - 1]
-            # Store asset price for the current period
-            X = S_t[:, i - 1]
-            # Compute the payoff
-            exercise = self.Option.payoff(X)
-            # Keep paths eligible for regression (ITM paths)
-            itm = exercise > 0
-            # Perform regression on eligible paths
-            regression.fit(X[itm], cashflow[itm])
-            # Compute continuation value
-            continuation = regression.predict(X)
-            # Store paths for which exercise decision is optimal
-            ex_idx = itm & (exercise > continuation)
-            # Set paths for which exercise decision is optimal to the payoff value
-            cashflow[ex_idx] = exercise[ex_idx]
-        # Perform discounting of the cashflow matrix
-        cashflow *= self.df[:, 0]
+        cashflow: np.array = self.Option.payoff(S_t[:, -1]) * self.df[:, -2]
+        # Loop backward over the exercise dates
+        for step in reversed(range(1, self.Pricer.nb_steps)):
+            self.update_cashflow_LS(regression, step, S_t[:, step], cashflow)
         # Compute the average discounted value for all paths
-        price = np.mean(cashflow)
+        price = np.mean(cashflow, dtype=np.float64)
         # Compute the standard deviation
-        std = self.calculate_standard_deviation(cashflow)
+        self.std_error = self.calculate_standard_deviation(cashflow)
+        self.nb_paths_used = self.Pricer.nb_draws
 
         # return np.array((price, std))
         return np.array(price)
+
+    def update_cashflow_LS(self, regression: RegressionModel, step: int, X: np.array, cashflow: np.array):
+        """
+        Performs the Longstaff-Schwartz regression of an exercise date and exercises the paths where it is optimal.
+
+        Parameters:
+        - regression: RegressionModel. Regression model of the continuation values.
+        - step: int. Index of the exercise date.
+        - X: np.array. Asset prices at the exercise date.
+        - cashflow: np.array. Cashflows of the paths discounted to the pricing date, updated in place.
+        """
+        # Compute the payoff
+        exercise: np.array = self.Option.payoff(X)
+        # Keep paths eligible for regression (ITM paths)
+        itm: np.array = np.flatnonzero(exercise > 0)
+        if len(itm) == 0:
+            return
+        # Discount factor from the current period to the pricing date
+        discount: np.array = self.df[itm, step - 1]
+        # Perform regression on eligible paths, on the moneyness for a better conditioning
+        X_matrix: np.array = regression.basis(X[itm] / self.Option.strike)
+        # Compute continuation value, valued at the current period
+        coefficients: np.array = regression.solve(X_matrix, cashflow[itm] / discount)
+        continuation: np.array = X_matrix @ coefficients
+        self.exercise_policy.add(self.Option.time_to_maturity - step * self.dt, coefficients)
+        # Set paths for which exercise decision is optimal to the payoff value
+        exercised: np.array = exercise[itm] > continuation
+        cashflow[itm[exercised]] = exercise[itm][exercised] * discount[exercised]
+
+    def price_LS_batch(self, options: list) -> np.array:
+        """
+        Computes the prices of several American options on the underlying using Longstaff-Schwartz algorithm on a
+        single set of simulated paths.
+
+        At each date, the basis of the regression is built once for all the options sharing a regression type and
+        degree (polynomials of the same degree span the same space whatever the scaling of the prices). Options with
+        the same in the money paths share a single least squares problem with one right-hand side per option, the
+        other ones share the basis and only differ by the rows of their normal equations.
+
+        Parameters:
+        - options: list. OptionAmerican objects with the maturity of the option of the pricer.
+
+        Returns:
+        - prices: np.array. Price of each option.
+
+        Raises:
+        - ValueError: If an option is not American or does not share the maturity of the option of the pricer.
+        """
+        for option in options:
+            if option.option_name != "American" or option.maturity_date != self.Option.maturity_date:
+                raise ValueError("Batched Longstaff-Schwartz requires American options sharing the same maturity.")
+        # Generate independent Brownian motion paths & Compute the simulated asset price paths
+        S_t: np.array = self.simulate_asset_paths(full_paths=True, use_incremental_method=True)
+        # At maturity, the payoffs are the same as European options
+        cashflow: np.array = np.column_stack([option.payoff(S_t[:, -1]) for option in options]) * self.df[:, -2:-1]
+        # Group the options by regression basis, then by in the money paths
+        groups: dict = {}
+        for index, option in enumerate(options):
+            basis_key: tuple = (option.regression_type, option.regression_degree)
+            mask_key: tuple = (option.is_call(), option.strike)
+            groups.setdefault(basis_key, {}).setdefault(mask_key, []).append(index)
+        regressions: dict = {basis_key: RegressionModel(*basis_key) for basis_key in groups}
+        # Loop backward over the exercise dates
+        for step in reversed(range(1, self.Pricer.nb_steps)):
+            X: np.array = S_t[:, step]
+            discount: np.array = self.df[:, step - 1]
+            for basis_key, masks in groups.items():
+                # Basis of the regression shared by all the options of the group
+                X_matrix: np.array = regressions[basis_key].basis(X / self.Market.und_price)
+                for indices in masks.values():
+                    # Options with the same in the money paths share the design matrix of their regression
+                    exercise: np.array = options[indices[0]].payoff(X)
+                    itm: np.array = np.flatnonzero(exercise > 0)
+                    if len(itm) == 0:
+                        continue
+                    X_itm: np.array = X_matrix[itm]
+                    continuation: np.array = X_itm @ regressions[basis_key].solve(
+                        X_itm, cashflow[np.ix_(itm, indices)] / discount[itm, np.newaxis])
+                    # Set paths for which exercise decision is optimal to the payoff value
+                    exercised: np.array = exercise[itm, np.newaxis] > continuation
+                    for column, index in enumerate(indices):
+                        rows: np.array = itm[exercised[:, column]]
+                        cashflow[rows, index] = exercise[rows] * discount[rows]
+        # Compute the average discounted value of each option
+        prices: np.array = np.mean(cashflow, axis=0, dtype=np.float64)
+        self.std_error = np.std(cashflow, axis=0, dtype=np.float64) / np.sqrt(self.Pricer.nb_draws)
+        self.nb_paths_used = self.Pricer.nb_draws
+
+        return prices
+
+    def price_LS_backward(self) -> float:
+        """
+        Computes American option price using Longstaff-Schwartz algorithm, regenerating the asset prices backward in
+        time with a Brownian bridge instead of storing the whole paths.
+
+        The Brownian motions are drawn at maturity first, then each date is drawn conditionally on the next one, so that
+        only the prices of the current date are in memory during the backward sweep.
+
+        Returns:
+        - price: np.array. Option price as a float.
+
+        Raises:
+        - ValueError: If the rates are stochastic or the dividends discrete.
+        """
+        if self.Market.rate_mode.lower() == "stochastic rate" or self.Market.div_mode.lower() == "discrete":
+            raise ValueError("Backward Longstaff-Schwartz requires deterministic rates and continuous dividends.")
+        vol = self.Market.vol
+        nb_steps: int = self.Pricer.nb_steps
+        times: np.array = self.dt * np.arange(nb_steps + 1)
+        # Initialize the Brownian motion and Regression classes
+        brownian_simulator: Brownian = Brownian(self.Option.time_to_maturity, nb_steps, self.Pricer.nb_draws,
+                                                self.Pricer.seed, dtype=self.dtype)
+        regression = RegressionModel(self.Option.regression_type, self.Option.regression_degree)
+        self.exercise_policy = ExercisePolicy(self.Option.regression_type, self.Option.regression_degree,
+                                              self.Option.strike)
+        # Brownian motion values and asset prices at maturity
+        brownian_values: np.array = brownian_simulator.Increments(self.Pricer.nb_draws, times[-1])
+        S_t: np.array = self.path_buffer("step_prices", (self.Pricer.nb_draws,))
+        cashflow: np.array = None
+        # Loop backward over the dates
+        for step in reversed(range(1, nb_steps + 1)):
+            if step < nb_steps:
+                # Brownian bridge between zero and the Brownian motion values of the next date
+                brownian_values *= times[step] / times[step + 1]
+                brownian_values += brownian_simulator.Increments(
+                    self.Pricer.nb_draws, times[step] * (times[step + 1] - times[step]) / times[step + 1])
+            # Compute the asset prices of the date
+            np.multiply(brownian_values, vol, out=S_t)
+            S_t += (self.rates[step] - self.Market.div_rate - 0.5 * vol ** 2) * times[step]
+            np.exp(S_t, out=S_t)
+            S_t *= self.Market.und_price
+            if step == nb_steps:
+                # At maturity, the payoff is the same as a European option
+                cashflow = self.Option.payoff(S_t) * self.df[:, -2]
+            else:
+                self.update_cashflow_LS(regression, step, S_t, cashflow)
+        # Compute the average discounted value for all paths
+        price = np.mean(cashflow, dtype=np.float64)
+        self.std_error = self.calculate_standard_deviation(cashflow)
+        self.nb_paths_used = self.Pricer.nb_draws
+
+        return np.array(price)
+
+    def price_with_policy(self, exercise_policy: ExercisePolicy) -> float:
+        """
+        Computes American option price applying a given exercise policy forward along the simulated paths.
+
+        No regression is performed: each path is exercised at the first date where the payoff exceeds the continuation
+        value of the policy. On paths independent from the ones the policy was fitted on, this gives a low biased
+        estimate of the price.
+
+        Parameters:
+        - exercise_policy: ExercisePolicy. Exercise policy fitted by a previous Longstaff-Schwartz pricing.
+
+        Returns:
+        - price: np.array. Option price as a float.
+        """
+        # Generate independent Brownian motion paths & Compute the simulated asset price paths
+        S_t: np.array = self.simulate_asset_paths(full_paths=True, use_incremental_method=True)
+        # Without exercise, the payoff is received at maturity
+        cashflow: np.array = self.Option.payoff(S_t[:, -1]) * self.df[:, -2]
+        alive: np.array = np.arange(len(S_t))
+        # Loop forward over the exercise dates
+        for step in range(1, self.Pricer.nb_steps):
+            X: np.array = S_t[alive, step]
+            exercise: np.array = self.Option.payoff(X)
+            itm: np.array = np.flatnonzero(exercise > 0)
+            if len(itm) == 0:
+                continue
+            continuation: np.array = exercise_policy.continuation_value(self.Option.time_to_maturity - step * self.dt,
+                                                                        X[itm])
+            exercised: np.array = itm[exercise[itm] > continuation]
+            # Exercised paths receive the discounted payoff and leave the set of alive paths
+            cashflow[alive[exercised]] = exercise[exercised] * self.df[alive[exercised], step - 1]
+            alive = np.delete(alive, exercised)
+        # Compute the average discounted value for all paths
+        price = np.mean(cashflow, dtype=np.float64)
+        self.std_error = self.calculate_standard_deviation(cashflow)
+        self.nb_paths_used = self.Pricer.nb_draws
+
+        return np.array(price)
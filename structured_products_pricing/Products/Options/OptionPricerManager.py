@@ -1,6 +1,8 @@
+from structured_products_pricing.Products.Options.OptionPricerTreeArray import OptionPricerTreeArray
 from structured_products_pricing.Products.Options.OptionPricerTree import OptionPricerTree
 from structured_products_pricing.Products.Options.OptionPricerBS import OptionPricerBS
 from structured_products_pricing.Products.Options.OptionPricerMC import OptionPricerMC
+from structured_products_pricing.Products.Options.ExercisePolicy import ExercisePolicy
 from structured_products_pricing.Parameters.Option.OptionBase import OptionBase
 from structured_products_pricing.Parameters.Pricer.PricerBase import PricerBase
 from structured_products_pricing.Parameters.ModelParams import ModelParams
@@ -24,6 +26,11 @@ class OptionPricerManager:
         self.Option: OptionBase = OptionObject
         self.Pricer: PricerBase = PricerObject
         self.Models_Params = ModelParams(MarketObject, OptionObject, PricerObject)
+        self.std_error: float = None
+        self.nb_paths_used: int = None
+        # Exercise policy of American options, reused instead of new regressions while frozen
+        self.exercise_policy: ExercisePolicy = None
+        self.freeze_exercise_policy: bool = False
 
     def compute_price(self) -> float:
         """
@@ -33,25 +40,66 @@ class OptionPricerManager:
         - float. The computed option price.
         """
         if self.Pricer.pricer_name == "MC":
-            return OptionPricerMC(self.Models_Params).compute_price()
+            pricer_mc = OptionPricerMC(self.Models_Params)
+            if self.freeze_exercise_policy:
+                pricer_mc.exercise_policy = self.exercise_policy
+            price = pricer_mc.compute_price()
+            # Keep the diagnostics of the simulation and the fitted exercise policy
+            self.std_error, self.nb_paths_used = pricer_mc.std_error, pricer_mc.nb_paths_used
+            if not self.freeze_exercise_policy:
+                self.exercise_policy = pricer_mc.exercise_policy
+            return price
         elif self.Pricer.pricer_name == "Tree":
+            # Barrier options are only priced by the array backend
+            if (getattr(self.Pricer, "backend", "node") == "array" or getattr(self.Pricer, "low_memory", False)
+                    or getattr(self.Pricer, "accelerated", False) or getattr(self.Pricer, "mesh_refinement", 0) > 0
+                    or self.Option.option_name == "Barrier"):
+                return OptionPricerTreeArray(self.Models_Params).compute_price()
             return OptionPricerTree(self.Models_Params).compute_price()
         elif self.Pricer.pricer_name == "BS":
             return OptionPricerBS(self.Models_Params).compute_price()
 
-    def compute_autocall_probabilities(self, autocall_barrier: float, frequency: str) -> np.array:
+    def compute_tree_prices(self, options: list) -> np.array:
+        """
+        Computes the prices of several options with the maturity of the option of the manager on a single trinomial
+        tree built with the market and pricer of the manager.
+
+        Parameters:
+        - options: list. European, American or Barrier options.
+
+        Returns:
+        - np.array. Price of each option.
+        """
+        if self.Pricer.pricer_name == "Tree":
+            return OptionPricerTreeArray(self.Models_Params).compute_prices(options)
+
+    def compute_price_with_error(self) -> np.array:
+        """
+        Computes the price of the option and the standard error of the estimate if the selected pricer is Monte Carlo.
+
+        Returns:
+        - np.array. (price, standard error) of the option.
+        """
+        if self.Pricer.pricer_name == "MC":
+            price = self.compute_price()
+            return np.array((price, self.std_error))
+
+    def compute_autocall_probabilities(self, autocall_barrier: float, frequency: str,
+                                       coupon_barrier: float = None) -> np.array:
         """
         Computes autocall probabilities if the selected pricer is Monte Carlo.
 
         Parameters:
         - autocall_barrier: float. Barrier level triggering autocall.
         - frequency: str. Observation frequency.
+        - coupon_barrier: float. If provided, coupons above this level are counted for each path.
 
         Returns:
         - np.array. Array of autocall probabilities at each observation date.
         """
         if self.Pricer.pricer_name == "MC":
-            return OptionPricerMC(self.Models_Params).compute_autocall_probabilities(autocall_barrier, frequency)
+            return OptionPricerMC(self.Models_Params).compute_autocall_probabilities(autocall_barrier, frequency,
+                                                                                     coupon_barrier)
 
     def compute_bs_greeks(self) -> np.array:
         """
@@ -61,4 +109,41 @@ class OptionPricerManager:
         - np.array. The computed greeks.
         """
         if self.Pricer.pricer_name == "BS":
-            return OptionPricerBS(self.Models_Params).greeks()
\ No newline at end of file
+            return OptionPricerBS(self.Models_Params).greeks()
+
+    def compute_mc_greeks(self) -> np.array:
+        """
+        Computes the Delta, Gamma, Vega and Rho of the option in the same Monte Carlo pass as its price.
+
+        Returns:
+        - np.array. [Delta, Gamma, Vega, Rho], or None if the option does not support single pass Greeks.
+        """
+        if self.Pricer.pricer_name == "MC":
+            pricer_mc = OptionPricerMC(self.Models_Params)
+            if pricer_mc.supports_single_pass_greeks():
+                return pricer_mc.compute_greeks()[1:]
+
+    def compute_tree_greeks(self) -> np.array:
+        """
+        Computes the Delta, Gamma, Vega, Theta and Rho of the option from a single trinomial tree.
+
+        Returns:
+        - np.array. [Delta, Gamma, Vega, Theta, Rho], or None if the option is neither European, American nor Barrier.
+        """
+        if self.Pricer.pricer_name == "Tree" and self.Option.option_name in ("European", "American", "Barrier"):
+            return OptionPricerTreeArray(self.Models_Params).compute_greeks()[1:]
+
+    def compute_bumped_prices(self, scenarios: np.array) -> np.array:
+        """
+        Computes the price of the option on several bumped markets with common random numbers.
+
+        Parameters:
+        - scenarios: np.array. Rows of (spot, volatility, interest rate, shift of the pricing date in days).
+
+        Returns:
+        - np.array. Option price for each scenario, or None if the option does not support bumped pricing.
+        """
+        if self.Pricer.pricer_name == "MC":
+            pricer_mc = OptionPricerMC(self.Models_Params)
+            if pricer_mc.supports_bumped_pricing():
+                return pricer_mc.compute_bumped_prices(scenarios)
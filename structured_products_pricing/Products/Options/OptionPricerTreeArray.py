@@ -0,0 +1,681 @@
+from structured_products_pricing.Products.Options.OptionPricerBase import OptionPricerBase
+from structured_products_pricing.Products.Options.OptionPricerBS import OptionPricerBS
+from structured_products_pricing.Products.Options.TreeColumn import TreeColumn
+from structured_products_pricing.Parameters.Option.OptionEuropean import OptionEuropean
+from structured_products_pricing.Parameters.ModelParams import ModelParams
+from typing import Optional
+from copy import copy
+from math import exp, sqrt, log
+import numpy as np
+
+class OptionPricerTreeArray(OptionPricerBase):
+    """
+    Class to compute option prices using Trinomial method, each column of the tree being stored in arrays instead of
+    Node objects. The tree is the same as the one of OptionPricerTree (discrete dividend and pruning included).
+    """
+    def __init__(self, model_params: ModelParams):
+        """
+        Initializes Tree.
+
+        Parameters:
+        - model_params: ModelParams. Market, Option and Pricer parameters.
+        """
+        super().__init__(model_params)
+        self.nb_steps: int = self.Pricer.nb_steps
+        self.alpha: float = exp(self.Market.vol * sqrt(3 * self.dt))
+        self.columns: list = []
+        # Options priced on the tree, one column of values per option
+        self.set_options([self.Option])
+        # Black Scholes values on the last step and Richardson extrapolation with half the steps
+        self.smoothing: bool = getattr(self.Pricer, "accelerated", False)
+        self.richardson: bool = getattr(self.Pricer, "accelerated", False)
+        # Levels of refinement of the fine lattices grafted around the strikes and barriers, and their half width in
+        # coarse nodes
+        self.mesh_refinement: int = getattr(self.Pricer, "mesh_refinement", 0)
+        self.band_width: int = 4
+
+    def set_options(self, options: list):
+        """
+        Sets the options priced on the tree. A vanilla European option is added for each knock-in barrier option, its
+        values being taken by the barrier option once the barrier is breached.
+
+        Parameters:
+        - options: list. Options priced on the tree.
+        """
+        self.priced_options: list = options
+        self.options: list = list(options)
+        self.vanilla_index: dict = {}
+        for index, option in enumerate(options):
+            if option.option_name == "Barrier" and option.is_in():
+                self.vanilla_index[index] = len(self.options)
+                self.options.append(OptionEuropean(option.option_type, option.strike, option.maturity_date))
+        self.is_american: np.array = np.array([option.option_name == "American" for option in self.options])
+
+    def are_same_dates(self, d1: float, d2: float) -> bool:
+        """
+        Checks if two dates are the same (with a small margin of error).
+
+        Parameters:
+        - d1: float. First date.
+        - d2: float. Second date.
+
+        Returns:
+        - bool. Determines whether the dates are same.
+        """
+        return abs(d1 - d2) < (1/365)/self.nb_steps/10
+
+    def is_div_next_period(self, layer: int) -> bool:
+        """
+        Checks if the discrete dividend is paid between a layer and the next one.
+
+        Parameters:
+        - layer: int. Index of the column.
+
+        Returns:
+        - bool. True if the dividend is paid in the next window.
+        """
+        return not (self.are_same_dates(layer * self.dt, self.Market.time_to_div)) \
+            and (layer * self.dt) < self.Market.time_to_div \
+            and ((layer + 1) * self.dt > self.Market.time_to_div
+                 or self.are_same_dates((layer + 1) * self.dt, self.Market.time_to_div))
+
+    def closest_levels(self, forward: np.array, trunc_spot: float) -> np.array:
+        """
+        Finds the level of the node of the next column whose interval contains each forward value.
+
+        Parameters:
+        - forward: np.array. Positive forward values.
+        - trunc_spot: float. Asset price of the trunc node of the next column.
+
+        Returns:
+        - levels: np.array. Level of the next middle node of each forward value.
+        """
+        # Intervals bounds are at und_price * (1 + alpha) / (2 * alpha) and und_price * (1 + alpha) / 2
+        levels: np.array = np.ceil(np.log(forward / trunc_spot) / log(self.alpha)
+                                   - log((1 + self.alpha) / 2) / log(self.alpha)).astype(int)
+        # Rounding of the logarithms is corrected with the exact bounds
+        levels += forward >= trunc_spot * self.alpha ** levels * (1 + self.alpha) / 2
+        levels -= forward <= trunc_spot * self.alpha ** levels * (1 + self.alpha) / (2 * self.alpha)
+        return levels
+
+    def forward_values(self, column: TreeColumn, rate_shift: float = 0.0) -> np.array:
+        """
+        Calculates the forward value of each node of a column.
+
+        Parameters:
+        - column: TreeColumn. The current column.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - forward: np.array. Forward value of each node.
+        """
+        forward: np.array = column.spots * exp((self.rates[column.layer] + rate_shift) * self.dt)
+        # Check if the dividend is paid in the next window and adapt the formula
+        if self.is_div_next_period(column.layer):
+            forward = forward - self.Market.div_discrete
+        return forward
+
+    def transition_probabilities(self, column: TreeColumn, forward: np.array, mid_spot: np.array,
+                                 vol_shift: float = 0.0, rate_shift: float = 0.0) -> tuple:
+        """
+        Calculates the probabilities of moving from each node of a column to its next upper, middle and lower nodes.
+
+        Parameters:
+        - column: TreeColumn. The current column.
+        - forward: np.array. Forward value of each node.
+        - mid_spot: np.array. Asset price of the next middle node of each node.
+        - vol_shift: float. Shift added to the volatility.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - tuple. (p_up, p_mid, p_down) arrays.
+        """
+        # Expected Value and Variance calculation
+        variance: np.array = (column.spots ** 2 * exp(2 * (self.rates[column.layer] + rate_shift) * self.dt)
+                              * (exp((self.Market.vol + vol_shift) ** 2 * self.dt) - 1))
+        return self.trinomial_probabilities(forward, mid_spot, variance, self.alpha)
+
+    @staticmethod
+    def trinomial_probabilities(forward: np.array, mid_spot: np.array, variance: np.array, alpha: float) -> tuple:
+        """
+        Calculates the probabilities matching the expected value and variance of the asset price over a step.
+
+        Parameters:
+        - forward: np.array. Forward value of each node.
+        - mid_spot: np.array. Asset price of the next middle node of each node.
+        - variance: np.array. Variance of the asset price of each node over the step.
+        - alpha: float. Ratio between the asset prices of two adjacent nodes.
+
+        Returns:
+        - tuple. (p_up, p_mid, p_down) arrays.
+        """
+        p_down: np.array = ((mid_spot ** (-2) * (variance + forward ** 2)
+                             - 1 - (alpha + 1) * (mid_spot ** (-1) * forward - 1))
+                            / ((1 - alpha) * (alpha ** (-2) - 1)))
+        p_up: np.array = (mid_spot ** (-1) * forward - 1 - (alpha ** (-1) - 1) * p_down) / (alpha - 1)
+        p_mid: np.array = 1 - p_up - p_down
+        return p_up, p_mid, p_down
+
+    @staticmethod
+    def mask_probabilities(column: TreeColumn, p_up: np.array, p_mid: np.array, p_down: np.array):
+        """
+        Sets the probabilities of the pruned nodes (middle node only) and of the nodes not linked to the next column.
+
+        Parameters:
+        - column: TreeColumn. The current column, whose links are set.
+        - p_up: np.array. Probabilities of moving to the next upper node, modified in place.
+        - p_mid: np.array. Probabilities of moving to the next middle node, modified in place.
+        - p_down: np.array. Probabilities of moving to the next lower node, modified in place.
+        """
+        p_up[column.pruned], p_down[column.pruned], p_mid[column.pruned] = 0, 0, 1
+        p_up[~column.connected], p_down[~column.connected], p_mid[~column.connected] = 0, 0, 0
+
+    def link_column(self, column: TreeColumn, p_cum: Optional[np.array] = None,
+                    pruned_edges: Optional[tuple] = None) -> TreeColumn:
+        """
+        Computes the links and transition probabilities of a column and creates the next column.
+
+        Parameters:
+        - column: TreeColumn. The current column, whose links and probabilities are set.
+        - p_cum: Optional[np.array]. Cumulative probability of reaching each node, used to prune the column edges.
+        - pruned_edges: Optional[tuple]. (bottom, top) pruning of the column edges, used instead of p_cum if provided.
+
+        Returns:
+        - TreeColumn. The next column, without links.
+        """
+        layer: int = column.layer
+        levels: np.array = column.levels
+        forward: np.array = self.forward_values(column)
+        trunc_spot: float = forward[column.trunc_index]
+        # Special-case handling : nodes below the trunc with a negative forward are not linked to the next column
+        column.connected = (forward > 0) | (levels >= 0)
+        connected: np.array = column.connected
+        if not self.is_div_next_period(layer):
+            mid_level: np.array = levels.copy()
+        else:
+            mid_level: np.array = np.full(len(column), 0)
+            mid_level[connected] = self.closest_levels(forward[connected], trunc_spot)
+            mid_level[~connected] = mid_level[connected][0]
+            mid_level[column.trunc_index] = 0
+        column.mid_spots = trunc_spot * self.alpha ** mid_level
+        p_up, p_mid, p_down = self.transition_probabilities(column, forward, column.mid_spots)
+        if pruned_edges is None:
+            for level in levels[connected & ((p_down < 0) | (p_up < 0) | (p_mid < 0))]:
+                print(f"Error: Negative probabilities at layer {layer} and level {level}")
+        # Check pruning conditions on the edges of the column, only the middle node is linked if pruned
+        column.pruned = np.full(len(column), False)
+        if pruned_edges is None:
+            column.pruned[-1] = p_cum[-1] * p_up[-1] < self.Pricer.pruning_limit
+            if connected[0]:
+                column.pruned[0] |= p_cum[0] * p_down[0] < self.Pricer.pruning_limit
+        else:
+            column.pruned[0] |= pruned_edges[0]
+            column.pruned[-1] |= pruned_edges[1]
+        self.mask_probabilities(column, p_up, p_mid, p_down)
+        # Next column spans the nodes linked to the current one
+        linked: np.array = connected & ~column.pruned
+        lowest: int = int((mid_level - linked)[connected].min())
+        highest: int = int((mid_level + linked)[connected].max())
+        column.mid_index = mid_level - lowest
+        column.p_up, column.p_mid, column.p_down = p_up, p_mid, p_down
+        return TreeColumn(layer + 1, trunc_spot * self.alpha ** np.arange(lowest, highest + 1), -lowest)
+
+    def next_column(self, column: TreeColumn, p_cum: np.array) -> tuple:
+        """
+        Computes the transition probabilities of a column and builds the next column.
+
+        Parameters:
+        - column: TreeColumn. The current column, whose links and probabilities are set.
+        - p_cum: np.array. Cumulative probability of reaching each node of the current column.
+
+        Returns:
+        - tuple. (next column, cumulative probabilities of its nodes).
+        """
+        next_column: TreeColumn = self.link_column(column, p_cum=p_cum)
+        connected: np.array = column.connected
+        linked: np.array = connected & ~column.pruned
+        # Add cumulated probabilities
+        next_p_cum: np.array = np.zeros(len(next_column))
+        np.add.at(next_p_cum, column.mid_index[connected], p_cum[connected] * column.p_mid[connected])
+        np.add.at(next_p_cum, column.mid_index[linked] + 1, p_cum[linked] * column.p_up[linked])
+        np.add.at(next_p_cum, column.mid_index[linked] - 1, p_cum[linked] * column.p_down[linked])
+        return next_column, next_p_cum
+
+    def create_tree(self):
+        """
+        Creates Tree, column by column from the root.
+        """
+        column = TreeColumn(0, np.array([float(self.Market.und_price)]), 0)
+        p_cum: np.array = np.ones(1)
+        self.columns = [column]
+        for _ in range(self.nb_steps):
+            column, p_cum = self.next_column(column, p_cum)
+            self.columns.append(column)
+
+    def create_layout(self):
+        """
+        Creates the tree column by column from the root, keeping only the trunc spot, bounds and pruned edges of each
+        column, so that the columns can be rebuilt during the backward induction.
+        """
+        column = TreeColumn(0, np.array([float(self.Market.und_price)]), 0)
+        p_cum: np.array = np.ones(1)
+        self.trunc_spots: np.array = np.zeros(self.nb_steps + 1)
+        self.trunc_indexes: np.array = np.zeros(self.nb_steps + 1, dtype=int)
+        self.sizes: np.array = np.zeros(self.nb_steps + 1, dtype=int)
+        self.pruned_edges: np.array = np.full((self.nb_steps, 2), False)
+        for layer in range(self.nb_steps + 1):
+            self.trunc_spots[layer] = column.spots[column.trunc_index]
+            self.trunc_indexes[layer], self.sizes[layer] = column.trunc_index, len(column)
+            if layer < self.nb_steps:
+                next_column, p_cum = self.next_column(column, p_cum)
+                self.pruned_edges[layer] = column.pruned[0], column.pruned[-1]
+                column = next_column
+
+    def layout_column(self, layer: int) -> TreeColumn:
+        """
+        Rebuilds a column of the tree from its layout, with the same links and probabilities as in create_tree.
+
+        Parameters:
+        - layer: int. Index of the column.
+
+        Returns:
+        - column: TreeColumn. The column, linked to the next one if it is not the last column.
+        """
+        levels: np.array = np.arange(self.sizes[layer]) - self.trunc_indexes[layer]
+        column = TreeColumn(layer, self.trunc_spots[layer] * self.alpha ** levels, self.trunc_indexes[layer])
+        if layer < self.nb_steps:
+            self.link_column(column, pruned_edges=tuple(self.pruned_edges[layer]))
+        return column
+
+    def tree_columns(self):
+        """
+        Iterates over the columns of the tree from the last one to the root, rebuilding them from the layout of the tree
+        in low memory mode.
+
+        Returns:
+        - Iterator. Columns of the tree, last one first.
+        """
+        if getattr(self.Pricer, "low_memory", False):
+            return (self.layout_column(layer) for layer in range(self.nb_steps, -1, -1))
+        return reversed(self.columns)
+
+    def payoffs(self, spots: np.array, options: Optional[list] = None) -> np.array:
+        """
+        Computes the payoff of each option priced on the tree, without the barrier conditions.
+
+        Parameters:
+        - spots: np.array. Asset prices of the nodes.
+        - options: Optional[list]. Options whose payoffs are computed, all the options priced on the tree by default.
+
+        Returns:
+        - np.array. Payoffs, one row per node and one column per option.
+        """
+        options = self.options if options is None else options
+        return np.column_stack([np.maximum(0, (spots - option.strike) * (1 if option.is_call() else -1))
+                                if option.option_name == "Barrier" else option.payoff(spots) for option in options])
+
+    def apply_conditions(self, spots: np.array, values: np.array, is_maturity: bool = False,
+                         on_barrier: bool = False) -> np.array:
+        """
+        Applies the early exercise of the american options and the barrier conditions to the values of nodes.
+
+        Barriers checked continuously are applied on every node, barriers checked at maturity on the last column only.
+        A knock-out option is worth 0 beyond its barrier, and a knock-in option takes the value of its vanilla option
+        beyond its barrier (and is worth 0 elsewhere at maturity).
+
+        Parameters:
+        - spots: np.array. Asset prices of the nodes.
+        - values: np.array. Option values of the nodes, one column per option, modified in place.
+        - is_maturity: bool. True if the nodes are at maturity.
+        - on_barrier: bool. If True, nodes lying on a barrier checked continuously are breached (fine lattices have a
+        node on the barrier).
+
+        Returns:
+        - values: np.array. Option values of the nodes.
+        """
+        # Early exercise of the american options
+        if self.is_american.any() and not is_maturity:
+            american_options: list = [option for option, is_american in zip(self.options, self.is_american)
+                                      if is_american]
+            values[:, self.is_american] = np.maximum(values[:, self.is_american],
+                                                     self.payoffs(spots, american_options))
+        for index, option in enumerate(self.priced_options):
+            if option.option_name != "Barrier" or not (is_maturity or option.is_american_barrier()):
+                continue
+            if on_barrier and option.is_american_barrier():
+                breached: np.array = spots >= option.barrier_level if option.is_up() else spots <= option.barrier_level
+            else:
+                breached: np.array = spots > option.barrier_level if option.is_up() else spots < option.barrier_level
+            if option.is_out():
+                values[breached, index] = 0
+            else:
+                values[breached, index] = values[breached, self.vanilla_index[index]]
+                if is_maturity:
+                    values[~breached, index] = 0
+        return values
+
+    def node_values(self, column: TreeColumn, next_values: np.array, probabilities: Optional[tuple] = None,
+                    rate_shift: float = 0.0) -> np.array:
+        """
+        Calculates the option values of each node of a column from the values of the next column.
+
+        Parameters:
+        - column: TreeColumn. The current column.
+        - next_values: np.array. Option values of the nodes of the next column, one column per option.
+        - probabilities: Optional[tuple]. (p_up, p_mid, p_down) used instead of the probabilities of the column.
+        - rate_shift: float. Shift added to the interest rate used for discounting.
+
+        Returns:
+        - np.array. Option values of the nodes of the column, one column per option.
+        """
+        p_up, p_mid, p_down = probabilities if probabilities is not None else (column.p_up, column.p_mid,
+                                                                                column.p_down)
+        # Pruned nodes have no upper and lower nodes (null probabilities), their index is kept in the next column
+        up_index: np.array = np.minimum(column.mid_index + 1, len(next_values) - 1)
+        down_index: np.array = np.maximum(column.mid_index - 1, 0)
+        discounted_value: np.array = next_values[column.mid_index] * p_mid[:, np.newaxis]
+        discounted_value += next_values[up_index] * p_up[:, np.newaxis]
+        discounted_value += next_values[down_index] * p_down[:, np.newaxis]
+        # Discount the value
+        discounted_value *= exp(-(self.rates[column.layer] + rate_shift) * self.dt)
+        return self.apply_conditions(column.spots, discounted_value)
+
+    def smoothed_values(self, column: TreeColumn, values: np.array, vol_shift: float = 0.0,
+                        rate_shift: float = 0.0) -> np.array:
+        """
+        Calculates the option values of the nodes of the column before maturity with the Black Scholes formula over the
+        last step, instead of the expectation on the next column. Barrier options keep their values from the tree.
+
+        Parameters:
+        - column: TreeColumn. The column before the last one.
+        - values: np.array. Option values of the nodes of the column computed from the next column.
+        - vol_shift: float. Shift added to the volatility.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - values: np.array. Option values of the nodes of the column, one column per option.
+        """
+        rate: float = self.rates[column.layer] + rate_shift
+        und_price: np.array = column.spots
+        # A dividend paid during the last step is deducted from the spot
+        if self.is_div_next_period(column.layer):
+            und_price = np.maximum(und_price - self.Market.div_discrete * exp(-rate * self.dt), 1e-12)
+        for index, option in enumerate(self.options):
+            if option.option_name != "Barrier":
+                values[:, index] = OptionPricerBS.price_formula(option.is_call(), und_price, option.strike, rate, 0,
+                                                                self.Market.vol + vol_shift, self.dt)
+        return self.apply_conditions(column.spots, values)
+
+    def refinement_centers(self, layer: int) -> list:
+        """
+        Finds the asset prices around which fine lattices are grafted between a column and the next one: the barriers
+        checked continuously at every step, and the strikes and barriers checked at maturity on the last step.
+
+        Parameters:
+        - layer: int. Index of the column.
+
+        Returns:
+        - list. Sorted asset prices of the centers of the fine lattices.
+        """
+        centers: set = {option.barrier_level for option in self.priced_options
+                        if option.option_name == "Barrier" and option.is_american_barrier()}
+        if layer == self.nb_steps - 1:
+            centers |= {option.barrier_level for option in self.priced_options
+                        if option.option_name == "Barrier" and option.is_european_barrier()}
+            # The strike kink is already smoothed by the Black Scholes last step
+            if not self.smoothing:
+                centers |= {option.strike for option in self.options}
+        return sorted(centers)
+
+    def refined_band(self, column: TreeColumn, next_column: TreeColumn, next_values: np.array, center: float,
+                     band: Optional[tuple] = None, vol_shift: float = 0.0, rate_shift: float = 0.0) -> Optional[tuple]:
+        """
+        Computes the option values around an asset price with a fine lattice grafted between a column and the next one.
+
+        With L levels of refinement, the fine lattice has a spacing of alpha ** (1 / 2 ** L) and 4 ** L sub-steps. Its
+        nodes are center * alpha ** (j / 2 ** L) on every sub-step and every step, so that the barrier (or the strike at
+        maturity) is always a node, the drift being carried by the probabilities. Its values on the next column are the
+        values of the band of the previous step, the payoffs at maturity, or else the values of the next column
+        interpolated in log-spot.
+
+        Parameters:
+        - column: TreeColumn. The current column.
+        - next_column: TreeColumn. The next column.
+        - next_values: np.array. Option values of the nodes of the next column, one column per option.
+        - center: float. Asset price around which the fine lattice is grafted.
+        - band: Optional[tuple]. (fine levels, values) of the fine lattice on the next column, from the previous step.
+        - vol_shift: float. Shift added to the volatility.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - Optional[tuple]. (fine levels, values) of the fine lattice on the column, levels being relative to the center,
+        or None if no fine lattice can be grafted (dividend step or band out of the tree).
+        """
+        if self.is_div_next_period(column.layer):
+            return None
+        ratio: int = 2 ** self.mesh_refinement
+        nb_substeps: int = 4 ** self.mesh_refinement
+        alpha: float = self.alpha ** (1 / ratio)
+        dt: float = self.dt / nb_substeps
+        trunc_spot: float = column.spots[column.trunc_index]
+        # Coarse nodes of the band, the fine lattice on the next column staying inside the next column
+        center_level: int = int(round(log(center / trunc_spot) / log(self.alpha)))
+        lowest: int = max(center_level - self.band_width, column.levels[0], next_column.levels[0] + ratio + 1)
+        highest: int = min(center_level + self.band_width, column.levels[-1], next_column.levels[-1] - ratio - 1)
+        if lowest > highest:
+            return None
+        # Fine levels covering the coarse nodes of the band on the column, widened by one fine node per sub-step
+        offset: float = log(trunc_spot / center) / log(alpha)
+        levels: np.array = np.arange(int(np.floor(ratio * lowest + offset)) - nb_substeps,
+                                     int(np.ceil(ratio * highest + offset)) + nb_substeps + 1)
+        spots: np.array = center * alpha ** levels
+        if next_column.layer == self.nb_steps:
+            values: np.array = self.apply_conditions(spots, self.payoffs(spots), is_maturity=True)
+            # The payoff of a barrier option is discontinuous at the barrier, so the center node takes the mean of the
+            # payoffs on both sides, the barriers checked continuously being breached on it
+            sides: np.array = np.array([np.nextafter(center, 0), np.nextafter(center, np.inf)])
+            values[levels == 0] = self.apply_conditions(sides, self.payoffs(sides), is_maturity=True).mean(axis=0)
+            self.apply_conditions(spots, values, on_barrier=True)
+        else:
+            # Quadratic interpolation in log-spot on the three closest nodes of the next column
+            position: np.array = (np.log(spots / next_column.spots[next_column.trunc_index]) / log(self.alpha)
+                                  + next_column.trunc_index)
+            closest: np.array = np.clip(np.round(position).astype(int), 1, len(next_column) - 2)
+            shift: np.array = (position - closest)[:, np.newaxis]
+            values: np.array = (next_values[closest] + shift * (next_values[closest + 1] - next_values[closest - 1]) / 2
+                                + shift ** 2 * (next_values[closest + 1] - 2 * next_values[closest]
+                                                + next_values[closest - 1]) / 2)
+            if band is not None:
+                values[np.isin(levels, band[0])] = band[1][np.isin(band[0], levels)]
+        # The nodes do not drift, so the probabilities are the same for all the nodes
+        rate: float = self.rates[column.layer] + rate_shift
+        variance: float = exp(2 * rate * dt) * (exp((self.Market.vol + vol_shift) ** 2 * dt) - 1)
+        p_up, p_mid, p_down = self.trinomial_probabilities(exp(rate * dt), 1, variance, alpha)
+        discount: float = exp(-rate * dt)
+        for _ in range(nb_substeps):
+            values = discount * (values[2:] * p_up + values[1:-1] * p_mid + values[:-2] * p_down)
+            levels, spots = levels[1:-1], spots[1:-1]
+            self.apply_conditions(spots, values, on_barrier=True)
+        return levels, values
+
+    def refine_values(self, column: TreeColumn, next_column: TreeColumn, next_values: np.array, values: np.array,
+                      bands: dict, vol_shift: float = 0.0, rate_shift: float = 0.0) -> dict:
+        """
+        Replaces the option values of the nodes of a column around the strikes and barriers by the values computed on
+        fine lattices, interpolated linearly in log-spot between the two closest fine nodes.
+
+        Parameters:
+        - column: TreeColumn. The current column.
+        - next_column: TreeColumn. The next column.
+        - next_values: np.array. Option values of the nodes of the next column, one column per option.
+        - values: np.array. Option values of the nodes of the column, modified in place.
+        - bands: dict. (fine levels, values) of the fine lattices on the next column, by center.
+        - vol_shift: float. Shift added to the volatility.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - refined_bands: dict. (fine levels, values) of the fine lattices on the column, by center.
+        """
+        ratio: int = 2 ** self.mesh_refinement
+        refined_bands: dict = {}
+        for center in self.refinement_centers(column.layer):
+            band: Optional[tuple] = self.refined_band(column, next_column, next_values, center, bands.get(center),
+                                                      vol_shift, rate_shift)
+            if band is None:
+                continue
+            # Position of the nodes of the tree on the fine lattice, the barrier or strike never lying between the two
+            # fine nodes used
+            position: np.array = np.log(column.spots / center) / log(self.alpha) * ratio - band[0][0]
+            inside: np.array = (position >= 0) & (position <= len(band[0]) - 1)
+            lower: np.array = np.minimum(np.floor(position[inside]).astype(int), len(band[0]) - 2)
+            weight: np.array = (position[inside] - lower)[:, np.newaxis]
+            values[inside] = (1 - weight) * band[1][lower] + weight * band[1][lower + 1]
+            refined_bands[center] = band
+        return refined_bands
+
+    def backward_induction(self, vol_shift: float = 0.0, rate_shift: float = 0.0) -> list:
+        """
+        Computes the option values from the last column to the root.
+
+        With shifted parameters, the geometry of the tree is kept and only the probabilities and discount factors are
+        recomputed.
+
+        Parameters:
+        - vol_shift: float. Shift added to the volatility.
+        - rate_shift: float. Shift added to the interest rate.
+
+        Returns:
+        - first_columns: list. (column, option values) of the first three columns of the tree, root first. Values have
+        one column per option.
+        """
+        is_shifted: bool = vol_shift != 0 or rate_shift != 0
+        first_columns: list = []
+        next_values: Optional[np.array] = None
+        bands: dict = {}
+        for column in self.tree_columns():
+            # Add intrinsic value to the last column
+            if next_values is None:
+                values: np.array = self.apply_conditions(column.spots, self.payoffs(column.spots), is_maturity=True)
+            else:
+                probabilities: Optional[tuple] = None
+                if is_shifted:
+                    probabilities = self.transition_probabilities(column, self.forward_values(column, rate_shift),
+                                                                  column.mid_spots, vol_shift, rate_shift)
+                    self.mask_probabilities(column, *probabilities)
+                values: np.array = self.node_values(column, next_values, probabilities, rate_shift)
+                if self.smoothing and column.layer == self.nb_steps - 1:
+                    values = self.smoothed_values(column, values, vol_shift, rate_shift)
+                if self.mesh_refinement > 0:
+                    bands = self.refine_values(column, next_column, next_values, values, bands, vol_shift, rate_shift)
+            next_column, next_values = column, values
+            if not is_shifted:
+                column.values = next_values
+            if column.layer <= 2:
+                first_columns.insert(0, (column, next_values))
+        return first_columns
+
+    def build_tree(self):
+        """
+        Recomputes the time to maturity and to dividend, and creates the tree (or its layout in low memory mode).
+
+        Raises:
+        - ValueError. If an option is neither European, American nor Barrier.
+        """
+        for option in self.options:
+            if option.option_name not in ("European", "American", "Barrier"):
+                raise ValueError(f"Unsupported option for the tree: {option.option_name}")
+        # Recompute time to maturity and time to dividend
+        self.Option.time_to_maturity = (self.Option.maturity_date - self.Pricer.pricing_date).days / 365
+        self.Market.time_to_div = (self.Market.div_date - self.Pricer.pricing_date).days / 365
+        if getattr(self.Pricer, "low_memory", False):
+            self.create_layout()
+        else:
+            self.create_tree()
+
+    def compute_price(self) -> float:
+        """
+        Computes the price of the option using Backward pricing.
+
+        In low memory mode, each column is rebuilt from the layout of the tree when it is reached, so that only two
+        columns are held in memory.
+
+        Returns:
+        - float. The option price.
+
+        Raises:
+        - ValueError. If the option is neither European, American nor Barrier.
+        """
+        return float(self.compute_prices([self.Option])[0])
+
+    def compute_prices(self, options: list) -> np.array:
+        """
+        Computes the prices of several options with the same maturity, with one backward induction on a single tree.
+
+        Parameters:
+        - options: list. European, American or Barrier options, with the maturity of the option of the pricer.
+
+        Returns:
+        - np.array. Price of each option.
+
+        Raises:
+        - ValueError. If an option is neither European, American nor Barrier, or has another maturity.
+        """
+        if any(option.maturity_date != self.Option.maturity_date for option in options):
+            raise ValueError("Options priced on the same tree must have the same maturity.")
+        self.set_options(options)
+        self.build_tree()
+        prices: np.array = self.backward_induction()[0][1][0, :len(options)].copy()
+        if self.richardson and self.nb_steps >= 4:
+            # Error in 1 / nb_steps removed with the ratio of the numbers of steps of the two trees
+            ratio: float = self.nb_steps / (self.nb_steps // 2)
+            prices = (ratio * prices - self.half_steps_prices()) / (ratio - 1)
+        return prices
+
+    def half_steps_prices(self) -> np.array:
+        """
+        Computes the prices of the options of the tree with a tree of half the number of steps (rounded down), for the
+        Richardson extrapolation.
+
+        Returns:
+        - np.array. Price of each option.
+        """
+        pricer = copy(self.Pricer)
+        pricer.nb_steps = self.nb_steps // 2
+        tree = OptionPricerTreeArray(ModelParams(self.Market, self.Option, pricer))
+        tree.richardson = False
+        return tree.compute_prices(self.priced_options)
+
+    def compute_greeks(self) -> np.array:
+        """
+        Computes the price and Greeks of the option from a single tree.
+
+        Delta and Gamma are computed from the nodes of the first column after the root, and Theta from the value of
+        this column interpolated at the spot. Vega and Rho are computed with finite differences, the bumped prices
+        being computed on the same tree with shifted probabilities and discount factors.
+
+        Returns:
+        - np.array. [Price, Delta, Gamma, Vega, Theta, Rho]
+
+        Raises:
+        - ValueError. If the option is neither European, American nor Barrier.
+        """
+        self.build_tree()
+        first_columns: list = self.backward_induction()
+        price: float = first_columns[0][1][0, 0]
+        # Upper, middle and lower nodes after the root
+        column, values = first_columns[1]
+        spots: np.array = column.spots[column.trunc_index - 1:column.trunc_index + 2]
+        values = values[column.trunc_index - 1:column.trunc_index + 2, 0]
+        delta: float = (values[2] - values[0]) / (spots[2] - spots[0])
+        gamma: float = (((values[2] - values[1]) / (spots[2] - spots[1])
+                         - (values[1] - values[0]) / (spots[1] - spots[0])) / ((spots[2] - spots[0]) / 2))
+        # Value after one step at the current spot
+        value_dt: float = np.polyval(np.polyfit(spots, values, 2), self.Market.und_price)
+        theta: float = (1 / 252) * (value_dt - price) / self.dt
+        # Bumped prices on the same tree
+        shift: float = 0.01
+        vega: float = (self.backward_induction(vol_shift=shift)[0][1][0, 0]
+                       - self.backward_induction(vol_shift=-shift)[0][1][0, 0]) / (2 * shift) / 100
+        rho: float = (self.backward_induction(rate_shift=shift)[0][1][0, 0]
+                      - self.backward_induction(rate_shift=-shift)[0][1][0, 0]) / (2 * shift) / 100
+        return np.array([price, delta, gamma, vega, theta, rho])
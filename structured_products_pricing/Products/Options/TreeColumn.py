@@ -0,0 +1,39 @@
+from typing import Optional
+import numpy as np
+
+class TreeColumn:
+    """
+    Class to store one column (layer) of the trinomial tree in arrays, nodes being sorted by increasing level.
+    """
+    def __init__(self, layer: int, spots: np.array, trunc_index: int):
+        """
+        Initializes TreeColumn.
+
+        Parameters:
+        - layer: int. Index of the column in the tree.
+        - spots: np.array. Asset price of each node of the column, sorted by increasing level.
+        - trunc_index: int. Position of the trunc node in the column.
+        """
+        self.layer: int = layer
+        self.spots: np.array = spots
+        self.trunc_index: int = trunc_index
+        # Position and asset price of the next middle node of each node, and transition probabilities
+        self.mid_index: Optional[np.array] = None
+        self.mid_spots: Optional[np.array] = None
+        self.p_up: Optional[np.array] = None
+        self.p_mid: Optional[np.array] = None
+        self.p_down: Optional[np.array] = None
+        # Nodes linked to the next column, and edge nodes linked to their next middle node only
+        self.connected: Optional[np.array] = None
+        self.pruned: Optional[np.array] = None
+        self.values: Optional[np.array] = None
+
+    @property
+    def levels(self) -> np.array:
+        """
+        Level of each node of the column, the trunc node being at level 0.
+        """
+        return np.arange(len(self.spots)) - self.trunc_index
+
+    def __len__(self) -> int:
+        return len(self.spots)
@@ -80,9 +80,9 @@ def get_deterministic_rates(interest_rate: float,
         rates_path = np.broadcast_to(rates[np.newaxis, :], (pricer.nb_draws, rates.size))
 
         # Cumulative sum of rates * dt
-        cum_rates = np.cumsum(rates_path * dt, axis=1)
-        # Discount factors = exp(-int_0^t r(s) ds)
-        df = np.exp(-cum_rates)
+        cum_rates = np.cumsum(rates * dt)
+        # Discount factors = exp(-int_0^t r(s) ds), identical across paths so only broadcast
+        df = np.broadcast_to(np.exp(-cum_rates)[np.newaxis, :], (pricer.nb_draws, rates.size))
 
     return rates, rates_path, df
 
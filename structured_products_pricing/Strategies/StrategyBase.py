@@ -36,11 +36,38 @@ class StrategyBase(ABC):
         Returns:
         - float. Total strategy price.
         """
+        if self.Pricer.pricer_name == "Tree" and (getattr(self.Pricer, "backend", "node") == "array"
+                                                  or getattr(self.Pricer, "low_memory", False)
+                                                  or getattr(self.Pricer, "accelerated", False)
+                                                  or getattr(self.Pricer, "mesh_refinement", 0) > 0):
+            return float(np.dot(self.tree_prices(), self.quantities))
         price = 0
         for product, quantity in zip(self.products_params, self.quantities):
             price += product.compute_price() * quantity
         return price
 
+    def tree_prices(self) -> np.array:
+        """
+        Computes the price of each product, the options sharing a market and a maturity being priced on one trinomial
+        tree.
+
+        Returns:
+        - np.array. Price of each product.
+        """
+        prices: np.array = np.zeros(len(self.products_params))
+        groups: dict = {}
+        for index, product in enumerate(self.products_params):
+            if (hasattr(product, "compute_tree_prices")
+                    and product.Option.option_name in ("European", "American", "Barrier")):
+                groups.setdefault((id(product.Market), product.Option.maturity_date), []).append(index)
+            else:
+                prices[index] = product.compute_price()
+        # One tree per group, built with the market and pricer of its first product
+        for indexes in groups.values():
+            options: list = [self.products_params[index].Option for index in indexes]
+            prices[indexes] = self.products_params[indexes[0]].compute_tree_prices(options)
+        return prices
+
     def delta(self) -> float:
         """
         Computes the delta of the strategy using finite differences.
@@ -150,11 +177,137 @@ class StrategyBase(ABC):
         Returns:
         - np.array. [Delta, Gamma, Vega, Theta, Rho]
         """
-        if self.Pricer.pricer_name == "MC" or self.Pricer.pricer_name == "Tree":
+        if self.Pricer.pricer_name == "MC" and getattr(self.Pricer, "greeks_method", None) == "pathwise":
+            greeks = self.pathwise_greeks()
+            if greeks is not None:
+                return greeks
+        if self.Pricer.pricer_name == "MC" and getattr(self.Pricer, "greeks_method", None) == "crn":
+            greeks = self.crn_greeks()
+            if greeks is not None:
+                return greeks
+        if self.Pricer.pricer_name == "MC":
+            # Bumped prices of American options reuse the exercise policy fitted on the base market
+            self.freeze_exercise_policies(True)
+            try:
+                return np.array([self.delta(), self.gamma(), self.vega(), self.theta(), self.rho()])
+            finally:
+                self.freeze_exercise_policies(False)
+        if self.Pricer.pricer_name == "Tree" and getattr(self.Pricer, "greeks_method", None) == "lattice":
+            greeks = self.lattice_greeks()
+            if greeks is not None:
+                return greeks
+        if self.Pricer.pricer_name == "Tree":
             return np.array([self.delta(), self.gamma(), self.vega(), self.theta(), self.rho()])
         elif self.Pricer.pricer_name == "BS":
             return self.products_params[0].compute_bs_greeks()
 
+    def freeze_exercise_policies(self, freeze: bool):
+        """
+        Freezes (or releases) the exercise policy of the products priced with the Longstaff-Schwartz regression.
+
+        Products without a fitted policy are priced once on the current market to fit it before being frozen.
+
+        Parameters:
+        - freeze: bool. True to reuse the fitted policies in the next pricings, False to fit new ones.
+        """
+        for product in self.products_params:
+            if not hasattr(product, "freeze_exercise_policy") or product.Option.option_name != "American":
+                continue
+            if freeze and product.exercise_policy is None:
+                product.compute_price()
+            product.freeze_exercise_policy = freeze
+
+    def pathwise_greeks(self) -> np.array:
+        """
+        Aggregates the Greeks computed by each Monte Carlo product in the same pass as its price.
+
+        Products without optionality (e.g. bonds) only contribute to Rho, through finite differences on their own
+        price. Theta is computed with finite differences on the whole strategy.
+
+        Returns:
+        - np.array. [Delta, Gamma, Vega, Theta, Rho], or None if a product does not support single pass Greeks.
+        """
+        greeks: np.array = np.zeros(5)
+        shift: float = 0.01
+        for product, quantity in zip(self.products_params, self.quantities):
+            if hasattr(product, "compute_mc_greeks"):
+                product_greeks = product.compute_mc_greeks()
+                if product_greeks is None:
+                    return None
+                delta, gamma, vega, rho = product_greeks
+                greeks += quantity * np.array([delta, gamma, vega, 0, rho])
+            else:
+                # Rho of the product from its price with shifted rates
+                original_rate: float = self.Market.int_rate
+                self.Market.int_rate = original_rate + shift
+                priceUp: float = product.compute_price()
+                self.Market.int_rate = original_rate - shift
+                priceDown: float = product.compute_price()
+                self.Market.int_rate = original_rate
+                greeks[4] += quantity * (priceUp - priceDown) / (2 * shift) / 100
+        greeks[3] = self.theta()
+
+        return greeks
+
+    def lattice_greeks(self) -> np.array:
+        """
+        Aggregates the Greeks computed by each product on its own trinomial tree, with a single tree build per product.
+
+        Returns:
+        - np.array. [Delta, Gamma, Vega, Theta, Rho], or None if a product does not support tree Greeks.
+        """
+        greeks: np.array = np.zeros(5)
+        for product, quantity in zip(self.products_params, self.quantities):
+            if not hasattr(product, "compute_tree_greeks"):
+                return None
+            product_greeks = product.compute_tree_greeks()
+            if product_greeks is None:
+                return None
+            greeks += quantity * product_greeks
+
+        return greeks
+
+    def crn_greeks(self) -> np.array:
+        """
+        Computes the Greeks of the strategy with the same finite differences as delta, gamma, vega, theta and rho,
+        pricing all the bumped markets of each product at once on common random numbers.
+
+        Products without optionality (e.g. bonds) are re-priced with the shifted rates only.
+
+        Returns:
+        - np.array. [Delta, Gamma, Vega, Theta, Rho], or None if a product does not support bumped pricing.
+        """
+        spot, vol, rate = self.Market.und_price, self.Market.vol, self.Market.int_rate
+        spot_shift, vol_shift, rate_shift, day_shift = spot * 0.01, 0.01, 0.01, 1
+        # Base, spot up/down, vol up/down, pricing date down/up, rate up/down
+        scenarios: np.array = np.array([[spot, vol, rate, 0],
+                                        [spot + spot_shift, vol, rate, 0], [spot - spot_shift, vol, rate, 0],
+                                        [spot, vol + vol_shift, rate, 0], [spot, vol - vol_shift, rate, 0],
+                                        [spot, vol, rate, -day_shift], [spot, vol, rate, day_shift],
+                                        [spot, vol, rate + rate_shift, 0], [spot, vol, rate - rate_shift, 0]])
+        prices: np.array = np.zeros(len(scenarios))
+        for product, quantity in zip(self.products_params, self.quantities):
+            if hasattr(product, "compute_bumped_prices"):
+                product_prices = product.compute_bumped_prices(scenarios)
+                if product_prices is None:
+                    return None
+            else:
+                # Only the rates affect products without optionality
+                product_prices = []
+                for scenario_rate in scenarios[:, 2]:
+                    self.Market.int_rate = scenario_rate
+                    product_prices.append(product.compute_price())
+                self.Market.int_rate = rate
+            prices += quantity * np.array(product_prices)
+
+        delta: float = (prices[1] - prices[2]) / (2 * spot_shift)
+        gamma: float = (prices[1] - 2 * prices[0] + prices[2]) / (spot_shift ** 2)
+        vega: float = (prices[3] - prices[4]) / (2 * vol_shift) / 100
+        theta: float = -(1 / 252) * (prices[5] - prices[6]) / (2 * day_shift / 365)
+        rho: float = (prices[7] - prices[8]) / (2 * rate_shift) / 100
+
+        return np.array([delta, gamma, vega, theta, rho])
+
     def greeks_over_spot_range(self, is_option: bool = False):
         """
         Computes price and Greeks over a range of underlying spot prices.
@@ -1,12 +1,13 @@
-from scipy.stats import norm
-from typing import Optional
+from scipy.stats import norm, qmc
+from typing import Iterator, List, Optional, Tuple
 import numpy as np
 
 class Brownian:
     """
     Class to generate Brownian motions.
     """
-    def __init__(self, t: float, nb_steps: int, nb_draws: int, seed: Optional[int] = None):
+    def __init__(self, t: float, nb_steps: int, nb_draws: int, seed: Optional[int] = None,
+                 dtype: np.dtype = np.float64):
         """
         Initializes Brownian.
 
@@ -15,11 +16,13 @@ class Brownian:
         - nb_steps: int. Number of time steps.
         - nb_draws: int. Number of independent Brownian paths.
         - seed: Optional[int]. If provided, used to initialize the random number generator to a fixed state.
+        - dtype: np.dtype. Floating point type of the generated motions (the random stream does not depend on it).
         """
         self.t = t
         self.nb_steps = int(nb_steps)
         self.nb_draws = nb_draws
         self.dt = self.t/self.nb_steps
+        self.dtype: np.dtype = np.dtype(dtype)
         # Initialize the random number generator
         if seed is not None:
             self.rng: np.random.Generator = np.random.default_rng(seed)
@@ -54,6 +57,34 @@ class Brownian:
 
         return motion
 
+    def NormalDraws(self, nb_paths: Optional[int] = None, nb_points: Optional[int] = None) -> np.array:
+        """
+        Generates independent standard normal draws, one per path and time step.
+
+        Parameters:
+        - nb_paths: Optional[int]. Number of paths (nb_draws by default).
+        - nb_points: Optional[int]. Number of draws per path (nb_steps by default).
+
+        Returns:
+        - np.array. A 2D numpy array of shape (nb_paths, nb_points) of standard normal draws.
+        """
+        nb_paths = self.nb_draws if nb_paths is None else nb_paths
+        nb_points = self.nb_steps if nb_points is None else nb_points
+        return norm.ppf(self.rng.uniform(size=(nb_paths, nb_points))).astype(self.dtype, copy=False)
+
+    def MotionTerminal(self) -> np.array:
+        """
+        Generates the terminal values of the Brownian motions only, without the intermediate steps.
+
+        Returns:
+        - motion: np.array. A 2D numpy array of shape (nb_draws, 1), where each row holds the value at time t of an
+        independent Brownian motion.
+        """
+        # Generate one normal draw per path scaled to the whole horizon
+        motion = self.NormalDraws(nb_points=1)
+        motion *= np.sqrt(self.t)
+        return motion
+
     def MotionVector(self) -> np.array:
         """
         Generates multiple Brownian motion paths (2D array) using numpy vectors.
@@ -63,10 +94,172 @@ class Brownian:
         Brownian motion.
         """
         # Generate first value of Brownian motion paths (zeros)
-        first_value = np.zeros((self.nb_draws, 1))
+        first_value = np.zeros((self.nb_draws, 1), dtype=self.dtype)
         # Generate uniform draws using numpy vectors
-        normal_draws = norm.ppf(self.rng.uniform(size=(self.nb_draws, self.nb_steps))) * np.sqrt(self.dt)
+        normal_draws = self.NormalDraws()
+        normal_draws *= np.sqrt(self.dt)
         # Compute and concatenate the cumulative sum along the time axis to obtain Brownian motion paths
         motion = np.concatenate((first_value, np.cumsum(normal_draws, axis=1)), axis=1)
 
-        return motion
\ No newline at end of file
+        return motion
+
+    def IncrementsByStep(self) -> Iterator[np.array]:
+        """
+        Generates the Brownian motion increments time step by time step, so that only one step is in memory at once.
+
+        Returns:
+        - Iterator[np.array]. 1D numpy arrays of shape (nb_draws,) holding the increments of each path over a step.
+        """
+        for _ in range(self.nb_steps):
+            yield self.Increments(self.nb_draws, self.dt)
+
+    def Increments(self, nb_paths: int, duration: float) -> np.array:
+        """
+        Generates independent Brownian motion increments over a period.
+
+        Parameters:
+        - nb_paths: int. Number of paths.
+        - duration: float. Length of the period (in years).
+
+        Returns:
+        - increment: np.array. A 1D numpy array of shape (nb_paths,) of increments.
+        """
+        increment = norm.ppf(self.rng.uniform(size=nb_paths)).astype(self.dtype, copy=False)
+        increment *= np.sqrt(duration)
+        return increment
+
+    def MotionChunks(self, chunk_size: int, antithetic: bool = False, terminal: bool = False) -> Iterator[np.array]:
+        """
+        Generates the Brownian motion paths block by block, so that only chunk_size paths are in memory at once.
+
+        The blocks are drawn from the same generator, so their concatenation matches MotionVector (or MotionTerminal
+        for terminal values) for a given seed.
+
+        Parameters:
+        - chunk_size: int. Maximum number of paths in each block.
+        - antithetic: bool. If True, the second half of each block holds the opposite of the paths of the first half. A
+        block with an odd number of paths is completed with one more path, so that it holds whole pairs.
+        - terminal: bool. If True, only the terminal values of the Brownian motions are generated.
+
+        Returns:
+        - Iterator[np.array]. 2D numpy arrays of shape (chunk, nb_steps + 1), or (chunk, 1) for terminal values, where
+        each row represents an independent Brownian motion.
+        """
+        # Terminal values are drawn in one step over the whole horizon
+        nb_points: int = 1 if terminal else self.nb_steps
+        scale: float = np.sqrt(self.t if terminal else self.dt)
+        # Antithetic blocks hold pairs of paths
+        if antithetic:
+            chunk_size = max(2, chunk_size - chunk_size % 2)
+        for start in range(0, self.nb_draws, chunk_size):
+            nb_paths: int = min(chunk_size, self.nb_draws - start)
+            if antithetic:
+                # Generate half of the draws (rounded up) and mirror them
+                normal_draws = self.NormalDraws((nb_paths + 1) // 2, nb_points)
+                normal_draws *= scale
+                normal_draws = np.concatenate((normal_draws, -normal_draws))
+                nb_paths = len(normal_draws)
+            else:
+                # Generate uniform draws for the block using numpy vectors
+                normal_draws = self.NormalDraws(nb_paths, nb_points)
+                normal_draws *= scale
+            if terminal:
+                yield normal_draws
+                continue
+            # Compute the cumulative sum along the time axis, starting from zero
+            motion = np.zeros((nb_paths, self.nb_steps + 1), dtype=self.dtype)
+            np.cumsum(normal_draws, axis=1, out=motion[:, 1:])
+            yield motion
+
+    def bridge_schedule(self, times: np.array) -> List[Tuple[int, int, int]]:
+        """
+        Computes the order in which a Brownian bridge fills the points of a time grid.
+
+        The terminal point comes first, then the midpoints of the intervals breadth first, so that the first
+        normal draws carry most of the variance of the paths.
+
+        Parameters:
+        - times: np.array. Time grid (in years) starting at 0.
+
+        Returns:
+        - schedule: List[Tuple[int, int, int]]. (index, left index, right index) of each filled point.
+        """
+        last: int = len(times) - 1
+        schedule: List[Tuple[int, int, int]] = [(last, 0, last)]
+        intervals: List[Tuple[int, int]] = [(0, last)]
+        # Loop over the intervals breadth first, splitting each one at its midpoint
+        while intervals:
+            left, right = intervals.pop(0)
+            if right - left < 2:
+                continue
+            middle: int = (left + right) // 2
+            schedule.append((middle, left, right))
+            intervals += [(left, middle), (middle, right)]
+        return schedule
+
+    def MotionBridge(self, normal_draws: np.array, times: Optional[np.array] = None) -> np.array:
+        """
+        Builds Brownian motion paths from standard normal draws using a Brownian bridge.
+
+        Parameters:
+        - normal_draws: np.array. A 2D numpy array of shape (nb_paths, nb_points) of standard normal draws, where the
+        first column drives the terminal value of the paths.
+        - times: Optional[np.array]. Time grid of nb_points + 1 times starting at 0 (regular grid by default).
+
+        Returns:
+        - motion: np.array. A 2D numpy array of shape (nb_paths, nb_points + 1), where each row represents an
+        independent Brownian motion.
+        """
+        if times is None:
+            times = self.dt * np.arange(self.nb_steps + 1)
+        motion = np.zeros((len(normal_draws), len(times)), dtype=self.dtype)
+        # Loop over the points of the grid in bridge order
+        for column, (index, left, right) in enumerate(self.bridge_schedule(times)):
+            if column == 0:
+                # Terminal value of the Brownian motion
+                motion[:, index] = np.sqrt(times[index]) * normal_draws[:, column]
+                continue
+            # Brownian bridge between the two already known surrounding points
+            length: float = times[right] - times[left]
+            weight_left: float = (times[right] - times[index]) / length
+            weight_right: float = (times[index] - times[left]) / length
+            std: float = np.sqrt((times[index] - times[left]) * (times[right] - times[index]) / length)
+            motion[:, index] = (weight_left * motion[:, left] + weight_right * motion[:, right]
+                                + std * normal_draws[:, column])
+        return motion
+
+    def MotionObservations(self, times: np.array) -> np.array:
+        """
+        Generates the Brownian motions at given observation times only, with exact increments between them.
+
+        Parameters:
+        - times: np.array. Increasing observation times (in years), all non negative.
+
+        Returns:
+        - motion: np.array. A 2D numpy array of shape (nb_draws, len(times)), where each row holds the values of an
+        independent Brownian motion at the observation times.
+        """
+        # Scale the normal draws by the length of each interval between observations
+        increments: np.array = np.diff(np.concatenate(([0], times)))
+        normal_draws = norm.ppf(self.rng.uniform(size=(self.nb_draws, len(times)))).astype(self.dtype, copy=False)
+        normal_draws *= np.sqrt(increments)
+        # Compute the cumulative sum along the time axis
+        return np.cumsum(normal_draws, axis=1)
+
+    def MotionSobol(self) -> np.array:
+        """
+        Generates multiple Brownian motion paths from a scrambled Sobol sequence and a Brownian bridge.
+
+        Each call draws a new independent scrambling, so repeated calls give randomised quasi-Monte Carlo replications.
+        The number of draws must be a power of two to keep the balance properties of the sequence.
+
+        Returns:
+        - motion: np.array. A 2D numpy array of shape (nb_draws, nb_steps + 1), where each row represents an independent
+        Brownian motion.
+        """
+        sobol = qmc.Sobol(d=self.nb_steps, scramble=True,
+                          seed=self.rng if isinstance(self.rng, np.random.Generator) else None)
+        # Draw the low discrepancy points
+        uniform_draws = sobol.random(self.nb_draws)
+        # Build the paths so that the first Sobol dimensions drive the coarse shape of the paths
+        return self.MotionBridge(norm.ppf(uniform_draws))
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import numpy as np
+
+class PathCache:
+    """
+    Class to store simulated Monte Carlo path sets so that products sharing an underlying and a grid
+    can be priced off one simulation.
+    """
+    def __init__(self, max_entries: int = 16, max_bytes: Optional[int] = 2 * 1024 ** 3):
+        """
+        Initializes PathCache.
+
+        Parameters:
+        - max_entries: int. Maximum number of path sets kept in the cache.
+        - max_bytes: Optional[int]. Maximum memory (in bytes) used by the cached arrays. No limit if None.
+        """
+        self.max_entries: int = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.entries: OrderedDict = OrderedDict()
+        self.nbytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def entry_size(value: Any) -> int:
+        """
+        Computes the memory used by a cached entry.
+
+        Parameters:
+        - value: Any. A numpy array or a tuple of numpy arrays.
+
+        Returns:
+        - int. Number of bytes owned by the arrays of the entry (broadcasted views are not counted).
+        """
+        arrays = value if isinstance(value, tuple) else (value,)
+        return sum(array.nbytes for array in arrays if isinstance(array, np.ndarray) and array.base is None)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Retrieves a path set from the cache and marks it as most recently used.
+
+        Parameters:
+        - key: Hashable. Key describing the market and simulation parameters.
+
+        Returns:
+        - Optional[Any]. The cached path set, None if it is not in the cache.
+        """
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Stores a path set in the cache and evicts the least recently used ones if the cache is full.
+
+        Parameters:
+        - key: Hashable. Key describing the market and simulation parameters.
+        - value: Any. A numpy array or a tuple of numpy arrays.
+        """
+        size = self.entry_size(value)
+        # Do not cache path sets that would not fit in the cache on their own
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.nbytes -= self.entry_size(self.entries.pop(key))
+        # Evict the least recently used path sets until the new one fits
+        while self.entries and (len(self.entries) >= self.max_entries
+                                or (self.max_bytes is not None and self.nbytes + size > self.max_bytes)):
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= self.entry_size(evicted)
+        self.entries[key] = value
+        self.nbytes += size
+
+    def clear(self):
+        """
+        Removes all path sets from the cache.
+        """
+        self.entries.clear()
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
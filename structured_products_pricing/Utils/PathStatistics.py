@@ -0,0 +1,64 @@
+from typing import Optional
+import numpy as np
+
+class PathStatistics:
+    """
+    Class to accumulate per-path statistics of simulated prices step by step, so that path-dependent payoffs can be
+    evaluated without storing the whole paths.
+    """
+    def __init__(self, initial_prices: np.array, hit_level: Optional[float] = None, hit_from_below: bool = False):
+        """
+        Initializes PathStatistics with the prices at the first date of the paths.
+
+        Parameters:
+        - initial_prices: np.array. Prices of each path at the first date.
+        - hit_level: Optional[float]. If provided, the first step at which each path breaches this level is tracked.
+        - hit_from_below: bool. True if the level is breached from below (prices above the level), False otherwise.
+        """
+        self.terminal: np.array = initial_prices.copy()
+        self.running_max: np.array = initial_prices.copy()
+        self.running_min: np.array = initial_prices.copy()
+        self.running_sum: np.array = initial_prices.astype(np.float64)
+        self.nb_points: int = 1
+        self.hit_level: Optional[float] = hit_level
+        self.hit_from_below: bool = hit_from_below
+        self.first_hit: Optional[np.array] = None
+        if hit_level is not None:
+            self.first_hit = np.full(len(initial_prices), -1)
+            self.record_hits(initial_prices, 0)
+        # Probability that each path did not cross a barrier between the dates, if computed by the simulation
+        self.survival: Optional[np.array] = None
+
+    def record_hits(self, prices: np.array, step: int):
+        """
+        Records the step at which paths breach the tracked level for the first time.
+
+        Parameters:
+        - prices: np.array. Prices of each path at the step.
+        - step: int. Index of the step.
+        """
+        hit: np.array = prices > self.hit_level if self.hit_from_below else prices < self.hit_level
+        self.first_hit[hit & (self.first_hit < 0)] = step
+
+    def update(self, prices: np.array, step: int):
+        """
+        Folds the prices of a new date into the statistics.
+
+        Parameters:
+        - prices: np.array. Prices of each path at the step.
+        - step: int. Index of the step.
+        """
+        self.terminal[...] = prices
+        np.maximum(self.running_max, prices, out=self.running_max)
+        np.minimum(self.running_min, prices, out=self.running_min)
+        self.running_sum += prices
+        self.nb_points += 1
+        if self.hit_level is not None:
+            self.record_hits(prices, step)
+
+    @property
+    def average(self) -> np.array:
+        """
+        Average price of each path over all its dates.
+        """
+        return self.running_sum / self.nb_points
@@ -1,20 +1,62 @@
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
 import numpy as np
 
 class RegressionModel:
     """
     Class to compute polynomial regression using different basis functions.
     """
-    def __init__(self, choice: str, degree: int):
+    def __init__(self, choice: str, degree: int, solver: str = "cholesky"):
         """
         Initializes RegressionModel.
 
         Parameters:
         - choice: str. Type of regression polynomials.
         - degree: int. Degree of the specified regression polynomials.
+        - solver: str. "cholesky" (normal equations), "qr" or "lstsq" (SVD) least squares solver.
         """
         self.choice = choice
         self.coefficients = None
         self.degree = degree
+        self.solver = solver.lower()
+        # Design matrix buffer reused by every regression of the model
+        self.buffer: np.array = None
+
+    def design_buffer(self, nb_rows: int) -> np.array:
+        """
+        Returns a design matrix buffer with nb_rows rows, reallocated only when more rows are needed.
+
+        Parameters:
+        - nb_rows: int. Number of observations.
+
+        Returns:
+        - np.array. An uninitialized array of shape (nb_rows, degree + 1), stored column by column.
+        """
+        if self.buffer is None or len(self.buffer) < nb_rows:
+            self.buffer = np.empty((nb_rows, self.degree + 1), order="F")
+        return self.buffer[:nb_rows]
+
+    def recurrence_basis(self, X: np.array, first_polynomial: np.array, recurrence) -> np.array:
+        """
+        Generates a design matrix from a three-term recurrence of the polynomials.
+
+        The polynomial of degree i is stored in column degree - i, the constant polynomial being the last column.
+
+        Parameters:
+        - X: np.array. Input data array.
+        - first_polynomial: np.array. Polynomial of degree 1 evaluated at X.
+        - recurrence: Callable. Function of (k, P_k, P_k-1) returning the polynomial of degree k + 1.
+
+        Returns:
+        - X_matrix: np.array. The design matrix up to the specified degree.
+        """
+        X_matrix = self.design_buffer(len(X))
+        X_matrix[:, self.degree] = 1
+        if self.degree >= 1:
+            X_matrix[:, self.degree - 1] = first_polynomial
+        for k in range(1, self.degree):
+            X_matrix[:, self.degree - k - 1] = recurrence(k, X_matrix[:, self.degree - k],
+                                                          X_matrix[:, self.degree - k + 1])
+        return X_matrix
 
     def classic_basis(self, X: np.array) -> np.array:
         """
@@ -26,10 +68,7 @@ class RegressionModel:
         Returns:
         - X_matrix: np.array. The design matrix using classic polynomials up to the specified degree.
         """
-        X_matrix = np.ones((len(X), self.degree + 1))
-        for i in range(1, self.degree + 1):
-            X_matrix[:, self.degree - i] = X ** i
-        return X_matrix
+        return self.recurrence_basis(X, X, lambda k, P, P_previous: X * P)
 
     def laguerre_basis(self, X: np.array) -> np.array:
         """
@@ -41,24 +80,8 @@ class RegressionModel:
         Returns:
         - X_matrix: np.array. The design matrix using Laguerre polynomials up to the specified degree.
         """
-        X_matrix = np.ones((len(X), self.degree + 1))
-
-        if self.degree >= 1:
-            X_matrix[:, self.degree - 1] = -X + 1
-        if self.degree >= 2:
-            X_matrix[:, self.degree - 2] = 0.5 * (X ** 2 - 4 * X + 2)
-        if self.degree >= 3:
-            X_matrix[:, self.degree - 3] = 1 / 6 * (-X ** 3 + 9 * X ** 2 - 18 * X + 6)
-        if self.degree >= 4:
-            X_matrix[:, self.degree - 4] = 1 / 24 * (X ** 4 - 16 * X ** 3 + 72 * X ** 2 - 96 * X + 24)
-        if self.degree >= 5:
-            X_matrix[:, self.degree - 5] = 1 / 120 * (-X ** 5 + 25 * X ** 4 - 200 * X ** 3 + 600 * X ** 2
-                                                      - 600 * X + 120)
-        if self.degree >= 6:
-            X_matrix[:, self.degree - 6] = 1 / 720 * (X ** 6 - 36 * X ** 5 + 450 * X ** 4 - 2400 * X ** 3
-                                                      + 5400 * X ** 2 - 4320 * X + 720)
-
-        return X_matrix
+        return self.recurrence_basis(X, 1 - X,
+                                     lambda k, P, P_previous: ((2 * k + 1 - X) * P - k * P_previous) / (k + 1))
 
     def hermite_basis(self, X: np.array) -> np.array:
         """
@@ -70,22 +93,7 @@ class RegressionModel:
         Returns:
         - X_matrix: np.array. The design matrix using Hermite polynomials up to the specified degree.
         """
-        X_matrix = np.ones((len(X), self.degree + 1))
-
-        if self.degree >= 1:
-            X_matrix[:, self.degree - 1] = X
-        if self.degree >= 2:
-            X_matrix[:, self.degree - 2] = X ** 2 - 1
-        if self.degree >= 3:
-            X_matrix[:, self.degree - 3] = X ** 3 - 3 * X
-        if self.degree >= 4:
-            X_matrix[:, self.degree - 4] = X ** 4 - 6 * X ** 2 + 3
-        if self.degree >= 5:
-            X_matrix[:, self.degree - 5] = X ** 5 - 10 * X ** 3 + 15 * X
-        if self.degree >= 6:
-            X_matrix[:, self.degree - 6] = X ** 6 - 15 * X ** 4 + 45 * X ** 2 - 15
-
-        return X_matrix
+        return self.recurrence_basis(X, X, lambda k, P, P_previous: X * P - k * P_previous)
 
     def legendre_basis(self, X: np.array) -> np.array:
         """
@@ -97,22 +105,8 @@ class RegressionModel:
         Returns:
         - X_matrix: np.array. The design matrix using Legendre polynomials up to the specified degree.
         """
-        X_matrix = np.ones((len(X), self.degree + 1))
-
-        if self.degree >= 1:
-            X_matrix[:, self.degree - 1] = X
-        if self.degree >= 2:
-            X_matrix[:, self.degree - 2] = 0.5 * (3 * X ** 2 - 1)
-        if self.degree >= 3:
-            X_matrix[:, self.degree - 3] = 0.5 * (5 * X ** 3 - 3 * X)
-        if self.degree >= 4:
-            X_matrix[:, self.degree - 4] = 1 / 8 * (35 * X ** 4 - 30 * X ** 2 + 3)
-        if self.degree >= 5:
-            X_matrix[:, self.degree - 5] = 1 / 8 * (63 * X ** 5 - 70 * X ** 3 + 15 * X)
-        if self.degree >= 6:
-            X_matrix[:, self.degree - 6] = 1 / 16 * (231 * X ** 6 - 315 * X ** 4 + 105 * X ** 2 - 5)
-
-        return X_matrix
+        return self.recurrence_basis(X, X,
+                                     lambda k, P, P_previous: ((2 * k + 1) * X * P - k * P_previous) / (k + 1))
 
     def tchebychev_basis(self, X: np.array) -> np.array:
         """
@@ -124,48 +118,72 @@ class RegressionModel:
         Returns:
         - X_matrix: np.array. The design matrix using Tchebychev polynomials up to the specified degree.
         """
-        X_matrix = np.ones((len(X), self.degree + 1))
-
-        if self.degree >= 1:
-            X_matrix[:, self.degree - 1] = X
-        if self.degree >= 2:
-            X_matrix[:, self.degree - 2] = 2 * X ** 2 - 1
-        if self.degree >= 3:
-            X_matrix[:, self.degree - 3] = 4 * X ** 3 - 3 * X
-        if self.degree >= 4:
-            X_matrix[:, self.degree - 4] = 8 * X ** 4 - 8 * X ** 2 + 1
-        if self.degree >= 5:
-            X_matrix[:, self.degree - 5] = 16 * X ** 5 - 20 * X ** 3 + 5 * X
-        if self.degree >= 6:
-            X_matrix[:, self.degree - 6] = 32 * X ** 6 - 48 * X ** 4 + 18 * X ** 2 - 1
+        return self.recurrence_basis(X, X, lambda k, P, P_previous: 2 * X * P - P_previous)
 
-        return X_matrix
-
-    def fit(self, X: np.array, y: np.array) -> np.array:
+    def basis(self, X: np.array) -> np.array:
         """
-        Fits the regression model to the input data using the specified regression polynomials and degree.
+        Generates the design matrix of the specified regression polynomials.
+
+        The matrix is written in a buffer of the model, so it is overwritten by the next call.
 
         Parameters:
         - X: np.array. Input data array.
-        - y: np.array. Target data array.
 
         Returns:
-        - self.coefficients: np.array. Least square solution to a linear matrix equation.
+        - X_matrix: np.array. The design matrix up to the specified degree.
         """
         if self.choice == "Classic":
-            X_matrix = self.classic_basis(X)
+            return self.classic_basis(X)
         elif self.choice == "Laguerre":
-            X_matrix = self.laguerre_basis(X)
+            return self.laguerre_basis(X)
         elif self.choice == "Hermite":
-            X_matrix = self.hermite_basis(X)
+            return self.hermite_basis(X)
         elif self.choice == "Legendre":
-            X_matrix = self.legendre_basis(X)
+            return self.legendre_basis(X)
         elif self.choice == "Tchebychev":
-            X_matrix = self.tchebychev_basis(X)
+            return self.tchebychev_basis(X)
+        raise ValueError(f"Unknown regression type: {self.choice}")
+
+    def solve(self, X_matrix: np.array, y: np.array) -> np.array:
+        """
+        Computes the least square coefficients of a design matrix.
+
+        The Cholesky solver factorizes the normal equations, and falls back to the SVD when they are not positive
+        definite (e.g. fewer observations than polynomials).
 
+        Parameters:
+        - X_matrix: np.array. Design matrix.
+        - y: np.array. Target data array.
+
+        Returns:
+        - self.coefficients: np.array. Least square solution to a linear matrix equation.
+        """
+        if self.solver == "cholesky" and len(y) >= X_matrix.shape[1]:
+            try:
+                self.coefficients = cho_solve(cho_factor(X_matrix.T @ X_matrix), X_matrix.T @ y)
+                return self.coefficients
+            except np.linalg.LinAlgError:
+                pass
+        elif self.solver == "qr" and len(y) >= X_matrix.shape[1]:
+            Q, R = np.linalg.qr(X_matrix)
+            self.coefficients = solve_triangular(R, Q.T @ y)
+            return self.coefficients
         self.coefficients = np.linalg.lstsq(X_matrix, y, rcond=None)[0]
         return self.coefficients
 
+    def fit(self, X: np.array, y: np.array) -> np.array:
+        """
+        Fits the regression model to the input data using the specified regression polynomials and degree.
+
+        Parameters:
+        - X: np.array. Input data array.
+        - y: np.array. Target data array.
+
+        Returns:
+        - self.coefficients: np.array. Least square solution to a linear matrix equation.
+        """
+        return self.solve(self.basis(X), y)
+
     def predict(self, X: np.array) -> np.array:
         """
         Computes the output for the input data using the previously fitted regression model.
@@ -176,15 +194,4 @@ class RegressionModel:
         Returns:
         - np.array. Predicted output values.
         """
-        if self.choice == "Classic":
-            X_matrix = self.classic_basis(X)
-        elif self.choice == "Laguerre":
-            X_matrix = self.laguerre_basis(X)
-        elif self.choice == "Hermite":
-            X_matrix = self.hermite_basis(X)
-        elif self.choice == "Legendre":
-            X_matrix = self.legendre_basis(X)
-        elif self.choice == "Tchebychev":
-            X_matrix = self.tchebychev_basis(X)
-
-        return X_matrix @ self.coefficients
\ No newline at end of file
+        return self.basis(X) @ self.coefficients
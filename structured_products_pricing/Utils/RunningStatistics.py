@@ -0,0 +1,116 @@
+from typing import Optional
+import numpy as np
+
+class RunningStatistics:
+    """
+    Class to accumulate the mean and the (co)variance of simulated values block by block, so that Monte Carlo
+    estimators do not need to keep every simulated value in memory.
+    """
+    def __init__(self):
+        """
+        Initializes RunningStatistics.
+
+        Attributes Initialized:
+        - count: int. Number of accumulated samples.
+        - mean_vector: Optional[np.array]. Running mean of each accumulated quantity.
+        - comoment: Optional[np.array]. Running sum of the cross products of the deviations from the mean.
+        """
+        self.count: int = 0
+        self.mean_vector: Optional[np.array] = None
+        self.comoment: Optional[np.array] = None
+        self.is_scalar: bool = True
+
+    def update(self, values: np.array):
+        """
+        Adds a block of simulated values to the statistics.
+
+        Parameters:
+        - values: np.array. A 1D array of shape (n,) or a 2D array of shape (n, k) for k quantities per sample.
+        """
+        # Accumulate in double precision whatever the precision of the simulation
+        values = np.asarray(values, dtype=np.float64)
+        self.is_scalar = values.ndim == 1
+        block = values.reshape(len(values), -1)
+        if len(block) == 0:
+            return
+        block_mean = block.mean(axis=0)
+        centered = block - block_mean
+        self.combine(len(block), block_mean, centered.T @ centered)
+
+    def merge(self, other: "RunningStatistics"):
+        """
+        Merges the statistics accumulated by another instance (e.g. on another block or another process).
+
+        Parameters:
+        - other: RunningStatistics. Statistics to merge into the current ones.
+        """
+        if other.count == 0:
+            return
+        self.is_scalar = other.is_scalar
+        self.combine(other.count, other.mean_vector, other.comoment)
+
+    def combine(self, count: int, mean_vector: np.array, comoment: np.array):
+        """
+        Combines the current moments with the moments of another sample (Chan et al. pairwise update).
+
+        Parameters:
+        - count: int. Number of samples of the other sample.
+        - mean_vector: np.array. Mean of the other sample.
+        - comoment: np.array. Sum of the cross products of the deviations of the other sample.
+        """
+        if self.count == 0:
+            self.count, self.mean_vector, self.comoment = count, mean_vector.copy(), comoment.copy()
+            return
+        total: int = self.count + count
+        delta: np.array = mean_vector - self.mean_vector
+        self.mean_vector = self.mean_vector + delta * count / total
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * self.count * count / total
+        self.count = total
+
+    @property
+    def mean(self):
+        """
+        Returns the running mean (float for a single quantity, np.array otherwise).
+        """
+        return float(self.mean_vector[0]) if self.is_scalar else self.mean_vector
+
+    @property
+    def covariance(self) -> np.array:
+        """
+        Returns the covariance matrix of the accumulated quantities (normalized by the number of samples).
+        """
+        return self.comoment / self.count
+
+    @property
+    def variance(self):
+        """
+        Returns the variance of the accumulated quantities (normalized by the number of samples).
+        """
+        variance = np.diag(self.covariance)
+        return float(variance[0]) if self.is_scalar else variance
+
+    @property
+    def std_error(self):
+        """
+        Returns the standard error of the running mean.
+        """
+        return np.sqrt(self.variance / self.count)
+
+    def control_variate_estimate(self) -> tuple:
+        """
+        Computes the control variate estimate of the mean of the first quantity, the other quantities being centred
+        controls (zero expected value).
+
+        The optimal coefficients are the regression coefficients of the first quantity on the controls, estimated on
+        the accumulated samples.
+
+        Returns:
+        - tuple. (estimate, standard error) of the controlled mean.
+        """
+        covariance: np.array = self.covariance
+        # Regression coefficients of the target on the controls
+        beta: np.array = np.linalg.solve(covariance[1:, 1:], covariance[1:, 0])
+        estimate: float = float(self.mean_vector[0] - beta @ self.mean_vector[1:])
+        # Residual variance of the target once the controls are removed
+        residual_variance: float = max(float(covariance[0, 0] - covariance[0, 1:] @ beta), 0.0)
+        return estimate, np.sqrt(residual_variance / self.count)
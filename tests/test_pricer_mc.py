@@ -0,0 +1,452 @@
+from structured_products_pricing.Strategies.StrategiesOption.StrategyButterflySpread import StrategyButterflySpread
+from structured_products_pricing.Strategies.StrategiesOption.StrategyOptionVanilla import StrategyOptionVanilla
+from structured_products_pricing.Parameters.Option.OptionBarrier import OptionBarrier
+from structured_products_pricing.Parameters.Option.OptionAmerican import OptionAmerican
+from structured_products_pricing.Products.Options.ControlVariate.ControlVariateGeometricAsian import ControlVariateGeometricAsian
+from structured_products_pricing.Products.Options.OptionPricerManager import OptionPricerManager
+from structured_products_pricing.Parameters.Option.OptionAsian import OptionAsian
+from structured_products_pricing.Products.Options.OptionPricerMC import OptionPricerMC
+from structured_products_pricing.Parameters.ModelParams import ModelParams
+from structured_products_pricing.Parameters.Option.OptionEuropean import OptionEuropean
+from structured_products_pricing.Parameters.Pricer.PricerMC import PricerMC
+from structured_products_pricing.Parameters.Pricer.PricerTree import PricerTree
+from structured_products_pricing.Parameters.Market import Market
+from structured_products_pricing.Utils.PathCache import PathCache
+from structured_products_pricing.Utils.PathStatistics import PathStatistics
+from structured_products_pricing.Utils.RegressionModel import RegressionModel
+from datetime import datetime
+import numpy as np
+import pytest
+
+@pytest.fixture
+def market():
+    """
+    Fixture to create a basic market setup.
+    """
+    return Market(
+        underlying_price=100,
+        volatility=0.20,
+        rate_mode="constant",
+        interest_rate=0.02,
+        div_mode="Continuous",
+        dividend_rate=0.035,
+        dividend_discrete=0.00,
+        dividend_date=datetime(2025, 6, 1)
+    )
+
+def test_path_cache_shared_across_products(market):
+    """
+    Test that the products of a strategy price off one cached simulation without changing the price.
+    """
+    path_cache = PathCache()
+    pricer_cached = PricerMC(datetime(2025, 1, 1), 20, 20000, 1, path_cache=path_cache)
+    pricer = PricerMC(datetime(2025, 1, 1), 20, 20000, 1)
+    strategy_cached = StrategyButterflySpread(market, pricer_cached, 90, 100, 110, datetime(2026, 1, 1))
+    strategy = StrategyButterflySpread(market, pricer, 90, 100, 110, datetime(2026, 1, 1))
+
+    assert strategy_cached.price() == pytest.approx(strategy.price(), abs=1e-12), "❌ Cached price mismatch."
+    assert len(path_cache) == 1, "❌ Products should share one simulated path set."
+    assert path_cache.hits == 2, "❌ Cached paths were not reused."
+
+def test_chunked_price_matches_full_simulation(market):
+    """
+    Test that the chunked simulation reproduces the price of the full simulation for a given seed.
+    """
+    option = OptionBarrier("Put", 100, datetime(2026, 1, 1), "in", "down", 80, "American")
+    pricer = PricerMC(datetime(2025, 1, 1), 20, 10000, 1)
+    pricer_chunked = PricerMC(datetime(2025, 1, 1), 20, 10000, 1, chunk_size=3000)
+    price = StrategyOptionVanilla(market, option, pricer).price()
+    price_chunked = StrategyOptionVanilla(market, option, pricer_chunked).price()
+
+    assert price_chunked == pytest.approx(price, abs=1e-10), "❌ Chunked price mismatch."
+
+def test_chunked_european_price_matches_full_simulation(market):
+    """
+    Test that the chunked simulation of the terminal prices reproduces the price of the full simulation.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    price = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 10001, 1)).compute_price()
+    price_chunked = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 10001, 1,
+                                                                 chunk_size=3000)).compute_price()
+
+    assert price_chunked == pytest.approx(price, abs=1e-10), "❌ Chunked price mismatch."
+
+def test_chunked_standard_error_matches_full_simulation(market):
+    """
+    Test that the full and chunked simulations report the standard error of the same discounted payoffs.
+    """
+    option = OptionEuropean("Call", 100, datetime(2027, 1, 1))
+    pricer = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 20000, 7))
+    pricer_chunked = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 20000, 7,
+                                                                  chunk_size=3000))
+    std_error = pricer.compute_price_with_error()[1]
+    std_error_chunked = pricer_chunked.compute_price_with_error()[1]
+
+    assert std_error_chunked == pytest.approx(std_error, rel=1e-8), "❌ Chunked standard error mismatch."
+
+def test_parallel_price_is_reproducible(market):
+    """
+    Test that the parallel simulation gives the same price for a given seed and number of workers.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    prices = [StrategyOptionVanilla(market, option, PricerMC(datetime(2025, 1, 1), 10, 20000, 7,
+                                                             nb_workers=2)).price() for _ in range(2)]
+
+    assert prices[0] == prices[1], "❌ Parallel price is not reproducible."
+    assert abs(prices[0] - 7.04) < 0.2, f"❌ Price mismatch! Expected ~7.04, got {prices[0]:.6f}"
+    with pytest.raises(ValueError):
+        OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 10, 20000, 7, nb_workers=2,
+                                                     target_error=0.05)).compute_price()
+
+def test_qmc_price_and_standard_error(market):
+    """
+    Test that the Sobol engine prices a European call accurately with few paths.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 16, 4096, 1, qmc=True, nb_replications=8)
+    engine = OptionPricerMC(ModelParams(market, option, pricer))
+    price = engine.compute_price()
+
+    assert abs(price - 7.04) < 0.02, f"❌ Price mismatch! Expected ~7.04, got {price:.6f}"
+    assert engine.std_error < 0.02, f"❌ Standard error too large: {engine.std_error:.6f}"
+    with pytest.raises(ValueError):
+        PricerMC(datetime(2025, 1, 1), 16, 5000, 1, qmc=True, nb_replications=8)
+
+@pytest.mark.parametrize("options", [{"nb_replications": 1}, {"nb_replications": 0}, {"antithetic": True},
+                                     {"chunk_size": 1024}, {"control_variates": [ControlVariateGeometricAsian()]}])
+def test_qmc_rejects_unsupported_settings(market, options):
+    """
+    Test that quasi-Monte Carlo raises instead of ignoring the settings it does not support.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+
+    with pytest.raises(ValueError):
+        pricer = PricerMC(datetime(2025, 1, 1), 16, 4096, 1, **{"qmc": True, "nb_replications": 8, **options})
+        OptionPricerMC(ModelParams(market, option, pricer)).compute_price()
+    # The replications are only checked with qmc
+    PricerMC(datetime(2025, 1, 1), 16, 4096, 1, nb_replications=0)
+
+def test_variance_reduction_on_asian(market):
+    """
+    Test that antithetic paths and the geometric Asian control variate reduce the standard error.
+    """
+    option = OptionAsian("Call", 100, datetime(2026, 1, 1), "monthly")
+    pricer = PricerMC(datetime(2025, 1, 1), 20, 20000, 1)
+    pricer_reduced = PricerMC(datetime(2025, 1, 1), 20, 20000, 1, antithetic=True,
+                              control_variates=[ControlVariateGeometricAsian()])
+    price, std_error = OptionPricerManager(market, option, pricer).compute_price_with_error()
+    price_reduced, std_error_reduced = OptionPricerManager(market, option, pricer_reduced).compute_price_with_error()
+
+    assert std_error_reduced < std_error / 10, "❌ Control variate did not reduce the standard error."
+    assert abs(price_reduced - price) < 3 * std_error, "❌ Price mismatch between plain and reduced estimators."
+
+@pytest.mark.parametrize("nb_draws, chunk_size", [(1, None), (10001, None), (10001, 1000)])
+def test_antithetic_price_with_odd_number_of_draws(market, nb_draws, chunk_size):
+    """
+    Test that antithetic pricing completes an odd number of draws with one more path.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 10, nb_draws, 1, chunk_size=chunk_size, antithetic=True)
+    manager = OptionPricerManager(market, option, pricer)
+    price = manager.compute_price()
+
+    assert manager.nb_paths_used == nb_draws + 1, f"❌ Unexpected number of paths: {manager.nb_paths_used}"
+    if nb_draws > 1:
+        assert abs(price - 7.04) < 0.3, f"❌ Price mismatch! Expected ~7.04, got {price:.6f}"
+
+def test_adaptive_price_stops_at_target_error(market):
+    """
+    Test that the adaptive mode stops once the target standard error is reached and reports the paths used.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 10, 5000, 1, target_error=0.05, max_draws=200000)
+    manager = OptionPricerManager(market, option, pricer)
+    price, std_error = manager.compute_price_with_error()
+
+    assert std_error <= 0.05, f"❌ Target not reached: {std_error:.6f}"
+    assert 5000 < manager.nb_paths_used < 200000, f"❌ Unexpected number of paths: {manager.nb_paths_used}"
+    assert abs(price - 7.04) < 0.2, f"❌ Price mismatch! Expected ~7.04, got {price:.6f}"
+
+def test_adaptive_price_simulates_new_stochastic_rates():
+    """
+    Test that the adaptive mode simulates new stochastic rates paths instead of reusing them beyond nb_draws.
+    """
+    market = Market(100, 0.2, "stochastic rate", 0.02, "Continuous", 0, 0, datetime(2025, 6, 1))
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 10, 1000, 1, target_error=1e-6, max_draws=5000)
+    engine = OptionPricerMC(ModelParams(market, option, pricer))
+    first_df = engine.df
+    engine.compute_price()
+
+    assert engine.nb_paths_used == 5000, f"❌ Unexpected number of paths: {engine.nb_paths_used}"
+    assert engine.df is not first_df, "❌ Stochastic rates paths were reused."
+
+def test_pathwise_greeks_match_black_scholes(market):
+    """
+    Test that the single pass Greeks of a European call match the Black-Scholes Greeks.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 10, 100000, 1, greeks_method="pathwise")
+    greeks = StrategyOptionVanilla(market, option, pricer).greeks()
+
+    expected_greeks = [0.492, 0.019, 0.385, -0.012, 0.422]
+    for greek, expected_greek in zip(greeks, expected_greeks):
+        assert abs(greek - expected_greek) < 0.02, \
+            f"❌ Greek mismatch! Expected ~{expected_greek}, got {greek:.6f}"
+
+def test_crn_greeks_match_black_scholes(market):
+    """
+    Test that the Greeks computed on common random numbers match the Black-Scholes Greeks.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 10, 100000, 1, greeks_method="crn")
+    greeks = StrategyOptionVanilla(market, option, pricer).greeks()
+
+    expected_greeks = [0.492, 0.019, 0.385, -0.012, 0.422]
+    for greek, expected_greek in zip(greeks, expected_greeks):
+        assert abs(greek - expected_greek) < 0.02, \
+            f"❌ Greek mismatch! Expected ~{expected_greek}, got {greek:.6f}"
+
+def test_bumped_prices_do_not_depend_on_block_size(market):
+    """
+    Test that the bumped prices of a path dependent option are the same whatever the number of paths per block.
+    """
+    option = OptionAsian("Call", 100, datetime(2026, 1, 1), "monthly")
+    scenarios = np.array([[100, 0.2, 0.02, 0], [101, 0.2, 0.02, 0], [100, 0.21, 0.02, 0], [100, 0.2, 0.03, 1]])
+    prices = [OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 10000, 1, chunk_size=chunk_size)
+                                  ).compute_bumped_prices(scenarios) for chunk_size in (None, 3000)]
+
+    assert np.allclose(prices[0], prices[1], rtol=1e-12, atol=0), f"❌ Bumped prices mismatch: {prices}"
+
+def test_terminal_sampling_matches_full_paths(market):
+    """
+    Test that sampling the terminal prices directly gives the same price as the simulation of the whole paths.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    pricer = PricerMC(datetime(2025, 1, 1), 250, 200000, 1)
+    engine = OptionPricerMC(ModelParams(market, option, pricer))
+    price = engine.compute_price()
+    full_price = np.mean(option.payoff(engine.simulate_asset_paths(use_incremental_method=True)) * engine.df[:, -2])
+
+    assert engine.supports_terminal_sampling(), "❌ European option should be sampled at maturity only."
+    assert abs(price - full_price) < 3 * engine.std_error * np.sqrt(2), \
+        f"❌ Price mismatch between terminal and full paths: {price:.6f} vs {full_price:.6f}"
+    assert abs(price - 7.04) < 3 * engine.std_error, f"❌ Price mismatch! Expected ~7.04, got {price:.6f}"
+
+def test_observation_grid_matches_daily_grid(market):
+    """
+    Test that simulating an Asian option at its averaging dates only matches a daily simulation read at those dates.
+    """
+    option = OptionAsian("Call", 100, datetime(2026, 1, 1), "monthly")
+    pricer = PricerMC(datetime(2025, 1, 1), 365, 50000, 1, observation_grid=True)
+    engine = OptionPricerMC(ModelParams(market, option, pricer))
+    price = engine.compute_price()
+    observation_times = engine.asian_observation_times()
+
+    daily_engine = OptionPricerMC(ModelParams(market, option, PricerMC(datetime(2025, 1, 1), 365, 50000, 2)))
+    daily_paths = daily_engine.simulate_asset_paths(full_paths=True, use_incremental_method=True)
+    observation_steps = np.rint(observation_times * 365).astype(int)
+    daily_price = np.mean(option.payoff(daily_paths[:, observation_steps]) * daily_engine.df[:, -2])
+
+    assert len(observation_times) == 12, f"❌ Expected 12 monthly averaging dates, got {len(observation_times)}"
+    assert abs(price - daily_price) < 3 * engine.std_error * np.sqrt(2), \
+        f"❌ Price mismatch between observation and daily grids: {price:.6f} vs {daily_price:.6f}"
+
+def test_reused_buffers_give_same_prices_and_do_not_alias_cache(market):
+    """
+    Test that building paths in buffers kept on the pricer gives the same prices, without aliasing cached paths.
+    """
+    option = OptionBarrier("Put", 100, datetime(2026, 1, 1), "in", "down", 80, "American")
+    price = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 10000, 1)).compute_price()
+    pricer = PricerMC(datetime(2025, 1, 1), 50, 10000, 1, path_cache=PathCache(), reuse_buffers=True)
+    engine = OptionPricerMC(ModelParams(market, option, pricer))
+    reused_price = engine.compute_price()
+    cached_paths = next(iter(pricer.path_cache.entries.values()))[0]
+
+    assert reused_price == pytest.approx(price, rel=1e-12), f"❌ Price mismatch: {reused_price} vs {price}"
+    assert not np.shares_memory(cached_paths, pricer.path_buffers["prices"]), "❌ Cached paths alias a buffer."
+
+def test_discrete_dividend_matches_tree():
+    """
+    Test that the Monte Carlo price of a European call with a discrete dividend matches the tree price.
+    """
+    market = Market(100, 0.2, "constant", 0.02, "discrete", 0, 3, datetime(2025, 6, 1))
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    price, std_error = OptionPricerManager(market, option,
+                                           PricerMC(datetime(2025, 1, 1), 100, 100000, 1)).compute_price_with_error()
+    tree_price = OptionPricerManager(market, option, PricerTree(datetime(2025, 1, 1), 300, "yes", 1e-8)).compute_price()
+
+    assert abs(price - tree_price) < 3 * std_error, f"❌ Price mismatch! Expected ~{tree_price:.6f}, got {price:.6f}"
+
+def test_float32_simulation_matches_float64(market):
+    """
+    Test that simulating the paths in float32 gives the float64 price up to single precision.
+    """
+    option = OptionBarrier("Put", 100, datetime(2026, 1, 1), "in", "down", 80, "American")
+    price = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 20000, 1)).compute_price()
+    engine = OptionPricerMC(ModelParams(market, option, PricerMC(datetime(2025, 1, 1), 50, 20000, 1, dtype=np.float32)))
+    float32_price = engine.compute_price()
+
+    assert engine.simulate_asset_paths(full_paths=True, use_incremental_method=True).dtype == np.float32, \
+        "❌ Paths were not simulated in float32."
+    assert float32_price == pytest.approx(price, rel=1e-5), f"❌ Price mismatch: {float32_price} vs {price}"
+
+def test_barrier_correction_matches_continuous_barrier(market):
+    """
+    Test that the Brownian bridge correction prices a continuously monitored barrier with few time steps.
+    """
+    option = OptionBarrier("Put", 100, datetime(2026, 1, 1), "in", "down", 80, "American")
+    pricer = PricerMC(datetime(2025, 1, 1), 25, 100000, 1, barrier_correction=True)
+    price, std_error = OptionPricerManager(market, option, pricer).compute_price_with_error()
+
+    # Closed form price of the continuously monitored down-and-in put
+    assert abs(price - 6.497) < 3 * std_error, f"❌ Price mismatch! Expected ~6.497, got {price:.6f}"
+
+def test_streamed_statistics_match_full_paths(market):
+    """
+    Test that payoffs computed from running path statistics match the payoffs of the full paths, and that streamed
+    simulations give the same prices.
+    """
+    options = [OptionBarrier("Put", 100, datetime(2026, 1, 1), "in", "down", 80, "American"),
+               OptionAsian("Call", 100, datetime(2026, 1, 1), "monthly")]
+    paths = OptionPricerMC(ModelParams(market, options[0], PricerMC(datetime(2025, 1, 1), 50, 10000, 1))
+                           ).simulate_asset_paths(full_paths=True, use_incremental_method=True)
+    statistics = PathStatistics(paths[:, 0], 80)
+    for step in range(1, paths.shape[1]):
+        statistics.update(paths[:, step], step)
+
+    for option in options:
+        assert np.allclose(option.payoff_from_statistics(statistics), option.payoff(paths)), \
+            f"❌ {option.option_name} payoff mismatch between statistics and full paths."
+        price, std_error = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 50000, 1)
+                                               ).compute_price_with_error()
+        streamed_price = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 50000, 1,
+                                                                      streaming=True)).compute_price()
+        assert abs(streamed_price - price) < 3 * std_error * np.sqrt(2), \
+            f"❌ {option.option_name} price mismatch: {streamed_price:.6f} vs {price:.6f}"
+
+def test_autocall_compaction_matches_full_simulation(market):
+    """
+    Test that simulating the surviving autocall paths only gives the autocall probabilities of the full simulation.
+    """
+    option = OptionBarrier("Put", 100, datetime(2030, 1, 1), "in", "down", 70, "American")
+    full = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 50000, 1, observation_grid=True)
+                               ).compute_autocall_probabilities(100, "quarterly", 90)
+    compacted = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 50000, 2,
+                                                             autocall_compaction=True)
+                                    ).compute_autocall_probabilities(100, "quarterly", 90)
+
+    assert sum(compacted["autocall_prob"]) == pytest.approx(1, abs=1e-3), "❌ Autocall probabilities do not sum to 1."
+    assert np.allclose(compacted["autocall_prob"], full["autocall_prob"], atol=0.01), "❌ Autocall probabilities mismatch."
+    assert compacted["duration"] == pytest.approx(full["duration"], abs=0.03), "❌ Expected duration mismatch."
+    assert compacted["coupon_counts"].mean() == pytest.approx(full["coupon_counts"].mean(), abs=0.05), \
+        "❌ Expected number of coupons mismatch."
+
+def test_autocall_probabilities_include_calls_at_maturity(market):
+    """
+    Test that the last autocall probability includes the paths called at maturity, so that the probabilities sum to 1
+    and the expected duration is the mean redemption time of the paths.
+    """
+    option = OptionBarrier("Put", 100, datetime(2030, 1, 1), "in", "down", 70, "American")
+    result = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 20, 50000, 1)
+                                 ).compute_autocall_probabilities(100, "quarterly")
+    redemption_times = result["redemption_times"]
+
+    assert sum(result["autocall_prob"]) == pytest.approx(1, abs=1e-3), "❌ Autocall probabilities do not sum to 1."
+    assert result["autocall_prob"][-1] == pytest.approx(np.mean(redemption_times == redemption_times.max()), abs=1e-3), \
+        "❌ Paths redeemed at maturity mismatch."
+    assert result["duration"] == pytest.approx(np.mean(redemption_times), abs=5e-3), "❌ Expected duration mismatch."
+
+@pytest.mark.parametrize("choice, vander", [("Classic", np.polynomial.polynomial.polyvander),
+                                            ("Laguerre", np.polynomial.laguerre.lagvander),
+                                            ("Hermite", np.polynomial.hermite_e.hermevander),
+                                            ("Legendre", np.polynomial.legendre.legvander),
+                                            ("Tchebychev", np.polynomial.chebyshev.chebvander)])
+def test_regression_basis_any_degree(choice, vander):
+    """
+    Test that the recurrence bases match the polynomials of numpy beyond the degrees written explicitly before.
+    """
+    X = np.linspace(0.5, 1.5, 101)
+    regression = RegressionModel(choice, 8)
+
+    assert np.allclose(regression.basis(X), vander(X, 8)[:, ::-1]), f"❌ {choice} basis mismatch."
+    regression.fit(X, np.exp(X))
+    assert np.allclose(regression.predict(X), np.exp(X), atol=1e-8), f"❌ {choice} regression does not fit."
+
+def test_american_put_lsm_matches_tree():
+    """
+    Test that Monte Carlo prices American options with the Longstaff-Schwartz regression.
+    """
+    market = Market(100, 0.2, "constant", 0.05, "Continuous", 0, 0, datetime(2025, 6, 1))
+    option = OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3)
+    price, std_error = OptionPricerManager(market, option,
+                                           PricerMC(datetime(2025, 1, 1), 50, 100000, 1)).compute_price_with_error()
+    tree_price = OptionPricerManager(market, option, PricerTree(datetime(2025, 1, 1), 400, "yes", 1e-8)).compute_price()
+
+    # Longstaff-Schwartz is biased low by the discrete exercise dates and the regression
+    assert tree_price - 0.1 < price < tree_price + 3 * std_error, \
+        f"❌ Price mismatch! Expected ~{tree_price:.6f}, got {price:.6f}"
+
+def test_exercise_policy_reused_across_pricings():
+    """
+    Test that applying the fitted exercise policy to the same paths reproduces the Longstaff-Schwartz price, and that
+    the Greeks of an American option reuse the policy fitted on the base market.
+    """
+    market = Market(100, 0.2, "constant", 0.05, "Continuous", 0, 0, datetime(2025, 6, 1))
+    option = OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3)
+    engine = OptionPricerMC(ModelParams(market, option, PricerMC(datetime(2025, 1, 1), 50, 50000, 1)))
+    price = engine.compute_price()
+    policy_engine = OptionPricerMC(ModelParams(market, option, PricerMC(datetime(2025, 1, 1), 50, 50000, 1)))
+    policy_engine.exercise_policy = engine.exercise_policy
+
+    assert len(engine.exercise_policy) == 49, "❌ Expected one regression per exercise date."
+    assert policy_engine.compute_price() == pytest.approx(price, rel=1e-12), "❌ Policy price mismatch."
+
+    strategy = StrategyOptionVanilla(market, option, PricerMC(datetime(2025, 1, 1), 20, 20000, 1))
+    strategy.price()
+    policy = strategy.products_params[0].exercise_policy
+    greeks = strategy.greeks()
+    assert strategy.products_params[0].exercise_policy is policy, "❌ Greeks refitted the exercise policy."
+    assert -0.5 < greeks[0] < -0.35, f"❌ Unexpected Delta: {greeks[0]:.6f}"
+    # An error in one of the Greeks must release the frozen policies
+    def failing_rho():
+        raise RuntimeError("Rho failed")
+    strategy.rho = failing_rho
+    with pytest.raises(RuntimeError):
+        strategy.greeks()
+    assert not strategy.products_params[0].freeze_exercise_policy, "❌ Exercise policy left frozen after an error."
+
+def test_backward_lsm_matches_lsm():
+    """
+    Test that regenerating the paths backward with a Brownian bridge gives the Longstaff-Schwartz price, and that it
+    rejects stochastic rates.
+    """
+    market = Market(100, 0.2, "constant", 0.05, "Continuous", 0, 0, datetime(2025, 6, 1))
+    option = OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3)
+    price, std_error = OptionPricerManager(market, option,
+                                           PricerMC(datetime(2025, 1, 1), 50, 50000, 1)).compute_price_with_error()
+    backward_price = OptionPricerManager(market, option, PricerMC(datetime(2025, 1, 1), 50, 50000, 2,
+                                                                  lsm_backward=True)).compute_price()
+
+    assert abs(backward_price - price) < 3 * std_error * np.sqrt(2), \
+        f"❌ Price mismatch: {backward_price:.6f} vs {price:.6f}"
+    stochastic_market = Market(100, 0.2, "stochastic rate", 0.05, "Continuous", 0, 0, datetime(2025, 6, 1))
+    with pytest.raises(ValueError):
+        OptionPricerManager(stochastic_market, option, PricerMC(datetime(2025, 1, 1), 50, 1000, 1,
+                                                                lsm_backward=True)).compute_price()
+
+def test_batched_lsm_matches_individual_prices():
+    """
+    Test that pricing a ladder of American options on one path set gives their individual Longstaff-Schwartz prices.
+    """
+    market = Market(100, 0.2, "constant", 0.05, "Continuous", 0, 0, datetime(2025, 6, 1))
+    options = [OptionAmerican("Put", strike, datetime(2026, 1, 1), "Laguerre", 3) for strike in (90, 100, 110)]
+    options += [OptionAmerican("Call", 100, datetime(2026, 1, 1), "Hermite", 4)]
+    pricer = PricerMC(datetime(2025, 1, 1), 50, 20000, 1)
+    prices = OptionPricerMC(ModelParams(market, options[0], pricer)).price_LS_batch(options)
+    individual_prices = [OptionPricerMC(ModelParams(market, option, pricer)).compute_price() for option in options]
+
+    assert np.allclose(prices, individual_prices, atol=0.01), f"❌ Price mismatch: {prices} vs {individual_prices}"
+    with pytest.raises(ValueError):
+        OptionPricerMC(ModelParams(market, options[0], pricer)).price_LS_batch(
+            [OptionAmerican("Put", 100, datetime(2027, 1, 1), "Laguerre", 3)])
@@ -0,0 +1,144 @@
+from structured_products_pricing.Strategies.StrategiesOption.StrategyOptionVanilla import StrategyOptionVanilla
+from structured_products_pricing.Products.Options.OptionPricerManager import OptionPricerManager
+from structured_products_pricing.Parameters.Option.OptionEuropean import OptionEuropean
+from structured_products_pricing.Parameters.Option.OptionAmerican import OptionAmerican
+from structured_products_pricing.Parameters.Option.OptionBarrier import OptionBarrier
+from structured_products_pricing.Products.Options.OptionPricerTreeArray import OptionPricerTreeArray
+from structured_products_pricing.Parameters.Pricer.PricerTree import PricerTree
+from structured_products_pricing.Parameters.ModelParams import ModelParams
+from structured_products_pricing.Parameters.Pricer.PricerBS import PricerBS
+from structured_products_pricing.Parameters.Market import Market
+from datetime import datetime
+import pytest
+
+def discrete_dividend_market(dividend: float) -> Market:
+    """
+    Creates a market paying a discrete dividend in the middle of the option life.
+    """
+    return Market(100, 0.20, "constant", 0.02, "discrete", 0, dividend, datetime(2025, 6, 1))
+
+@pytest.mark.parametrize("dividend", [0, 3, 60])
+@pytest.mark.parametrize("pruning_mode", ["True", "False"])
+@pytest.mark.parametrize("option", [OptionEuropean("Call", 100, datetime(2026, 1, 1)),
+                                    OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3)])
+def test_array_tree_matches_node_tree(dividend, pruning_mode, option):
+    """
+    Test that the array backend builds the same tree as the Node backend, dividends and pruning included.
+    """
+    price = OptionPricerManager(discrete_dividend_market(dividend), option,
+                                PricerTree(datetime(2025, 1, 1), 100, pruning_mode, 1e-7)).compute_price()
+    price_array = OptionPricerManager(discrete_dividend_market(dividend), option,
+                                      PricerTree(datetime(2025, 1, 1), 100, pruning_mode, 1e-7,
+                                                 backend="array")).compute_price()
+
+    assert price_array == pytest.approx(price, abs=1e-10), "❌ Array tree price mismatch."
+
+@pytest.mark.parametrize("dividend", [0, 3])
+def test_low_memory_tree_matches_full_tree(dividend):
+    """
+    Test that rebuilding the columns during the backward induction gives the same price as the stored tree.
+    """
+    option = OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3)
+    price = OptionPricerManager(discrete_dividend_market(dividend), option,
+                                PricerTree(datetime(2025, 1, 1), 200, "True", 1e-8, backend="array")).compute_price()
+    price_low_memory = OptionPricerManager(discrete_dividend_market(dividend), option,
+                                           PricerTree(datetime(2025, 1, 1), 200, "True", 1e-8,
+                                                      low_memory=True)).compute_price()
+
+    assert price_low_memory == price, "❌ Low memory tree price mismatch."
+
+def test_lattice_greeks_match_black_scholes():
+    """
+    Test that the Greeks computed from a single tree match the Black-Scholes Greeks of a European call.
+    """
+    option = OptionEuropean("Call", 100, datetime(2026, 1, 1))
+    greeks = StrategyOptionVanilla(discrete_dividend_market(0), option,
+                                   PricerTree(datetime(2025, 1, 1), 300, "True", 1e-8,
+                                              greeks_method="lattice")).greeks()
+    bs_greeks = StrategyOptionVanilla(discrete_dividend_market(0), option, PricerBS(datetime(2025, 1, 1))).greeks()
+
+    assert greeks == pytest.approx(bs_greeks, rel=5e-3), f"❌ Greeks mismatch! Expected {bs_greeks}, got {greeks}"
+
+def test_options_priced_on_one_tree_match_individual_prices():
+    """
+    Test that European and American options priced with one backward induction match their individual tree prices.
+    """
+    pricer = PricerTree(datetime(2025, 1, 1), 200, "True", 1e-8, backend="array")
+    options = [OptionEuropean("Call", 90, datetime(2026, 1, 1)),
+               OptionAmerican("Put", 100, datetime(2026, 1, 1), "Laguerre", 3),
+               OptionAmerican("Put", 110, datetime(2026, 1, 1), "Laguerre", 3)]
+    market = discrete_dividend_market(3)
+    prices = OptionPricerManager(market, options[0], pricer).compute_tree_prices(options)
+    individual_prices = [OptionPricerManager(market, option, pricer).compute_price() for option in options]
+
+    assert prices == pytest.approx(individual_prices, abs=1e-12), "❌ Prices on one tree mismatch."
+
+def test_accelerated_tree_converges_with_fewer_steps():
+    """
+    Test that the Black Scholes last step with Richardson extrapolation prices accurately with few steps.
+    """
+    european = OptionEuropean("Call", 105, datetime(2026, 1, 1))
+    american = OptionAmerican("Put", 105, datetime(2026, 1, 1), "Laguerre", 3)
+    bs_price = OptionPricerManager(discrete_dividend_market(0), european, PricerBS(datetime(2025, 1, 1))).compute_price()
+    price = OptionPricerManager(discrete_dividend_market(0), european,
+                                PricerTree(datetime(2025, 1, 1), 100, "True", 1e-9, accelerated=True)).compute_price()
+    american_price = OptionPricerManager(discrete_dividend_market(0), american,
+                                         PricerTree(datetime(2025, 1, 1), 100, "True", 1e-9,
+                                                    accelerated=True)).compute_price()
+    american_reference = OptionPricerManager(discrete_dividend_market(0), american,
+                                             PricerTree(datetime(2025, 1, 1), 1500, "True", 1e-9,
+                                                        backend="array")).compute_price()
+
+    assert abs(price - bs_price) < 1e-4, f"❌ Price mismatch! Expected ~{bs_price:.6f}, got {price:.6f}"
+    assert abs(american_price - american_reference) < 1e-3, \
+        f"❌ Price mismatch! Expected ~{american_reference:.6f}, got {american_price:.6f}"
+
+@pytest.mark.parametrize("nb_steps", [51, 75])
+def test_richardson_weights_for_odd_number_of_steps(nb_steps):
+    """
+    Test that an odd number of steps is extrapolated with the ratio of the numbers of steps of the two smoothed trees.
+    """
+    options = [OptionEuropean("Call", 105, datetime(2026, 1, 1)),
+               OptionAmerican("Put", 105, datetime(2026, 1, 1), "Laguerre", 3)]
+
+    def smoothed_tree(steps: int, richardson: bool) -> OptionPricerTreeArray:
+        pricer = PricerTree(datetime(2025, 1, 1), steps, "True", 1e-9, accelerated=True)
+        tree = OptionPricerTreeArray(ModelParams(discrete_dividend_market(0), options[0], pricer))
+        tree.richardson = richardson
+        return tree
+
+    ratio = nb_steps / (nb_steps // 2)
+    expected_prices = ((ratio * smoothed_tree(nb_steps, False).compute_prices(options)
+                        - smoothed_tree(nb_steps // 2, False).compute_prices(options)) / (ratio - 1))
+    prices = smoothed_tree(nb_steps, True).compute_prices(options)
+
+    assert prices == pytest.approx(expected_prices, abs=1e-12), \
+        f"❌ Richardson extrapolation mismatch! Expected {expected_prices}, got {prices}"
+
+@pytest.mark.parametrize("nb_steps", [100, 200, 400])
+@pytest.mark.parametrize("barrier_exercise, expected_price", [("european", 4.8966124), ("american", 3.1288388)])
+def test_refined_tree_prices_barrier_option(nb_steps, barrier_exercise, expected_price):
+    """
+    Test that the fine lattices grafted around the strike and the barrier price a barrier option accurately with few
+    steps, whatever the position of the barrier between the nodes of the tree.
+    """
+    # Closed forms: call spread 100 / 130 minus a digital call of 30 struck at 130 for the barrier checked at maturity,
+    # minus its reflection on the barrier for the barrier checked continuously
+    option = OptionBarrier("Call", 100, datetime(2026, 1, 1), "out", "up", 130, barrier_exercise)
+    price = OptionPricerManager(discrete_dividend_market(0), option,
+                                PricerTree(datetime(2025, 1, 1), nb_steps, "True", 1e-9,
+                                           mesh_refinement=2)).compute_price()
+
+    assert abs(price - expected_price) < 1e-2, f"❌ Price mismatch! Expected ~{expected_price:.6f}, got {price:.6f}"
+
+def test_refined_tree_knock_in_and_knock_out_sum_to_vanilla():
+    """
+    Test that a knock-in and a knock-out barrier option priced on a refined tree sum to the vanilla option.
+    """
+    pricer = PricerTree(datetime(2025, 1, 1), 100, "True", 1e-9, mesh_refinement=2)
+    options = [OptionBarrier("Call", 100, datetime(2026, 1, 1), "in", "down", 90, "american"),
+               OptionBarrier("Call", 100, datetime(2026, 1, 1), "out", "down", 90, "american"),
+               OptionEuropean("Call", 100, datetime(2026, 1, 1))]
+    prices = OptionPricerManager(discrete_dividend_market(3), options[0], pricer).compute_tree_prices(options)
+
+    assert prices[0] + prices[1] == pytest.approx(prices[2], abs=5e-3), "❌ Barrier parity mismatch."